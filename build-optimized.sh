@@ -80,7 +80,7 @@ fi
 npm install --production=false || error "Failed to install Node.js dependencies"
 
 # Install Python dependencies
-pip install -q mkdocs-minify-plugin mkdocs-optimize-plugin 2>/dev/null || warn "Some Python packages may not have installed correctly"
+pip install -q mkdocs-minify-plugin mkdocs-optimize-plugin brotli 2>/dev/null || warn "Some Python packages may not have installed correctly"
 
 log "✅ Dependencies installed"
 
@@ -174,24 +174,25 @@ log "✅ MkDocs build completed"
 # Step 9: Post-build Optimizations
 log "⚡ Applying post-build optimizations..."
 
-# Compress HTML, CSS, JS further if tools are available
-if command -v html-minifier-terser &> /dev/null; then
-    find "$BUILD_DIR" -name "*.html" -exec html-minifier-terser --collapse-whitespace --remove-comments --minify-js --minify-css {} -o {} \; 2>/dev/null || warn "HTML minification failed"
+PYTHON=$(command -v python3 || command -v python)
+
+# Minify HTML (with inline CSS/JS) in one process pool; unchanged pages reuse the stored results
+"$PYTHON" scripts/minify-site.py --site-dir "$BUILD_DIR" --jobs 0 2>&1 | tee -a "$OPTIMIZATION_LOG"
+if [ "${PIPESTATUS[0]}" -eq 0 ]; then
     log "✅ HTML files further compressed"
+else
+    warn "HTML minification failed"
 fi
 
-# Generate Gzip and Brotli compression
+# Generate Gzip and Brotli compression (unchanged files reuse the stored outputs)
 COMPRESSED_FILES=0
-if command -v gzip &> /dev/null; then
-    find "$BUILD_DIR" -type f \( -name "*.html" -o -name "*.css" -o -name "*.js" \) -exec gzip -k {} \; 2>/dev/null || true
+"$PYTHON" scripts/compress-site.py --site-dir "$BUILD_DIR" --jobs 0 2>&1 | tee -a "$OPTIMIZATION_LOG"
+if [ "${PIPESTATUS[0]}" -eq 0 ]; then
     COMPRESSED_FILES=$(find "$BUILD_DIR" -name "*.gz" | wc -l)
-    log "✅ Created $COMPRESSED_FILES gzip compressed files"
-fi
-
-if command -v brotli &> /dev/null; then
-    find "$BUILD_DIR" -type f \( -name "*.html" -o -name "*.css" -o -name "*.js" \) -exec brotli -k {} \; 2>/dev/null || true
     BROTLI_FILES=$(find "$BUILD_DIR" -name "*.br" | wc -l)
-    log "✅ Created $BROTLI_FILES brotli compressed files"
+    log "✅ Created $COMPRESSED_FILES gzip and $BROTLI_FILES brotli compressed files"
+else
+    warn "Precompression failed, serving uncompressed files"
 fi
 
 # Step 10: Performance Analysis
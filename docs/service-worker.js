@@ -1,27 +1,29 @@
 /**
  * SystemCraft Service Worker - Performance Optimized Caching
  * Implements advanced caching strategies for optimal performance
- * Version: 1.0.0
+ * Version: derived from the content hashes in PRECACHE_MANIFEST
  */
 
-const CACHE_NAME = 'systemcraft-v1.0.0';
-const STATIC_CACHE_NAME = 'systemcraft-static-v1.0.0';
-const DYNAMIC_CACHE_NAME = 'systemcraft-dynamic-v1.0.0';
+// Filled in at build time by scripts/precache_manifest.py: the URL and
+// content hash of every precached file, and a cache version derived from
+// them. Critical URLs are listed here; the build fails if one is missing.
+const PRECACHE_MANIFEST = {"version": "dev", "critical": ["./", "getting-started/", "fundamentals/l6-vs-l7/"], "entries": []};
+
+// Precached files are stored under their revision, so the cache survives
+// deploys and only files whose content changed are downloaded again
+const PRECACHE_NAME = 'systemcraft-precache';
+const STATIC_CACHE_NAME = `systemcraft-static-${PRECACHE_MANIFEST.version}`;
+const DYNAMIC_CACHE_NAME = `systemcraft-dynamic-${PRECACHE_MANIFEST.version}`;
 const OFFLINE_PAGE = '/offline.html';
 
+// Absolute URL -> cache key of its current revision
+const PRECACHE_KEYS = new Map(PRECACHE_MANIFEST.entries.map(({ url, revision }) => {
+  const absolute = new URL(url, self.registration.scope).href;
+  return [absolute, `${absolute}?__revision=${revision}`];
+}));
+
 // Cache strategies by resource type
 const CACHE_STRATEGIES = {
-  // Critical resources - Cache First with background sync
-  critical: [
-    '/',
-    '/index.html',
-    '/getting-started/',
-    '/fundamentals/l6-vs-l7/',
-    '/assets/css/core.min.css',
-    '/assets/js/core.min.js',
-    '/assets/js/runtime.min.js'
-  ],
-  
   // Static assets - Cache First with long TTL
   static: [
     /\.(?:css|js|png|jpg|jpeg|svg|gif|webp|woff|woff2|ttf|eot)$/,
@@ -62,10 +64,10 @@ self.addEventListener('install', event => {
   
   event.waitUntil(
     Promise.all([
-      // Pre-cache critical resources
-      caches.open(STATIC_CACHE_NAME).then(cache => {
-        console.log('Service Worker: Pre-caching critical resources');
-        return cache.addAll(CACHE_STRATEGIES.critical);
+      // Pre-cache critical resources and static assets
+      caches.open(PRECACHE_NAME).then(cache => {
+        console.log('Service Worker: Pre-caching changed resources');
+        return precache(cache);
       }),
       
       // Skip waiting to activate immediately
@@ -84,7 +86,7 @@ self.addEventListener('activate', event => {
       caches.keys().then(cacheNames => {
         return Promise.all(
           cacheNames.map(cacheName => {
-            if (cacheName !== CACHE_NAME && 
+            if (cacheName !== PRECACHE_NAME && 
                 cacheName !== STATIC_CACHE_NAME && 
                 cacheName !== DYNAMIC_CACHE_NAME) {
               console.log('Service Worker: Deleting old cache:', cacheName);
@@ -94,6 +96,9 @@ self.addEventListener('activate', event => {
         );
       }),
       
+      // Drop revisions that are no longer in the manifest
+      caches.open(PRECACHE_NAME).then(pruneOldRevisions),
+      
       // Take control of all clients
       self.clients.claim()
     ])
@@ -115,14 +120,17 @@ self.addEventListener('fetch', event => {
     return;
   }
   
+  // Precached files are served from their current revision
+  const precacheKey = PRECACHE_KEYS.get(`${url.origin}${url.pathname}`);
+  if (precacheKey) {
+    event.respondWith(precachedResponse(request, precacheKey));
+    return;
+  }
+  
   // Determine caching strategy
   const strategy = getCachingStrategy(request);
   
   switch (strategy) {
-    case 'critical':
-      event.respondWith(cacheFirstWithUpdate(request, STATIC_CACHE_NAME));
-      break;
-      
     case 'static':
       event.respondWith(cacheFirstWithFallback(request, STATIC_CACHE_NAME));
       break;
@@ -150,13 +158,6 @@ self.addEventListener('fetch', event => {
 function getCachingStrategy(request) {
   const url = request.url;
   
-  // Check critical resources first
-  if (CACHE_STRATEGIES.critical.some(pattern => 
-    typeof pattern === 'string' ? url.includes(pattern) : pattern.test(url)
-  )) {
-    return 'critical';
-  }
-  
   // Check static assets
   if (CACHE_STRATEGIES.static.some(pattern => pattern.test(url))) {
     return 'static';
@@ -181,45 +182,45 @@ function getCachingStrategy(request) {
 }
 
 /**
- * Cache First with Background Update
- * Best for critical resources that rarely change
+ * Download the manifest entries whose revision is not cached yet
  */
-async function cacheFirstWithUpdate(request, cacheName) {
-  try {
-    const cache = await caches.open(cacheName);
-    const cachedResponse = await cache.match(request);
-    
-    if (cachedResponse) {
-      PERFORMANCE_METRICS.cacheHits++;
-      
-      // Background update
-      event.waitUntil(
-        fetch(request).then(response => {
-          if (response.ok) {
-            cache.put(request, response.clone());
-            PERFORMANCE_METRICS.backgroundSyncs++;
-          }
-        }).catch(() => {
-          // Silently fail for background updates
-        })
-      );
-      
-      return cachedResponse;
+async function precache(cache) {
+  await Promise.all([...PRECACHE_KEYS].map(async ([url, key]) => {
+    if (await cache.match(key)) {
+      return;
     }
-    
-    // If not in cache, fetch and cache
-    const networkResponse = await fetch(request);
-    if (networkResponse.ok) {
-      cache.put(request, networkResponse.clone());
+    const response = await fetch(url, { cache: 'no-cache' });
+    if (!response.ok) {
+      throw new Error(`Pre-caching ${url} failed with status ${response.status}`);
     }
-    
-    PERFORMANCE_METRICS.networkRequests++;
-    return networkResponse;
-    
-  } catch (error) {
-    PERFORMANCE_METRICS.cacheMisses++;
-    return getOfflineFallback(request);
+    await cache.put(key, response);
+  }));
+}
+
+/**
+ * Remove cached revisions that the current manifest no longer lists
+ */
+async function pruneOldRevisions(cache) {
+  const current = new Set(PRECACHE_KEYS.values());
+  const requests = await cache.keys();
+  await Promise.all(requests
+    .filter(request => !current.has(request.url))
+    .map(request => cache.delete(request)));
+}
+
+/**
+ * Precached response, or the network if the revision is not cached
+ */
+async function precachedResponse(request, key) {
+  const cache = await caches.open(PRECACHE_NAME);
+  const cachedResponse = await cache.match(key);
+  
+  if (cachedResponse) {
+    PERFORMANCE_METRICS.cacheHits++;
+    return cachedResponse;
   }
+  
+  return networkFirstWithCache(request, DYNAMIC_CACHE_NAME);
 }
 
 /**
@@ -440,21 +441,12 @@ async function sendQueuedAnalytics() {
 }
 
 async function updateCriticalCaches() {
-  const cache = await caches.open(STATIC_CACHE_NAME);
-  
-  // Update critical resources
-  const updatePromises = CACHE_STRATEGIES.critical.map(async (url) => {
-    try {
-      const response = await fetch(url);
-      if (response.ok) {
-        await cache.put(url, response);
-      }
-    } catch (error) {
-      console.log(`Failed to update cache for ${url}`);
-    }
-  });
-  
-  await Promise.allSettled(updatePromises);
+  // Fetch any precached revision that is missing (e.g. evicted by the browser)
+  try {
+    await precache(await caches.open(PRECACHE_NAME));
+  } catch (error) {
+    console.log('Failed to update precached resources');
+  }
 }
 
 // Handle push notifications (for future features)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SystemCraft validators on synthetic docs trees.
+
+Each corpus size is generated with synthetic_corpus.py and measured in a
+fresh process, so peak RSS is per size. Every validator stage is timed on
+its own: parsing, front-matter rules, content rules, link resolution,
+orphan detection and the navigation check. Results are reported as
+seconds and files/sec per stage, plus peak RSS.
+
+Results can be saved as a JSON baseline. Later runs are compared against
+it and exit non-zero when a stage gets slower, or memory grows, by more
+than the tolerance:
+
+    python scripts/benchmark-validators.py --pages 100 1000 --save-baseline
+    python scripts/benchmark-validators.py --pages 100 1000
+
+--startup-only checks just the cold-start budget (no corpus is generated),
+as CI does:
+
+    python scripts/benchmark-validators.py --startup-only
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = Path('.cache') / 'benchmarks' / 'validators.json'
+
+# Stages shorter than this in the baseline are too noisy to compare
+MIN_COMPARABLE_SECONDS = 0.05
+
+# Cold-start budget for the single-process entry point, in seconds
+DEFAULT_STARTUP_BUDGET = 0.5
+# Modules the validators must only import once a run needs them
+LAZY_MODULES = ('yaml', 'markdown', 'bs4', 'concurrent.futures.process', 'asyncio')
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process so far, in KiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_stages(root: Path) -> Dict:
+    """Time each validator stage over the docs tree under root (worker side)."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    os.chdir(root)
+    from doc_corpus import load_corpus
+    from link_graph import AnchorIndex, LinkGraph, PathIndex
+    from validator_loader import load_validator
+
+    frontmatter = load_validator('validate-frontmatter')
+    links = load_validator('check-links')
+    skipped = {}
+    try:
+        content = load_validator('validate-content')
+    except ImportError as e:
+        skipped['content_rules'] = str(e)
+        content = None
+
+    docs_dir = Path('docs')
+    stages = {}
+    state = {}
+
+    def stage(name: str, files: int, body: Callable[[], None]) -> None:
+        # Validators print diagnostics as they go; keep the worker's stdout for JSON
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            body()
+            seconds = time.perf_counter() - start
+        stages[name] = {
+            'seconds': round(seconds, 4),
+            'files_per_sec': round(files / seconds, 1) if seconds else None,
+            'peak_rss_kb': peak_rss_kb(),
+        }
+
+    def parse():
+        corpus = state['corpus'] = load_corpus(docs_dir)
+        for document in corpus:
+            for view in ('frontmatter', 'links', 'anchors', 'code_blocks'):
+                getattr(document, view)
+
+    def frontmatter_rules():
+        for document in state['corpus']:
+            frontmatter.validate_frontmatter(document.path, document)
+
+    def content_rules():
+        for document in state['corpus']:
+            content.validate_content_file(document.path, document)
+
+    def link_resolution():
+        index = state['index'] = PathIndex(docs_dir)
+        anchors = AnchorIndex(state['corpus'])
+        state['dependencies'] = dependencies = {}
+        for document in state['corpus']:
+            dependencies[document.path] = {}
+            links.validate_internal_links(document.path, document, dependencies[document.path],
+                                          index, anchors)
+
+    def orphans():
+        index = state['index']
+        graph = LinkGraph()
+        for path, dependencies in state['dependencies'].items():
+            key = index.page_key(os.path.abspath(str(path)))
+            if key is not None:
+                graph.add_page(key, links.page_links(dependencies, index))
+        graph.orphans(links.nav_pages(index), links.ORPHAN_CHECK_EXCLUDED)
+
+    def nav():
+        links.check_navigation_consistency(docs_dir)
+
+    files = sum(1 for _ in docs_dir.rglob('*.md'))
+    stage('parse', files, parse)
+    stage('frontmatter_rules', files, frontmatter_rules)
+    if content is not None:
+        stage('content_rules', files, content_rules)
+    stage('link_resolution', files, link_resolution)
+    stage('orphans', files, orphans)
+    stage('nav', files, nav)
+    return {'files': files, 'stages': stages, 'skipped': skipped, 'peak_rss_kb': peak_rss_kb()}
+
+
+def run_startup() -> Dict:
+    """Import the entry point and every validator it runs (worker side)."""
+    start = time.perf_counter()
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from validator_loader import load_validator
+
+    entry_point = load_validator('systemcraft-validate')
+    for name in entry_point.CHECKS.values():
+        load_validator(name)
+    return {
+        'import_seconds': round(time.perf_counter() - start, 4),
+        'eager_imports': [name for name in LAZY_MODULES if name in sys.modules],
+    }
+
+
+def measure_startup(repeat: int) -> Dict:
+    """Wall time of a fresh process loading the validators, keeping the best run."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--run-startup'],
+            check=True, capture_output=True, text=True).stdout
+        run = json.loads(output)
+        run['seconds'] = round(time.perf_counter() - start, 4)
+        if best is None or run['seconds'] < best['seconds']:
+            best = run
+    return best
+
+
+def check_startup(startup: Dict, budget: float) -> List[str]:
+    """Cold-start budget violations, as report lines."""
+    problems = []
+    if startup['seconds'] > budget:
+        problems.append(f"cold start: {startup['seconds']:.3f}s vs {budget:.3f}s budget")
+    for name in startup['eager_imports']:
+        problems.append(f"cold start: {name} is imported before any rule needs it")
+    return problems
+
+
+def measure(pages: int, seed: int, repeat: int, keep: Optional[Path]) -> Dict:
+    """Generate a corpus and measure it in fresh processes, keeping the best run."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from synthetic_corpus import generate_corpus
+
+    with tempfile.TemporaryDirectory(prefix='systemcraft-bench-') as tmp:
+        root = (keep / str(pages) if keep else Path(tmp)).resolve()
+        root.mkdir(parents=True, exist_ok=True)
+        _, total_bytes = generate_corpus(root, pages, seed)
+
+        best = None
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, str(Path(__file__).resolve()), '--run-stages', str(root)],
+                check=True, capture_output=True, text=True).stdout
+            run = json.loads(output)
+            if best is None:
+                best = run
+                continue
+            # Best time per stage filters out scheduler noise; memory is deterministic enough
+            for name, result in run['stages'].items():
+                if result['seconds'] < best['stages'][name]['seconds']:
+                    best['stages'][name] = result
+
+    best['pages'] = pages
+    best['bytes'] = total_bytes
+    return best
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions of results against a baseline, as report lines."""
+    regressions = []
+    for size, run in results['runs'].items():
+        base = baseline.get('runs', {}).get(size)
+        if base is None:
+            continue
+        for name, result in run['stages'].items():
+            base_result = base['stages'].get(name)
+            if base_result is None or base_result['seconds'] < MIN_COMPARABLE_SECONDS:
+                continue
+            if result['seconds'] > base_result['seconds'] * (1 + tolerance):
+                regressions.append(
+                    f"{size} pages / {name}: {result['seconds']:.3f}s vs "
+                    f"{base_result['seconds']:.3f}s baseline")
+        if run['peak_rss_kb'] and base.get('peak_rss_kb'):
+            if run['peak_rss_kb'] > base['peak_rss_kb'] * (1 + tolerance):
+                regressions.append(
+                    f"{size} pages / peak RSS: {run['peak_rss_kb']} KiB vs "
+                    f"{base['peak_rss_kb']} KiB baseline")
+    return regressions
+
+
+def print_startup(startup: Dict) -> None:
+    print(f"🚀 Cold start {startup['seconds']:.3f}s "
+          f"({startup['import_seconds']:.3f}s importing the validators)")
+    print()
+
+
+def enforce_startup(startup: Dict, budget: float) -> None:
+    """Exit non-zero if the cold start broke its budget."""
+    problems = check_startup(startup, budget)
+    if problems:
+        print("❌ Cold start over budget:")
+        for problem in problems:
+            print(f"   • {problem}")
+        sys.exit(1)
+
+
+def print_report(results: Dict) -> None:
+    print_startup(results['startup'])
+    for size, run in results['runs'].items():
+        print(f"📄 {size} pages ({run['bytes'] / 1_000_000:.1f} MB), "
+              f"peak RSS {run['peak_rss_kb']} KiB")
+        for name, result in run['stages'].items():
+            print(f"   {name:<18} {result['seconds']:>9.3f}s {result['files_per_sec']:>12} files/sec")
+        for name, reason in run['skipped'].items():
+            print(f"   {name:<18} skipped ({reason})")
+        print()
+
+
+def main():
+    """Benchmark the validators and compare against a saved baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[100, 1000],
+                        help='Corpus sizes to benchmark (default: 100 1000)')
+    parser.add_argument('--seed', type=int, default=42, help='Corpus random seed (default: 42)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per size; the fastest time per stage is kept (default: 3)')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help=f'Baseline JSON file (default: {DEFAULT_BASELINE})')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Store these results as the new baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown or memory growth before failing (default: 0.25)')
+    parser.add_argument('--output', type=Path, help='Also write the results JSON here')
+    parser.add_argument('--keep-corpus', type=Path, metavar='DIR',
+                        help='Generate corpora under DIR and keep them')
+    parser.add_argument('--startup-budget', type=float, default=DEFAULT_STARTUP_BUDGET,
+                        metavar='SECONDS',
+                        help=f'Fail if a cold start of the validators takes longer '
+                             f'(default: {DEFAULT_STARTUP_BUDGET})')
+    parser.add_argument('--startup-only', action='store_true',
+                        help='Only measure the cold start and check it against its budget')
+    parser.add_argument('--run-stages', type=Path, help=argparse.SUPPRESS)
+    parser.add_argument('--run-startup', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stages:
+        print(json.dumps(run_stages(args.run_stages)))
+        return
+    if args.run_startup:
+        print(json.dumps(run_startup()))
+        return
+    if args.startup_only:
+        startup = measure_startup(args.repeat)
+        print_startup(startup)
+        enforce_startup(startup, args.startup_budget)
+        print(f"✅ Cold start within {args.startup_budget:.3f}s, no eager imports")
+        return
+
+    print("⏱️  Benchmarking validators on synthetic corpora...")
+    print()
+    results = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'startup': measure_startup(args.repeat),
+        'runs': {str(pages): measure(pages, args.seed, args.repeat, args.keep_corpus)
+                 for pages in args.pages},
+    }
+    print_report(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+
+    enforce_startup(results['startup'], args.startup_budget)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f"💾 Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"ℹ️  No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ Performance regressions against {args.baseline}:")
+        for regression in regressions:
+            print(f"   • {regression}")
+        sys.exit(1)
+    print(f"✅ No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+if __name__ == '__main__':
+    main()
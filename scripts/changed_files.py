@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Changed-files mode for the SystemCraft validation scripts.
+
+Instead of re-validating the whole docs/ tree, the validators can be pointed
+at an explicit list of files (as passed by pre-commit) or at a git revision
+or range. Only the changed markdown files are validated, plus - for checks
+with cross-file dependencies - the pages that link to them.
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional, Set
+
+from mkdocs_nav import NAV_CONFIGS
+
+
+class ChangeSet:
+    """Markdown files touched by a commit, range or explicit file list."""
+
+    def __init__(self, modified: List[Path], removed: List[Path], nav_changed: bool):
+        # Added, modified or renamed-to files that exist on disk
+        self.modified = modified
+        # Deleted or renamed-from files that no longer exist
+        self.removed = removed
+        # A nav config was edited or a page moved, so nav entries need re-checking
+        self.nav_changed = nav_changed
+
+    @property
+    def touched(self) -> Set[Path]:
+        return set(self.modified) | set(self.removed)
+
+
+def _is_doc(path: Path, docs_dir: Path) -> bool:
+    return path.suffix == '.md' and docs_dir in path.parents
+
+
+def changes_from_files(files: List[str], docs_dir: Path) -> ChangeSet:
+    """Build a change set from an explicit list of paths."""
+    modified, removed = [], []
+    nav_changed = False
+    for name in files:
+        path = Path(name)
+        if path in NAV_CONFIGS:
+            nav_changed = True
+        elif not _is_doc(path, docs_dir):
+            continue
+        elif path.exists():
+            modified.append(path)
+        else:
+            removed.append(path)
+    return ChangeSet(sorted(set(modified)), sorted(set(removed)),
+                     nav_changed or bool(removed))
+
+
+def changes_from_git(revision: str, docs_dir: Path) -> ChangeSet:
+    """Build a change set from `git diff` against a revision or range.
+
+    A single revision (e.g. HEAD) is compared with the working tree; a range
+    (e.g. origin/main...HEAD) compares the two commits.
+    """
+    try:
+        output = subprocess.run(
+            ['git', 'diff', '--name-status', '-M', '--no-color', revision, '--'],
+            check=True, capture_output=True, text=True).stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, 'stderr', '') or str(e)
+        print(f"ERROR: could not list changes for {revision}: {stderr.strip()}")
+        sys.exit(1)
+
+    modified, removed = set(), set()
+    nav_changed = False
+    for line in output.splitlines():
+        fields = line.split('\t')
+        status, paths = fields[0], [Path(p) for p in fields[1:]]
+        if any(config in paths for config in NAV_CONFIGS):
+            nav_changed = True
+        if status.startswith('R'):
+            old, new = paths
+            if _is_doc(old, docs_dir):
+                removed.add(old)
+                nav_changed = True
+            if _is_doc(new, docs_dir):
+                modified.add(new)
+        elif status.startswith('D'):
+            if _is_doc(paths[0], docs_dir):
+                removed.add(paths[0])
+                nav_changed = True
+        elif _is_doc(paths[-1], docs_dir):
+            modified.add(paths[-1])
+
+    # A file can be recorded as modified in a range but be gone from the tree
+    gone = {path for path in modified if not path.exists()}
+    return ChangeSet(sorted(modified - gone), sorted(removed | gone),
+                     nav_changed or bool(gone))
+
+
+def add_change_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the shared changed-files command-line options."""
+    parser.add_argument('files', nargs='*',
+                        help='Only validate these files (e.g. as passed by pre-commit)')
+    parser.add_argument('--diff', metavar='REV',
+                        help='Only validate files changed since REV or within a range A..B')
+
+
+def changes_from_args(args: argparse.Namespace, docs_dir: Path) -> Optional[ChangeSet]:
+    """Return the requested change set, or None for a full-tree run."""
+    if args.diff:
+        return changes_from_git(args.diff, docs_dir)
+    if args.files:
+        return changes_from_files(args.files, docs_dir)
+    return None
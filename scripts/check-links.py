@@ -6,37 +6,50 @@ This script checks that all internal links point to existing files and follow
 the established linking conventions.
 """
 
-import re
+import argparse
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-from urllib.parse import urlparse, unquote
-
-def extract_markdown_links(content: str) -> List[Tuple[str, str]]:
-    """Extract all markdown links from content."""
-    # Match markdown link syntax: [text](url)
-    link_pattern = r'\[([^\]]*)\]\(([^)]+)\)'
-    links = re.findall(link_pattern, content)
-    
-    # Also match reference-style links: [text][ref]
-    ref_pattern = r'\[([^\]]*)\]\[([^\]]+)\]'
-    ref_links = re.findall(ref_pattern, content)
-    
-    # Extract reference definitions: [ref]: url
-    ref_def_pattern = r'^\[([^\]]+)\]:\s*(.+)$'
-    ref_definitions = {}
-    for line in content.split('\n'):
-        match = re.match(ref_def_pattern, line.strip())
-        if match:
-            ref_definitions[match.group(1)] = match.group(2)
-    
-    # Resolve reference-style links
-    all_links = links.copy()
-    for text, ref in ref_links:
-        if ref in ref_definitions:
-            all_links.append((text, ref_definitions[ref]))
-    
-    return all_links
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import doc_corpus
+import link_graph
+import markdown_tokens
+from doc_corpus import Corpus, Document, load_corpus
+from external_links import add_external_arguments, check_external_links, is_external_url, probe_url
+from changed_files import ChangeSet, add_change_arguments, changes_from_args
+from findings import Finding, add_output_arguments, cached_findings, open_reporter
+from link_graph import AnchorIndex, LinkGraph, PathIndex, link_fragment
+from mkdocs_nav import MKDOCS_CONFIG, load_navs
+from rule_profiler import add_profile_arguments, finish_profile, open_profiler
+from validation_cache import add_cache_arguments, open_cache, ruleset_version
+from watch_mode import DocsWatcher, add_watch_arguments, check_watch_arguments, watch
+from worker_pool import add_jobs_arguments, map_in_order
+
+# Files excluded from the orphan check, both as targets and as link sources
+ORPHAN_CHECK_EXCLUDED = {
+    'README.md',
+    'CONTENT_STANDARDS.md',
+    'ENHANCEMENT_SUMMARY.md',
+    'CONTENT_IMPROVEMENT_PLAN.md'
+}
+
+# Rule ids reported with each finding: id -> (severity, description)
+RULES = {
+    'read-error': ('error', 'The markdown file can be read as UTF-8'),
+    'broken-link': ('error', 'Internal links point to existing files'),
+    'broken-anchor': ('error', 'Link #fragments match a heading on the target page'),
+    'link-convention': ('error', 'Link text is descriptive and URLs follow site conventions'),
+    'link-error': ('error', 'Links can be resolved'),
+    'orphaned-file': ('error', 'Every page is linked from another page or the nav'),
+    'navigation': ('error', 'mkdocs.yml nav entries point to existing files'),
+    'external-link': ('warning', 'External http(s) links respond without an error (--external)'),
+}
+
+# Path and anchor indexes used by validate_document; set directly in the
+# main process and rebuilt by init_worker in each pool worker
+_indexes: Dict[str, object] = {}
 
 def is_internal_link(url: str) -> bool:
     """Check if a URL is an internal link."""
@@ -58,64 +71,83 @@ def is_internal_link(url: str) -> bool:
     # Everything else is considered internal
     return True
 
-def resolve_relative_path(current_file: Path, link_url: str) -> Path:
-    """Resolve relative path from current file to linked file."""
-    # Remove fragment (anchor) from URL
-    url_without_fragment = link_url.split('#')[0]
-    
-    # URL decode the path
-    decoded_url = unquote(url_without_fragment)
-    
-    # Handle different path types
-    if decoded_url.startswith('/'):
-        # Absolute path from docs root
-        return Path('docs') / decoded_url.lstrip('/')
-    else:
-        # Relative path from current file
-        return (current_file.parent / decoded_url).resolve()
+def validate_internal_links(file_path: Path, document: Optional[Document] = None,
+                            dependencies: Optional[Dict[str, bool]] = None,
+                            index: Optional[PathIndex] = None,
+                            anchors: Optional[AnchorIndex] = None) -> List[Finding]:
+    """Validate all internal links in a markdown file.
 
-def validate_internal_links(file_path: Path) -> List[str]:
-    """Validate all internal links in a markdown file."""
+    Link targets are resolved against a PathIndex of the docs tree and
+    #fragments against an AnchorIndex of heading ids; pass both in when
+    validating many files so the tree is only scanned and parsed once.
+
+    If a dependencies dict is given, it is filled with every resolved link
+    target and whether it existed, so cached results can be invalidated when
+    a target is added or removed.
+    """
     errors = []
-    
-    try:
-        content = file_path.read_text(encoding='utf-8')
-    except Exception as e:
-        return [f"Error reading file: {str(e)}"]
-    
-    # Extract all links
-    links = extract_markdown_links(content)
-    
-    for link_text, link_url in links:
-        # Skip external links
-        if not is_internal_link(link_url):
+    if dependencies is None:
+        dependencies = {}
+    if index is None:
+        index = PathIndex(Path('docs'))
+    
+    if document is None:
+        document = Document.from_path(file_path)
+    if document.read_error:
+        return [Finding('read-error', f"Error reading file: {document.read_error}")]
+    if anchors is None:
+        anchors = AnchorIndex()
+        anchors.update(document)
+    page = os.path.abspath(str(file_path))
+    
+    for link_text, link_url, line, _ in document.tokens.links:
+        # Anchor-only links point at a heading on the same page
+        if link_url.startswith('#'):
+            fragment = link_fragment(link_url)
+            if fragment and not anchors.has(page, fragment):
+                errors.append(Finding('broken-anchor', f"Broken anchor: [{link_text}]({link_url}) -> no such heading on this page", line))
             continue
         
-        # Skip anchor-only links (same page)
-        if link_url.startswith('#'):
+        # Skip external links
+        if not is_internal_link(link_url):
             continue
         
         try:
             # Resolve the target path
-            target_path = resolve_relative_path(file_path, link_url)
+            target, target_path = index.resolve(file_path, link_url)
             
             # Check if target exists
-            if not target_path.exists():
-                errors.append(f"Broken link: [{link_text}]({link_url}) -> {target_path}")
+            target_exists = index.exists(target)
+            dependencies[target] = target_exists
+            if not target_exists:
+                errors.append(Finding('broken-link', f"Broken link: [{link_text}]({link_url}) -> {target_path}", line))
                 continue
             
             # Check link conventions
-            link_errors = validate_link_conventions(link_text, link_url, file_path, target_path)
-            errors.extend(link_errors)
+            link_errors = validate_link_conventions(link_text, link_url, file_path, target_path,
+                                                    target_exists=True)
+            errors.extend(Finding('link-convention', error, line) for error in link_errors)
+            
+            # Check the #fragment against the target page's headings
+            fragment = link_fragment(link_url)
+            page_file = index.page_file(target) if fragment else None
+            if page_file:
+                anchor_exists = anchors.has(page_file, fragment)
+                dependencies[f"{page_file}#{fragment}"] = anchor_exists
+                if not anchor_exists:
+                    errors.append(Finding('broken-anchor', f"Broken anchor: [{link_text}]({link_url}) -> no heading '#{fragment}' in {target_path}", line))
             
         except Exception as e:
-            errors.append(f"Error processing link [{link_text}]({link_url}): {str(e)}")
+            errors.append(Finding('link-error', f"Error processing link [{link_text}]({link_url}): {str(e)}", line))
     
     return errors
 
-def validate_link_conventions(link_text: str, link_url: str, source_file: Path, target_path: Path) -> List[str]:
+def validate_link_conventions(link_text: str, link_url: str, source_file: Path, target_path: Path,
+                              target_exists: Optional[bool] = None) -> List[str]:
     """Validate that links follow SystemCraft conventions."""
     errors = []
+    if target_exists is None:
+        target_exists = target_path.exists()
     
     # Check for descriptive link text
     generic_texts = {'here', 'click here', 'link', 'this', 'read more', 'more info'}
@@ -131,14 +163,14 @@ def validate_link_conventions(link_text: str, link_url: str, source_file: Path,
         levels_up = len([part for part in source_file.parent.parts if part != 'docs'])
         if levels_up > 0 and not link_url.startswith('../'):
             # Might need ../ for proper relative path
-            if target_path.exists():
+            if target_exists:
                 # Path works but might not be conventional
                 pass
             else:
                 errors.append(f"Potentially incorrect relative path: [{link_text}]({link_url})")
     
     # Check file extension consistency
-    if target_path.suffix == '.md' and not link_url.endswith('.md'):
+    if target_path.suffix == '.md' and not link_url.split('#')[0].endswith('.md'):
         errors.append(f"Missing .md extension: [{link_text}]({link_url})")
     
     # Check for links to index files
@@ -150,164 +182,468 @@ def validate_link_conventions(link_text: str, link_url: str, source_file: Path,
     
     return errors
 
-def find_orphaned_files(docs_dir: Path) -> List[Path]:
+def init_worker(docs_dir: Path) -> None:
+    """Build a pool worker's own path and anchor indexes."""
+    _indexes['index'] = PathIndex(docs_dir)
+    _indexes['anchors'] = AnchorIndex()
+
+def validate_document(document: Document) -> Tuple[List[Finding], Dict[str, bool]]:
+    """Validate one corpus document (process-pool entry point).
+
+    Returns the errors and the link dependencies recorded for the cache.
+    """
+    dependencies = {}
+    anchors = _indexes.get('anchors')
+    if anchors is not None:
+        # Same-page #fragments are checked against this document, not a re-read
+        anchors.update(document)
+    errors = validate_internal_links(document.path, document, dependencies,
+                                     _indexes.get('index'), anchors)
+    return errors, dependencies
+
+def dependency_checker(index: PathIndex, anchors: AnchorIndex):
+    """Re-check a recorded link dependency: a path's existence or a path#anchor."""
+    def holds(dependency: str) -> bool:
+        target, _, fragment = dependency.partition('#')
+        if fragment:
+            return anchors.has(target, fragment)
+        return index.exists(target)
+    return holds
+
+def link_dependencies(document: Document, index: PathIndex) -> Dict[str, bool]:
+    """Resolved target of every internal link in a document and whether it exists."""
+    dependencies = {}
+    for _, link_url in document.links:
+        if is_internal_link(link_url) and not link_url.startswith('#'):
+            target, _ = index.resolve(document.path, link_url)
+            dependencies[target] = index.exists(target)
+    return dependencies
+
+def page_links(dependencies: Dict[str, bool], index: PathIndex) -> List[str]:
+    """Page keys of the existing markdown targets among a file's dependencies."""
+    keys = (index.page_key(target) for target, existed in dependencies.items() if existed)
+    return [key for key in keys if key is not None]
+
+def nav_pages(index: PathIndex) -> Set[str]:
+    """Page keys of the existing files referenced from any nav config."""
+    return {page for nav in load_navs() for page in nav.pages
+            if index.page_key(os.path.join(index.root, page)) is not None}
+
+def find_orphaned_files(docs_dir: Path, corpus: Optional[Corpus] = None,
+                        index: Optional[PathIndex] = None) -> List[Path]:
     """Find markdown files that are not linked from anywhere."""
-    all_md_files = set(docs_dir.rglob('*.md'))
-    linked_files = set()
-    
-    # Exclude certain files from orphan check
-    excluded_from_orphan_check = {
-        'README.md',
-        'CONTENT_STANDARDS.md',
-        'ENHANCEMENT_SUMMARY.md',
-        'CONTENT_IMPROVEMENT_PLAN.md'
-    }
-    
-    for md_file in all_md_files:
-        if md_file.name in excluded_from_orphan_check:
-            continue
-            
-        try:
-            content = md_file.read_text(encoding='utf-8')
-            links = extract_markdown_links(content)
-            
-            for _, link_url in links:
-                if is_internal_link(link_url) and not link_url.startswith('#'):
-                    try:
-                        target_path = resolve_relative_path(md_file, link_url)
-                        if target_path.exists() and target_path.suffix == '.md':
-                            linked_files.add(target_path)
-                    except:
-                        pass  # Skip problematic links for orphan detection
-        except:
-            pass  # Skip files we can't read
-    
-    # Also check mkdocs.yml for navigation links
-    mkdocs_file = Path('mkdocs.yml')
-    if mkdocs_file.exists():
-        try:
-            mkdocs_content = mkdocs_file.read_text(encoding='utf-8')
-            # Simple extraction of .md files from nav section
-            md_references = re.findall(r'(\w+[\w/-]*\.md)', mkdocs_content)
-            for ref in md_references:
-                nav_file = Path('docs') / ref
-                if nav_file.exists():
-                    linked_files.add(nav_file.resolve())
-        except:
-            pass
-    
-    # Find orphaned files
+    if corpus is None:
+        corpus = load_corpus(docs_dir)
+    if index is None:
+        index = PathIndex(docs_dir)
+    
+    graph = LinkGraph()
+    for document in corpus:
+        key = index.page_key(os.path.abspath(str(document.path)))
+        if key is not None:
+            graph.add_page(key, page_links(link_dependencies(document, index), index))
+    
+    return [docs_dir / page for page in graph.orphans(nav_pages(index), ORPHAN_CHECK_EXCLUDED)]
+
+def load_changed_corpus(docs_dir: Path, changes: ChangeSet, cache,
+                        index: PathIndex) -> Tuple[Corpus, Optional[Corpus]]:
+    """Load the changed files plus every page that links to one of them.
+
+    Referrers come from the link dependencies recorded in the result cache
+    when it covers the whole tree. Otherwise the reverse link index is built
+    from a full read, and that complete corpus is returned as well.
+    """
+    touched = {os.path.abspath(str(path)) for path in changes.touched}
+    all_md_files = [docs_dir / page for page in index.pages()]
+    
+    if cache.covers(all_md_files):
+        referrers = {Path(path) for path in cache.dependents(touched)}
+        paths = set(changes.modified) | {path for path in referrers if path.exists()}
+        return load_corpus(docs_dir, sorted(paths)), None
+    
+    full_corpus = load_corpus(docs_dir)
+    selected = {}
+    for document in full_corpus:
+        if document.path in changes.modified or link_dependencies(document, index).keys() & touched:
+            selected[document.path] = document
+    return Corpus(docs_dir, selected), full_corpus
+
+def find_orphaned_candidates(candidates: Iterable[Path], cache, index: PathIndex) -> List[Path]:
+    """Check only the given files for orphan status using cached link dependencies."""
+    nav_files = nav_pages(index)
     orphaned = []
-    for md_file in all_md_files:
-        if md_file.name in excluded_from_orphan_check:
+    for md_file in sorted(set(candidates)):
+        target = os.path.abspath(str(md_file))
+        key = index.page_key(target)
+        if md_file.name in ORPHAN_CHECK_EXCLUDED or key is None or key in nav_files:
             continue
-        if md_file.resolve() not in linked_files:
+        # Pages deleted since their links were recorded no longer refer to anything
+        referrers = [Path(path) for path in cache.dependents({target}) if Path(path).exists()]
+        if not any(path.name not in ORPHAN_CHECK_EXCLUDED for path in referrers):
             orphaned.append(md_file)
-    
     return orphaned
 
-def check_navigation_consistency(docs_dir: Path) -> List[str]:
-    """Check that navigation in mkdocs.yml is consistent with actual files."""
+def check_navigation_consistency(docs_dir: Path, index: Optional[PathIndex] = None) -> List[str]:
+    """Check that the nav in mkdocs.yml (and mkdocs-optimized.yml) lists existing files."""
+    if index is None:
+        index = PathIndex(docs_dir)
     errors = []
-    mkdocs_file = Path('mkdocs.yml')
-    
-    if not mkdocs_file.exists():
-        return ["mkdocs.yml not found"]
-    
-    try:
-        mkdocs_content = mkdocs_file.read_text(encoding='utf-8')
+    for nav in load_navs():
+        if nav.error:
+            errors.append(nav.error)
+            continue
+        where = '' if nav.config == MKDOCS_CONFIG else f" (in {nav.config})"
+        for ref in nav.missing(lambda page: os.path.join(index.root, page) in index.files):
+            errors.append(f"Navigation references non-existent file: {ref}{where}")
+    return errors
+
+def external_link_occurrences(corpus: Corpus) -> Dict[str, List[Tuple[Path, int]]]:
+    """(page, line) of every http(s) link and image, by the URL it is probed at."""
+    occurrences: Dict[str, List[Tuple[Path, int]]] = {}
+    for document in corpus:
+        for link in document.tokens.links:
+            if is_external_url(link.url):
+                occurrences.setdefault(probe_url(link.url), []).append((document.path, link.line))
+    return occurrences
+
+class LiveLinkCheck:
+    """Link-check results, indexes and link graph kept up to date by --watch."""
+    
+    def __init__(self, docs_dir: Path, index: PathIndex, anchors: AnchorIndex, graph: LinkGraph,
+                 reporter):
+        self.docs_dir = docs_dir
+        self.index = index
+        self.anchors = anchors
+        self.graph = graph
+        self.reporter = reporter
+        self.findings: Dict[Path, List[Finding]] = {}
+        self.dependencies: Dict[Path, Dict[str, bool]] = {}
+        # Link target (path, without #fragment) -> pages linking to it
+        self.referrers: Dict[str, Set[Path]] = {}
+        self.orphans: List[Path] = []
+        self.nav_errors: List[str] = []
+    
+    def record(self, md_file: Path, findings: Optional[List[Finding]],
+               dependencies: Dict[str, bool]) -> None:
+        """Store a page's findings and links, or forget the page if findings is None."""
+        for dependency in self.dependencies.pop(md_file, {}):
+            self.referrers.get(dependency.partition('#')[0], set()).discard(md_file)
+        self.findings.pop(md_file, None)
+        if findings is None:
+            return
+        self.findings[md_file] = findings
+        self.dependencies[md_file] = dependencies
+        for dependency in dependencies:
+            self.referrers.setdefault(dependency.partition('#')[0], set()).add(md_file)
+    
+    def update(self, changes: ChangeSet) -> None:
+        """Re-check the changed pages, the pages linking to them, orphans and nav."""
+        touched = {os.path.abspath(str(path)) for path in changes.touched}
+        affected = set(changes.modified)
+        for target in touched:
+            affected.update(self.referrers.get(target, ()))
         
-        # Extract file references from navigation
-        md_references = re.findall(r'(\w+[\w/-]*\.md)', mkdocs_content)
+        for md_file in changes.removed:
+            target = os.path.abspath(str(md_file))
+            key = self.index.page_key(target)
+            if key is not None:
+                self.graph.remove_page(key)
+            self.index.remove_file(target)
+            self.anchors.discard(target)
+            self.record(md_file, None, {})
+            affected.discard(md_file)
+            self.reporter.progress(f"🗑️  {md_file} removed")
+        for md_file in changes.modified:
+            self.index.add_file(os.path.abspath(str(md_file)))
+            self.anchors.update(Document.from_path(md_file))
         
-        for ref in md_references:
-            nav_file = docs_dir / ref
-            if not nav_file.exists():
-                errors.append(f"Navigation references non-existent file: {ref}")
-    
-    except Exception as e:
-        errors.append(f"Error reading mkdocs.yml: {str(e)}")
+        for md_file in sorted(affected):
+            target = os.path.abspath(str(md_file))
+            document = self.anchors.documents.get(target) or Document.from_path(md_file)
+            dependencies = {}
+            errors = validate_internal_links(md_file, document, dependencies, self.index, self.anchors)
+            self.record(md_file, errors, dependencies)
+            key = self.index.page_key(target)
+            if key is not None:
+                self.graph.remove_links(key)
+                self.graph.add_page(key, page_links(dependencies, self.index))
+            self.reporter.file_checked(md_file, errors)
+        
+        orphans = [self.docs_dir / page
+                   for page in self.graph.orphans(nav_pages(self.index), ORPHAN_CHECK_EXCLUDED)]
+        if orphans != self.orphans:
+            self.orphans = orphans
+            if orphans:
+                self.reporter.failure("⚠️  Orphaned files (not linked from anywhere):")
+                for orphan in orphans:
+                    self.reporter.failure(f"   • {orphan}")
+            else:
+                self.reporter.progress("✅ No orphaned files found")
+        
+        if changes.nav_changed:
+            nav_errors = check_navigation_consistency(self.docs_dir, self.index)
+            if nav_errors != self.nav_errors:
+                self.nav_errors = nav_errors
+                if nav_errors:
+                    self.reporter.failure("❌ Navigation issues:")
+                    for error in nav_errors:
+                        self.reporter.failure(f"   • {error}")
+                else:
+                    self.reporter.progress("✅ Navigation is consistent")
+        
+        failing = sum(1 for findings in self.findings.values() if findings)
+        issues = sum(len(findings) for findings in self.findings.values())
+        print(f"📊 {issues} link issue(s) in {failing} of {len(self.findings)} files, "
+              f"{len(self.orphans)} orphaned file(s), {len(self.nav_errors)} navigation error(s)")
+
+def report_external_links(corpus: Corpus, args: argparse.Namespace,
+                          reporter) -> Tuple[Dict, int, int]:
+    """Probe the corpus' external links; (results by URL, cache hits, broken occurrences)."""
+    reporter.progress()
+    reporter.progress("🌐 Checking external links...")
+    occurrences = external_link_occurrences(corpus)
+    results, hits = check_external_links(occurrences, args)
+    broken = [(url, result) for url, result in results.items() if not result.ok]
+    broken_occurrences = 0
+    if broken:
+        reporter.failure("❌ Broken external links:")
+        for url, result in broken:
+            reporter.failure(f"   • {url} ({result.detail})")
+            for md_file, line in occurrences[url]:
+                reporter.failure(f"     {md_file}:{line}")
+                reporter.emit(md_file, Finding(
+                    'external-link', f"Broken external link: {url} ({result.detail})", line))
+                broken_occurrences += 1
+        reporter.failure()
+    else:
+        reporter.progress(f"✅ All {len(results)} external links respond")
+    return results, hits, broken_occurrences
+
+def check_external_only(docs_dir: Path, args: argparse.Namespace, reporter, profiler) -> int:
+    """--external-only: probe the external links of every page, skipping the internal checks.
+
+    Returns the exit status, which depends on the external links alone.
+    """
+    profiler.stage('load')
+    corpus = load_corpus(docs_dir)
+    profiler.stage('external')
+    results, hits, broken = report_external_links(corpus, args, reporter)
+    finish_profile(profiler, args)
     
-    return errors
+    print()
+    print("=" * 60)
+    print(f"📊 External Link Summary:")
+    print(f"   Files checked: {len(corpus)}")
+    print(f"   External links checked: {len(results)} ({hits} from cache)")
+    print(f"   Broken external links: {broken}")
+    reporter.close()
+    return 1 if broken else 0
+
+def add_arguments(parser: argparse.ArgumentParser, common: bool = True) -> None:
+    """Register this validator's command-line options.
+
+    With common=False only the options the other validators lack are added,
+    for a parser that already has the shared ones.
+    """
+    if common:
+        add_change_arguments(parser)
+        add_cache_arguments(parser)
+        add_jobs_arguments(parser)
+        add_profile_arguments(parser)
+        add_output_arguments(parser)
+        add_watch_arguments(parser)
+    parser.add_argument('--export-graph', type=Path, metavar='FILE',
+                        help='Write the page link graph as DOT (.dot/.gv) or JSON (full runs only)')
+    add_external_arguments(parser)
 
-def main():
-    """Validate all internal links in docs directory."""
+def main(args: Optional[argparse.Namespace] = None):
+    """Validate all internal links in docs directory.
+
+    args is given when the validator runs inside systemcraft-validate.py;
+    otherwise the command line is parsed here.
+    """
+    if args is None:
+        parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+        add_arguments(parser)
+        args = parser.parse_args()
+        check_watch_arguments(parser, args)
+    
+    profiler = open_profiler(args, 'links')
+    profiler.instrument(sys.modules[__name__], [
+        'validate_internal_links', 'validate_link_conventions', 'find_orphaned_files',
+        'find_orphaned_candidates', 'check_navigation_consistency'])
+    profiler.instrument(doc_corpus, ['tokenize'], findings=False)
+    profiler.instrument(PathIndex, ['resolve', 'page_key'], findings=False)
+    profiler.instrument(AnchorIndex, ['has'], findings=False)
+    profiler.instrument_files(sys.modules[__name__], 'validate_document')
+    
     docs_dir = Path('docs')
     if not docs_dir.exists():
         print("ERROR: docs directory not found")
         sys.exit(1)
     
-    print("🔗 Validating internal links in markdown files...")
-    print()
+    reporter = open_reporter(args, 'links', RULES)
+    if args.external_only:
+        sys.exit(check_external_only(docs_dir, args, reporter, profiler))
+    reporter.progress("🔗 Validating internal links in markdown files...")
+    reporter.progress()
     
-    all_errors = []
+    total_issues = 0
     files_checked = 0
     files_with_errors = 0
     
-    # Check individual file links
-    for md_file in docs_dir.rglob('*.md'):
+    watcher = DocsWatcher(docs_dir) if args.watch else None
+    
+    profiler.stage('load')
+    changes = changes_from_args(args, docs_dir)
+    index = PathIndex(docs_dir)
+    anchors = AnchorIndex()
+    ruleset = ruleset_version(Path(__file__), Path(doc_corpus.__file__), Path(markdown_tokens.__file__),
+                              Path(link_graph.__file__))
+    cache = open_cache(args, 'links', ruleset, exists=dependency_checker(index, anchors))
+    if changes is None:
+        corpus = full_corpus = load_corpus(docs_dir)
+    else:
+        corpus, full_corpus = load_changed_corpus(docs_dir, changes, cache, index)
+        # Pages that changed files used to link to may have just lost their last referrer
+        orphan_candidates = set(changes.modified)
+        for path in changes.touched:
+            orphan_candidates.update(
+                Path(os.path.relpath(target))
+                for target, existed in cache.recorded_dependencies(path).items()
+                if existed and target.endswith('.md'))
+        if changes.nav_changed:
+            # Any page may have left the nav (or lost its referrer with a move)
+            orphan_candidates.update(docs_dir / page for page in index.pages())
+        cache.discard(changes.removed)
+    anchors.add_corpus(full_corpus if full_corpus is not None else corpus)
+    
+    # Check individual file links, recording page-to-page edges as we go
+    _indexes.update(index=index, anchors=anchors)
+    cached = {document.path: cached_findings(cache.lookup(document.path, document.content_hash))
+              for document in corpus}
+    pending = [document for document in corpus if cached[document.path] is None]
+    validated = map_in_order(validate_document, pending, args.jobs,
+                             initializer=init_worker, initargs=(docs_dir,))
+    
+    profiler.stage('validate')
+    graph = LinkGraph()
+    live = LiveLinkCheck(docs_dir, index, anchors, graph, reporter) if watcher else None
+    for document in corpus:
+        md_file = document.path
         files_checked += 1
-        errors = validate_internal_links(md_file)
+        errors = cached[md_file]
+        if errors is None:
+            errors, dependencies = next(validated)
+            if not document.read_error:
+                cache.store(md_file, document.content_hash, errors, dependencies)
+        else:
+            dependencies = cache.recorded_dependencies(md_file)
+        key = index.page_key(os.path.abspath(str(md_file)))
+        if key is not None:
+            graph.add_page(key, page_links(dependencies, index))
+        if live:
+            live.record(md_file, errors, dependencies)
         
         if errors:
             files_with_errors += 1
-            print(f"❌ {md_file}")
-            for error in errors:
-                print(f"   • {error}")
-            print()
-            all_errors.extend(errors)
-        else:
-            print(f"✅ {md_file}")
+            total_issues += len(errors)
+        reporter.file_checked(md_file, errors)
+    
+    if changes is None:
+        cache.prune(corpus.documents)
     
     # Check for orphaned files
-    print()
-    print("🔍 Checking for orphaned files...")
-    orphaned_files = find_orphaned_files(docs_dir)
+    profiler.stage('orphans')
+    reporter.progress()
+    reporter.progress("🔍 Checking for orphaned files...")
+    if changes is None:
+        orphaned_files = [docs_dir / page
+                          for page in graph.orphans(nav_pages(index), ORPHAN_CHECK_EXCLUDED)]
+    elif full_corpus is not None:
+        orphaned_files = [orphan for orphan in find_orphaned_files(docs_dir, full_corpus, index)
+                          if orphan in orphan_candidates]
+    else:
+        orphaned_files = find_orphaned_candidates(orphan_candidates, cache, index)
+    cache.close()
     if orphaned_files:
-        print("⚠️  Orphaned files (not linked from anywhere):")
+        reporter.failure("⚠️  Orphaned files (not linked from anywhere):")
         for orphan in orphaned_files:
-            print(f"   • {orphan}")
-            all_errors.append(f"Orphaned file: {orphan}")
-        print()
+            reporter.failure(f"   • {orphan}")
+            reporter.emit(orphan, Finding('orphaned-file', f"Orphaned file: {orphan}"))
+        total_issues += len(orphaned_files)
+        reporter.failure()
     else:
-        print("✅ No orphaned files found")
+        reporter.progress("✅ No orphaned files found")
+    
+    if args.export_graph:
+        if changes is None:
+            graph.export(args.export_graph)
+            reporter.progress(f"🗺️  Link graph written to {args.export_graph}")
+        else:
+            print("⚠️  --export-graph needs a full run; skipped in changed-files mode")
     
     # Check navigation consistency
-    print()
-    print("📑 Checking navigation consistency...")
-    nav_errors = check_navigation_consistency(docs_dir)
+    profiler.stage('navigation')
+    reporter.progress()
+    reporter.progress("📑 Checking navigation consistency...")
+    if changes is None or changes.nav_changed:
+        nav_errors = check_navigation_consistency(docs_dir, index)
+    else:
+        nav_errors = []
     if nav_errors:
-        print("❌ Navigation issues:")
+        reporter.failure("❌ Navigation issues:")
         for error in nav_errors:
-            print(f"   • {error}")
-        all_errors.extend(nav_errors)
-        print()
+            reporter.failure(f"   • {error}")
+            reporter.emit(Path('mkdocs.yml'), Finding('navigation', error))
+        total_issues += len(nav_errors)
+        reporter.failure()
     else:
-        print("✅ Navigation is consistent")
+        reporter.progress("✅ Navigation is consistent")
+    
+    # Check external links (opt-in, since it needs the network)
+    broken_external = 0
+    if args.external:
+        profiler.stage('external')
+        external_results, external_hits, broken_external = report_external_links(
+            corpus, args, reporter)
+        total_issues += broken_external
+    finish_profile(profiler, args)
     
     # Summary
     print()
     print("=" * 60)
     print(f"📊 Link Validation Summary:")
     print(f"   Files checked: {files_checked}")
+    print(f"   Results reused from cache: {cache.hits}")
     print(f"   Files with link errors: {files_with_errors}")
     print(f"   Orphaned files: {len(orphaned_files)}")
     print(f"   Navigation errors: {len(nav_errors)}")
-    print(f"   Total issues: {len(all_errors)}")
-    
-    if all_errors:
-        print()
-        print("🎯 Next Steps:")
-        print("1. Fix broken internal links")
-        print("2. Update link text to be more descriptive")
-        print("3. Consider linking orphaned files from relevant content")
-        print("4. Update navigation in mkdocs.yml if needed")
-        print("5. Run validation again to verify fixes")
+    if args.external:
+        print(f"   External links checked: {len(external_results)} ({external_hits} from cache)")
+        print(f"   Broken external links: {broken_external}")
+    print(f"   Total issues: {total_issues}")
+    reporter.close()
+    
+    if live:
+        live.orphans = orphaned_files
+        live.nav_errors = nav_errors
+        watch(watcher, live.update, args.watch_interval)
+        return
+    
+    if total_issues:
+        reporter.progress()
+        reporter.progress("🎯 Next Steps:")
+        reporter.progress("1. Fix broken internal links")
+        reporter.progress("2. Update link text to be more descriptive")
+        reporter.progress("3. Consider linking orphaned files from relevant content")
+        reporter.progress("4. Update navigation in mkdocs.yml if needed")
+        reporter.progress("5. Run validation again to verify fixes")
         sys.exit(1)
     else:
-        print()
-        print("🎉 All link validation passed!")
-        print("   All internal links are working correctly")
+        reporter.progress()
+        reporter.progress("🎉 All link validation passed!")
+        reporter.progress("   All internal links are working correctly")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
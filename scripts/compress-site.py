@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Precompress the built SystemCraft site with gzip and brotli.
+
+Every HTML, CSS, JavaScript, JSON (including search/search_index.json),
+XML and SVG file under site/ gets a .gz sibling and, when the brotli module
+is installed, a .br sibling, so the web server can send them without
+compressing on each request.
+
+Compressed outputs are kept in a content-addressed store under
+.cache/precompress/, with a manifest recording each file's content hash
+and compressed sizes. A rebuild only compresses files whose content
+changed; all other outputs are copied back from the store. Files are
+compressed across a process pool (--jobs). An encoding is skipped for a
+file when it does not save at least MIN_SAVING of the original size.
+Bytes saved are reported per file type.
+
+    python scripts/compress-site.py --jobs 0
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from worker_pool import add_jobs_arguments, map_in_order
+
+try:
+    import brotli
+except ImportError:  # optional; only .gz files are written without it
+    brotli = None
+
+DEFAULT_SITE_DIR = Path('site')
+DEFAULT_STORE = Path('.cache') / 'precompress'
+MANIFEST_NAME = 'manifest.json'
+# Bump when the compression settings change; older stores are rebuilt
+MANIFEST_VERSION = 1
+
+COMPRESSIBLE_SUFFIXES = {'.html', '.css', '.js', '.json', '.xml', '.svg'}
+# Smaller files fit in a single packet anyway
+MIN_SIZE = 256
+# An encoding must shrink a file by at least this fraction to be kept
+MIN_SAVING = 0.05
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def encodings() -> List[str]:
+    """File extensions of the encodings available in this environment."""
+    return ['gz', 'br'] if brotli is not None else ['gz']
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'gz':
+        # mtime=0 keeps the output identical for identical input
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def compress_file(job: Tuple[str, str, str, List[str]]) -> Dict[str, Optional[int]]:
+    """Compress one file into the store; returns the size kept per encoding.
+
+    A size of None means the encoding did not save enough to be worth
+    serving. Runs in a pool worker.
+    """
+    path, digest, store, wanted = job
+    data = Path(path).read_bytes()
+    sizes: Dict[str, Optional[int]] = {}
+    for encoding in wanted:
+        compressed = compress(data, encoding)
+        if len(compressed) > len(data) * (1 - MIN_SAVING):
+            sizes[encoding] = None
+            continue
+        target = Path(store) / f'{digest}.{encoding}'
+        temporary = target.with_suffix(f'.{encoding}.tmp')
+        temporary.write_bytes(compressed)
+        os.replace(temporary, target)
+        sizes[encoding] = len(compressed)
+    return sizes
+
+
+class CompressionManifest:
+    """Content hash -> compressed size per encoding, persisted with the store."""
+
+    def __init__(self, store: Path):
+        self.store = store
+        self.path = store / MANIFEST_NAME
+        self.entries: Dict[str, Dict[str, Optional[int]]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == MANIFEST_VERSION:
+            self.entries = data.get('objects', {})
+
+    def lookup(self, digest: str, wanted: List[str]) -> Optional[Dict[str, Optional[int]]]:
+        """Stored sizes for a content hash, if every wanted encoding is present."""
+        entry = self.entries.get(digest)
+        if entry is None or any(encoding not in entry for encoding in wanted):
+            return None
+        for encoding, size in entry.items():
+            if size is not None and not (self.store / f'{digest}.{encoding}').exists():
+                return None
+        return entry
+
+    def save(self, live: Dict[str, Dict[str, Optional[int]]]) -> None:
+        """Keep only the entries (and stored files) of this build, then write the manifest."""
+        for name in os.listdir(self.store):
+            digest = name.split('.', 1)[0]
+            if name != MANIFEST_NAME and digest not in live:
+                os.remove(self.store / name)
+        self.entries = live
+        temporary = self.path.with_suffix('.tmp')
+        temporary.write_text(json.dumps({'version': MANIFEST_VERSION, 'objects': live},
+                                        sort_keys=True) + '\n', encoding='utf-8')
+        os.replace(temporary, self.path)
+
+
+def compressible_files(site_dir: Path) -> List[Path]:
+    return sorted(path for path in site_dir.rglob('*')
+                  if path.suffix in COMPRESSIBLE_SUFFIXES and path.is_file())
+
+
+def install(path: Path, digest: str, sizes: Dict[str, Optional[int]], store: Path) -> None:
+    """Put a file's compressed siblings next to it, removing any that are not worth serving."""
+    for encoding, size in sizes.items():
+        sibling = path.with_name(f'{path.name}.{encoding}')
+        if size is None:
+            if sibling.exists():
+                sibling.unlink()
+        else:
+            shutil.copyfile(store / f'{digest}.{encoding}', sibling)
+
+
+def print_report(totals: Dict[str, Dict[str, int]], wanted: List[str]) -> None:
+    """Bytes saved by each encoding, per file type."""
+    print(f"   {'type':<6} {'files':>6} {'original':>12}"
+          + ''.join(f" {encoding + ' saved':>14}" for encoding in wanted))
+    for suffix in sorted(totals):
+        row = totals[suffix]
+        print(f"   {suffix:<6} {row['files']:>6} {row['original']:>12,}"
+              + ''.join(f" {row['original'] - row[encoding]:>14,}" for encoding in wanted))
+
+
+def main():
+    """Compress the built site, reusing unchanged outputs from the store."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--site-dir', type=Path, default=DEFAULT_SITE_DIR,
+                        help=f'Built site to compress (default: {DEFAULT_SITE_DIR})')
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE,
+                        help=f'Compressed output store and manifest (default: {DEFAULT_STORE})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Recompress every file instead of reusing stored outputs')
+    add_jobs_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.site_dir.is_dir():
+        print(f"ERROR: {args.site_dir} not found; build the site first")
+        sys.exit(1)
+
+    wanted = encodings()
+    print(f"🗜️  Precompressing {args.site_dir}/ ({', '.join(wanted)})...")
+    if brotli is None:
+        print("ℹ️  brotli module not installed (pip install brotli); writing .gz files only")
+
+    args.store.mkdir(parents=True, exist_ok=True)
+    manifest = CompressionManifest(args.store)
+    live: Dict[str, Dict[str, Optional[int]]] = {}
+    files: List[Tuple[Path, str, int]] = []
+    pending: List[Tuple[str, str, str, List[str]]] = []
+    skipped = 0
+    for path in compressible_files(args.site_dir):
+        data = path.read_bytes()
+        if len(data) < MIN_SIZE:
+            skipped += 1
+            continue
+        digest = file_digest(data)
+        files.append((path, digest, len(data)))
+        if digest in live:
+            continue
+        cached = None if args.no_cache else manifest.lookup(digest, wanted)
+        if cached is not None:
+            live[digest] = {encoding: cached[encoding] for encoding in wanted}
+        else:
+            pending.append((str(path), digest, str(args.store), wanted))
+            live[digest] = {}
+
+    for job, sizes in zip(pending, map_in_order(compress_file, pending, args.jobs)):
+        live[job[1]] = sizes
+
+    totals: Dict[str, Dict[str, int]] = {}
+    for path, digest, size in files:
+        sizes = live[digest]
+        install(path, digest, sizes, args.store)
+        row = totals.setdefault(path.suffix, {'files': 0, 'original': 0,
+                                              **{encoding: 0 for encoding in wanted}})
+        row['files'] += 1
+        row['original'] += size
+        for encoding in wanted:
+            row[encoding] += size if sizes[encoding] is None else sizes[encoding]
+    manifest.save(live)
+
+    print(f"   Files compressed: {len(pending)}")
+    print(f"   Reused from {args.store}: {len(files) - len(pending)}")
+    print(f"   Skipped (under {MIN_SIZE} bytes): {skipped}")
+    print_report(totals, wanted)
+    print("✅ Precompression complete")
+
+if __name__ == '__main__':
+    main()
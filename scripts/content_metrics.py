@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Content metrics for the SystemCraft docs, computed alongside validation.
+
+validate-content.py --metrics measures every page in the corpus it has
+already loaded. It then writes two reports to the repository root:
+
+- content_metrics_report.json: totals, per-section details, reading times,
+  code examples by language, practice problems and templates
+- comprehensive_content_analysis.json: section metrics, preparation paths,
+  completeness against the content targets and coverage comparisons
+
+Per-file metrics are cached by content hash in the result cache. Each
+section's totals are cached under a signature of its files' hashes. A run
+therefore re-measures only changed files and re-aggregates only the
+sections they belong to. In changed-files mode the other pages are not read
+at all. When the totals change, the run appends one line to
+content_metrics_history.jsonl, a time series of corpus growth.
+
+The content-metrics job in .github/workflows/content-validation.yml runs
+--metrics on every push to main. It uploads the reports and the history as
+an artifact and commits them back when they changed.
+
+Metric definitions:
+
+- words: whitespace-separated words of the body's prose (outside code)
+- reading time: words at 200 words per minute
+- code examples: fenced code blocks, by language tag (text if untagged)
+- practice problems: headings naming a problem, question, exercise or scenario
+- templates: pages with 'template' in the file name
+- study plans and assessment tools: pages whose file name has a 'plan', or
+  an 'assessment' or 'quiz', word
+- external links: distinct http(s) link targets
+"""
+
+import argparse
+import json
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import doc_corpus
+import markdown_tokens
+from doc_corpus import Document, content_hash
+from validation_cache import open_cache, ruleset_version
+
+METRICS_REPORT = Path('content_metrics_report.json')
+ANALYSIS_REPORT = Path('comprehensive_content_analysis.json')
+HISTORY_FILE = Path('content_metrics_history.jsonl')
+
+WORDS_PER_MINUTE = 200
+
+# Hours of practice and review expected per hour of reading
+PRACTICE_FACTOR = 2.5
+
+PRACTICE_HEADING_PATTERN = re.compile(r'\b(problem|question|exercise|scenario)s?\b', re.IGNORECASE)
+EXTERNAL_LINK_PATTERN = re.compile(r'^https?://', re.IGNORECASE)
+
+# Sections (as named in comprehensive_content_analysis.json) covered by each
+# preparation path
+PREPARATION_PATHS = {
+    'quick_start': (['fundamentals', 'practice'],
+                    'Essential basics for immediate interview prep'),
+    'l6_preparation': (['fundamentals', 'behavioral', 'coding', 'system_design', 'practice'],
+                       'Complete L6 (Senior SDE) preparation'),
+    'l7_preparation': (['fundamentals', 'behavioral', 'coding', 'system_design', 'deep_dives',
+                        'portfolio', 'practice'],
+                       'Complete L7 (Principal SDE) preparation'),
+    'comprehensive': (['fundamentals', 'behavioral', 'coding', 'system_design', 'deep_dives',
+                       'portfolio', 'practice', 'compensation', 'experiences'],
+                      'Complete mastery of all content'),
+}
+
+# Section -> (words, reading minutes, practice problems) a complete section reaches
+COMPLETENESS_TARGETS = {
+    'behavioral': (10000, 240, None),
+    'coding': (10000, 480, 150),
+    'system_design': (10000, 360, 60),
+    'fundamentals': (10000, 180, None),
+}
+
+# Reading hours a full preparation for each level is expected to take
+COVERAGE_HOURS = {'l6': 40, 'l7': 60}
+
+# Minimum practice problems per interview area
+PROBLEM_MINIMUMS = {'coding': 200, 'system_design': 15, 'behavioral': 30}
+
+
+def measure(document: Document) -> Dict[str, Any]:
+    """Metrics of one page (JSON-serialisable, for the result cache)."""
+    languages = Counter((language or 'text').lower() for language, _ in document.code_blocks)
+    name_words = set(document.path.stem.lower().split('-'))
+    return {
+        'words': len(document.tokens.prose_text.split()),
+        'code_examples': sum(languages.values()),
+        'languages': dict(languages),
+        'practice_problems': sum(1 for _, text, _ in document.headings
+                                 if PRACTICE_HEADING_PATTERN.search(text)),
+        'template': 'template' in document.path.name,
+        'study_plan': bool(name_words & {'plan', 'plans'}),
+        'assessment': bool(name_words & {'assessment', 'quiz'}),
+        'external_links': sorted({url for _, url in document.links
+                                  if EXTERNAL_LINK_PATTERN.match(url)}),
+    }
+
+
+def section_of(path: Path, docs_dir: Path) -> str:
+    """Top-level docs directory of a page, or 'root' for pages directly in docs/."""
+    parts = path.relative_to(docs_dir).parts
+    return parts[0] if len(parts) > 1 else 'root'
+
+
+def analysis_name(section: str) -> str:
+    """Section name as used in comprehensive_content_analysis.json."""
+    return 'other' if section == 'root' else section.replace('-', '_')
+
+
+def aggregate(files: Dict[Path, Dict[str, Any]], docs_dir: Path) -> Dict[str, Any]:
+    """Totals of one section from its pages' metrics."""
+    languages = Counter()
+    links = set()
+    for metrics in files.values():
+        languages.update(metrics['languages'])
+        links.update(metrics['external_links'])
+    return {
+        'files': len(files),
+        'words': sum(metrics['words'] for metrics in files.values()),
+        'code_examples': sum(metrics['code_examples'] for metrics in files.values()),
+        'practice_problems': sum(metrics['practice_problems'] for metrics in files.values()),
+        'templates': sorted(path.relative_to(docs_dir).as_posix()
+                            for path, metrics in files.items() if metrics['template']),
+        'study_plans': sum(1 for metrics in files.values() if metrics['study_plan']),
+        'assessment_tools': sum(1 for metrics in files.values() if metrics['assessment']),
+        'languages': dict(sorted(languages.items())),
+        'external_links': sorted(links),
+    }
+
+
+def reading_minutes(words: int) -> int:
+    return round(words / WORDS_PER_MINUTE)
+
+
+def percentage(value: float, target: float) -> float:
+    """value as a percentage of target, capped at 100."""
+    return round(min(100.0, value / target * 100), 1)
+
+
+def metrics_report(sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """content_metrics_report.json from the section totals."""
+    total_words = sum(section['words'] for section in sections.values())
+    total_files = sum(section['files'] for section in sections.values())
+    total_minutes = reading_minutes(total_words)
+    languages = Counter()
+    for section in sections.values():
+        languages.update(section['languages'])
+    templates = sorted(path for section in sections.values() for path in section['templates'])
+    links = {url for section in sections.values() for url in section['external_links']}
+    problems = {name: sections[name]['practice_problems'] if name in sections else 0
+                for name in ('behavioral', 'coding', 'system-design')}
+
+    def minutes_for(names: List[str]) -> int:
+        return sum(reading_minutes(section['words']) for name, section in sections.items()
+                   if analysis_name(name) in names)
+
+    paths = {name: minutes_for(names) for name, (names, _) in PREPARATION_PATHS.items()
+             if name != 'comprehensive'}
+    paths['complete_study'] = total_minutes
+
+    return {
+        'summary': {
+            'total_files': total_files,
+            'total_words': total_words,
+            'total_reading_time_minutes': total_minutes,
+            'total_reading_time_hours': round(total_minutes / 60, 1),
+            'average_words_per_file': round(total_words / total_files) if total_files else 0,
+            'total_code_examples': sum(languages.values()),
+            'total_templates': len(templates),
+            'total_practice_problems': sum(section['practice_problems'] for section in sections.values()),
+            'unique_external_resources': len(links),
+        },
+        'content_distribution': {
+            name: {'percentage': round(section['words'] / total_words * 100, 1) if total_words else 0.0,
+                   'words': section['words']}
+            for name, section in sections.items()
+        },
+        'section_details': {
+            name: {
+                'files': section['files'],
+                'words': section['words'],
+                'code_examples': section['code_examples'],
+                'external_links': len(section['external_links']),
+                'templates': len(section['templates']),
+                'practice_problems': section['practice_problems'],
+            }
+            for name, section in sections.items()
+        },
+        'reading_times': {
+            'by_section': {name: reading_minutes(section['words']) for name, section in sections.items()},
+            'total': total_minutes,
+        },
+        'code_examples': {
+            'total': sum(languages.values()),
+            'by_language': dict(languages.most_common()),
+            'by_section': {name: section['code_examples'] for name, section in sections.items()},
+        },
+        'practice_problems': {
+            'behavioral': problems['behavioral'],
+            'coding': problems['coding'],
+            'system_design': problems['system-design'],
+            'total': sum(section['practice_problems'] for section in sections.values()),
+        },
+        'templates': templates,
+        'preparation_paths': {
+            name: {'minutes': minutes, 'hours': round(minutes / 60, 1)}
+            for name, minutes in paths.items()
+        },
+    }
+
+
+def comprehensive_analysis(sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """comprehensive_content_analysis.json from the section totals."""
+    named = {analysis_name(name): section for name, section in sections.items()}
+    links = {url for section in named.values() for url in section['external_links']}
+    total_words = sum(section['words'] for section in named.values())
+    total_problems = sum(section['practice_problems'] for section in named.values())
+    total_templates = sum(len(section['templates']) for section in named.values())
+    total_code = sum(section['code_examples'] for section in named.values())
+
+    paths = {}
+    for name, (included, description) in PREPARATION_PATHS.items():
+        minutes = sum(reading_minutes(named[section]['words']) for section in included if section in named)
+        paths[name] = {
+            'reading_hours': round(minutes / 60, 1),
+            'estimated_total_hours': round(minutes / 60 * PRACTICE_FACTOR, 1),
+            'practice_problems': sum(named[section]['practice_problems']
+                                     for section in included if section in named),
+            'sections_included': included,
+            'description': description,
+        }
+
+    completeness = {}
+    for name, (words, minutes, problems) in COMPLETENESS_TARGETS.items():
+        section = named.get(name, {'words': 0, 'practice_problems': 0})
+        entry = {
+            'word_completeness': percentage(section['words'], words),
+            'reading_time_completeness': percentage(reading_minutes(section['words']), minutes),
+            'practice_problems': section['practice_problems'],
+        }
+        scores = [entry['word_completeness'], entry['reading_time_completeness']]
+        if problems is not None:
+            entry['problem_completeness'] = percentage(section['practice_problems'], problems)
+            scores.append(entry['problem_completeness'])
+        lowest = min(scores)
+        entry['assessment'] = ('comprehensive' if lowest >= 100
+                               else 'adequate' if lowest >= 75 else 'needs_expansion')
+        completeness[name] = entry
+
+    def problems_vs_minimum(area: str) -> float:
+        problems = named.get(area, {}).get('practice_problems', 0)
+        return round(problems / PROBLEM_MINIMUMS[area] * 100, 1)
+
+    return {
+        'total_metrics': {
+            'files': sum(section['files'] for section in named.values()),
+            'words': total_words,
+            'reading_hours': round(total_words / WORDS_PER_MINUTE / 60, 1),
+            'code_examples': total_code,
+            'practice_problems': total_problems,
+            'templates': total_templates,
+            'external_links': len(links),
+        },
+        'section_metrics': {
+            name: {
+                'files': section['files'],
+                'words': section['words'],
+                'reading_minutes': reading_minutes(section['words']),
+                'code_examples': section['code_examples'],
+                'practice_problems': section['practice_problems'],
+                'templates': len(section['templates']),
+                'external_links': len(section['external_links']),
+            }
+            for name, section in named.items()
+        },
+        'preparation_paths': paths,
+        'content_completeness': completeness,
+        'resource_availability': {
+            'templates': total_templates,
+            'code_examples': total_code,
+            'practice_problems': total_problems,
+            'external_references': len(links),
+            'interactive_tools': named.get('interactive', {}).get('files', 0),
+            'study_plans': sum(section['study_plans'] for section in named.values()),
+            'assessment_tools': sum(section['assessment_tools'] for section in named.values()),
+        },
+        'comparison_to_standards': {
+            'content_coverage': {
+                f'{level}_coverage_percentage': percentage(paths[f'{level}_preparation']['reading_hours'], hours)
+                for level, hours in COVERAGE_HOURS.items()
+            },
+            'problem_coverage': {
+                'coding_problems_vs_minimum': problems_vs_minimum('coding'),
+                'system_design_problems_vs_minimum': problems_vs_minimum('system_design'),
+                'behavioral_scenarios_vs_minimum': problems_vs_minimum('behavioral'),
+            },
+        },
+    }
+
+
+def history_record(report: Dict[str, Any]) -> Dict[str, Any]:
+    """The totals appended to the time series for one run."""
+    summary = report['summary']
+    return {
+        'files': summary['total_files'],
+        'words': summary['total_words'],
+        'reading_minutes': summary['total_reading_time_minutes'],
+        'code_examples': summary['total_code_examples'],
+        'practice_problems': summary['total_practice_problems'],
+        'templates': summary['total_templates'],
+        'external_links': summary['unique_external_resources'],
+        'sections': {name: details['words'] for name, details in report['section_details'].items()},
+    }
+
+
+def append_history(history: Path, record: Dict[str, Any]) -> bool:
+    """Append record with a timestamp unless the totals match the last entry."""
+    last = None
+    if history.exists():
+        lines = history.read_text(encoding='utf-8').splitlines()
+        if lines:
+            last = json.loads(lines[-1])
+            last.pop('date', None)
+    if last == record:
+        return False
+    entry = {'date': datetime.now(timezone.utc).isoformat(timespec='seconds'), **record}
+    with history.open('a', encoding='utf-8') as f:
+        f.write(json.dumps(entry) + '\n')
+    return True
+
+
+def write_json(path: Path, data: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+
+
+class ContentMetrics:
+    """Collects per-page metrics during a validation run and writes the reports."""
+
+    def __init__(self, docs_dir: Path, files_cache, sections_cache,
+                 output_dir: Path = Path('.')):
+        self.docs_dir = docs_dir
+        self.files_cache = files_cache
+        self.sections_cache = sections_cache
+        self.output_dir = output_dir
+        self.files: Dict[Path, Tuple[str, Dict[str, Any]]] = {}
+        self.measured: List[Path] = []
+
+    def add(self, document: Document) -> None:
+        """Measure a page loaded for validation, unless its metrics are cached."""
+        metrics = self.files_cache.lookup(document.path, document.content_hash)
+        if metrics is None:
+            metrics = measure(document)
+            self.measured.append(document.path)
+        self.files[document.path] = (document.content_hash, metrics)
+
+    def finish(self, full_run: bool) -> None:
+        """Fill in pages not loaded this run, re-aggregate changed sections, write reports.
+
+        Call after the validator has closed its own result cache, since both
+        caches write to the same database.
+        """
+        live = sorted(self.docs_dir.rglob('*.md'))
+        for md_file in live:
+            if md_file in self.files:
+                continue
+            entry = self.files_cache.latest(md_file)
+            if entry is None:
+                self.add(Document.from_path(md_file))
+            else:
+                self.files[md_file] = entry
+        for md_file in self.measured:
+            digest, metrics = self.files[md_file]
+            self.files_cache.store(md_file, digest, metrics)
+        if full_run:
+            self.files_cache.prune(live)
+        self.files_cache.close()
+
+        grouped: Dict[str, Dict[Path, Tuple[str, Dict[str, Any]]]] = {}
+        for md_file in live:
+            grouped.setdefault(section_of(md_file, self.docs_dir), {})[md_file] = self.files[md_file]
+        sections = {}
+        aggregated = 0
+        for name, files in sorted(grouped.items()):
+            signature = content_hash(json.dumps(
+                sorted((str(path), digest) for path, (digest, _) in files.items())).encode('utf-8'))
+            totals = self.sections_cache.lookup(Path(name), signature)
+            if totals is None:
+                totals = aggregate({path: metrics for path, (_, metrics) in files.items()},
+                                   self.docs_dir)
+                self.sections_cache.store(Path(name), signature, totals)
+                aggregated += 1
+            sections[name] = totals
+        if full_run:
+            self.sections_cache.prune(Path(name) for name in sections)
+        self.sections_cache.close()
+
+        report = metrics_report(sections)
+        write_json(self.output_dir / METRICS_REPORT, report)
+        write_json(self.output_dir / ANALYSIS_REPORT, comprehensive_analysis(sections))
+        appended = append_history(self.output_dir / HISTORY_FILE, history_record(report))
+
+        print()
+        print(f"📈 Content metrics: {len(self.measured)} of {len(live)} files measured, "
+              f"{aggregated} of {len(sections)} sections re-aggregated")
+        print(f"💾 Wrote {METRICS_REPORT} and {ANALYSIS_REPORT}"
+              + (f", appended to {HISTORY_FILE}" if appended else ""))
+
+
+class NullMetrics:
+    """Drop-in replacement used when metrics are not requested."""
+
+    def add(self, document: Document) -> None:
+        pass
+
+    def finish(self, full_run: bool) -> None:
+        pass
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the content metrics command-line options."""
+    parser.add_argument('--metrics', action='store_true',
+                        help=f'Also write {METRICS_REPORT} and {ANALYSIS_REPORT}, '
+                             f'and append the totals to {HISTORY_FILE}')
+
+
+def open_metrics(args: argparse.Namespace, docs_dir: Path):
+    """Start the metrics collector selected on the command line."""
+    if not args.metrics:
+        return NullMetrics()
+    version = ruleset_version(Path(__file__), Path(doc_corpus.__file__), Path(markdown_tokens.__file__))
+    return ContentMetrics(docs_dir, open_cache(args, 'metrics', version),
+                          open_cache(args, 'metrics-sections', version))
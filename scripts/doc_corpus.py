@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Shared document corpus for the SystemCraft validation scripts.
+
+Every markdown file under docs/ is read exactly once and parsed at most
+once into its front-matter and body; the body is tokenized (by
+markdown_tokens) into headings, links, code blocks and prose. The front-matter,
+link and content validators all consume this model instead of walking
+and re-reading the tree on their own.
+
+Callers that only need metadata can read just the YAML header instead:
+FrontMatter streams a file up to the closing delimiter and leaves the body
+unread, and read_frontmatter() memoizes it by path, mtime and size.
+Whole documents are memoized the same way by read_document(), so several
+validators run in one process (systemcraft-validate.py) share a single
+read and parse of each page.
+
+PyYAML is imported on the first front-matter parse, so a run answered
+entirely from the result cache never loads it.
+
+Headings are turned into the anchor ids MkDocs generates for them, using
+the same slug rules as the toc extension in mkdocs.yml
+(pymdownx.slugs.slugify with case=lower), so fragment links can be
+checked without building the site.
+"""
+
+import hashlib
+import html
+import os
+import re
+import unicodedata
+from functools import cached_property
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from markdown_tokens import MarkdownTokens, tokenize
+
+FRONTMATTER_DELIMITER = '---\n'
+
+# Slug rules mirroring pymdownx.slugs.slugify(case='lower') as configured
+# for the toc extension in mkdocs.yml
+SLUG_TAG_PATTERN = re.compile(r'</?[^>]*>')
+SLUG_INVALID_CHAR_PATTERN = re.compile(r'[^\w\- ]')
+SLUG_COUNT_PATTERN = re.compile(r'^(.*)_([0-9]+)$')
+# Inline markdown that renders to something other than its source text
+INLINE_IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+INLINE_LINK_PATTERN = re.compile(r'\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])')
+EMOJI_SHORTCODE_PATTERN = re.compile(r':[a-z0-9_+-]+:')
+UNDERSCORE_EMPHASIS_PATTERN = re.compile(r'(?<!\w)_+|_+(?!\w)')
+
+
+def extract_markdown_links(content: str) -> List[Tuple[str, str]]:
+    """Extract all markdown links (and images) from content, outside code."""
+    return [(link.text, link.url) for link in tokenize(content).links]
+
+
+def slugify(text: str, sep: str = '-') -> str:
+    """Slugify heading text the way the toc extension does.
+
+    Whitespace is stripped before invalid characters are removed, so a
+    heading starting with an emoji gets a leading separator, as in MkDocs.
+    """
+    slug = unicodedata.normalize('NFC', html.unescape(text))
+    slug = SLUG_TAG_PATTERN.sub('', slug).strip().lower()
+    return SLUG_INVALID_CHAR_PATTERN.sub('', slug).replace(' ', sep)
+
+
+def heading_plain_text(text: str) -> str:
+    """Approximate the rendered text of inline heading markdown."""
+    text = INLINE_IMAGE_PATTERN.sub('', text)
+    text = INLINE_LINK_PATTERN.sub(r'\1', text)
+    text = EMOJI_SHORTCODE_PATTERN.sub('', text)
+    return UNDERSCORE_EMPHASIS_PATTERN.sub('', text)
+
+
+def unique_slug(slug: str, used: Set[str]) -> str:
+    """De-duplicate an id the way the toc extension does (foo, foo_1, foo_2...)."""
+    while slug in used or not slug:
+        match = SLUG_COUNT_PATTERN.match(slug)
+        if match:
+            slug = f'{match.group(1)}_{int(match.group(2)) + 1}'
+        else:
+            slug = f'{slug}_1'
+    used.add(slug)
+    return slug
+
+
+def split_frontmatter(text: str) -> Tuple[Optional[str], str]:
+    """Split raw file text into (front-matter source, body)."""
+    if not text.startswith(FRONTMATTER_DELIMITER):
+        return None, text
+
+    parts = text.split(FRONTMATTER_DELIMITER, 2)
+    if len(parts) < 3:
+        return None, text
+
+    return parts[1], parts[2]
+
+
+def read_frontmatter_source(stream: BinaryIO) -> Optional[bytes]:
+    """Read a front-matter block from a binary stream, stopping at its end.
+
+    Matches split_frontmatter(): the file must start with the delimiter line
+    and the block ends at the next line ending in the delimiter. Returns None
+    (having consumed the whole stream) if there is no complete block.
+    """
+    delimiter = FRONTMATTER_DELIMITER.encode('utf-8')
+    if stream.readline() != delimiter:
+        return None
+    lines = []
+    for line in stream:
+        if line.endswith(delimiter):
+            lines.append(line[:-len(delimiter)])
+            return b''.join(lines)
+        lines.append(line)
+    return None
+
+
+def parse_frontmatter(source: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """Parse front-matter YAML into (data, error message)."""
+    import yaml
+    # libyaml's C loader is much faster than the pure-Python one; both build the
+    # same safe types, so fall back silently when PyYAML was built without it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        return yaml.load(source, Loader=loader), None
+    except Exception as e:  # malformed YAML or invalid scalar values
+        return None, str(e)
+
+
+def content_hash(data: bytes) -> str:
+    """Stable digest of raw file contents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class FrontMatterSource:
+    """Lazily parsed front-matter, for classes holding frontmatter_source."""
+
+    frontmatter_source: Optional[str]
+    has_frontmatter: bool
+
+    @cached_property
+    def _parsed_frontmatter(self) -> Tuple[Optional[Dict], Optional[str]]:
+        if not self.has_frontmatter:
+            return None, None
+        return parse_frontmatter(self.frontmatter_source)
+
+    def adopt_frontmatter(self, data: Dict) -> None:
+        """Use front-matter already parsed elsewhere (e.g. a MkDocs page's meta)."""
+        self.__dict__['_parsed_frontmatter'] = (data, None)
+
+    @property
+    def frontmatter(self) -> Optional[Dict]:
+        return self._parsed_frontmatter[0]
+
+    @property
+    def frontmatter_error(self) -> Optional[str]:
+        return self._parsed_frontmatter[1]
+
+
+class Document(FrontMatterSource):
+    """A single markdown file, read once and parsed on first use.
+
+    Parsed views (front-matter, links, code blocks, headings) are computed
+    lazily and memoized, so a caller that can answer from a cached result
+    keyed by content_hash never pays for parsing.
+    """
+
+    def __init__(self, path: Path, text: str, read_error: Optional[str] = None,
+                 digest: Optional[str] = None):
+        self.path = path
+        self.text = text
+        self.read_error = read_error
+        self.content_hash = digest or content_hash(text.encode('utf-8'))
+
+        self.frontmatter_source, self.body = split_frontmatter(text)
+        self.has_frontmatter = self.frontmatter_source is not None
+        # Line number (1-based) of the first body line in the file
+        self.body_start_line = 1
+        if self.has_frontmatter:
+            self.body_start_line = self.frontmatter_source.count('\n') + 3
+
+    @classmethod
+    def from_path(cls, path: Path) -> 'Document':
+        """Read a single markdown file."""
+        try:
+            data = path.read_bytes()
+            text = data.decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            return cls(path, '', read_error=str(e))
+        return cls(path, text, digest=content_hash(data))
+
+    @cached_property
+    def tokens(self) -> MarkdownTokens:
+        """Typed token streams of the body, from a single pass over its lines."""
+        return tokenize(self.body, self.body_start_line)
+
+    @property
+    def links(self) -> List[Tuple[str, str]]:
+        """(text, url) of every link and image outside code."""
+        return [(link.text, link.url) for link in self.tokens.links]
+
+    @property
+    def code_blocks(self) -> List[Tuple[str, str]]:
+        """(language, code) of every fenced code block."""
+        return [(block.language, block.code) for block in self.tokens.code_blocks]
+
+    @cached_property
+    def _structure(self) -> Tuple[List[Tuple[int, str, int]], Set[str]]:
+        """Headings and the anchor ids they render to."""
+        headings = []
+        anchors: Set[str] = set()
+        for level, text, line, explicit_id in self.tokens.headings:
+            anchor = explicit_id or slugify(heading_plain_text(text))
+            unique_slug(anchor, anchors)
+            headings.append((level, text, line))
+        anchors.update(self.tokens.html_ids)
+        return headings, anchors
+
+    @property
+    def headings(self) -> List[Tuple[int, str, int]]:
+        """(level, text, line) for ATX and setext headings outside code fences."""
+        return self._structure[0]
+
+    @property
+    def anchors(self) -> Set[str]:
+        """Every fragment id the rendered page will have, for O(1) lookups."""
+        return self._structure[1]
+
+    @property
+    def title_heading(self) -> Optional[str]:
+        """Text of the first level-1 heading, if any."""
+        for level, text, _ in self.headings:
+            if level == 1:
+                return text
+        return None
+
+
+class FrontMatter(FrontMatterSource):
+    """The YAML header of a markdown file, read without reading the body.
+
+    Offers the same front-matter attributes as Document, so validators that
+    only look at metadata can take either.
+    """
+
+    def __init__(self, path: Path, source: Optional[str], read_error: Optional[str] = None):
+        self.path = path
+        self.frontmatter_source = source
+        self.read_error = read_error
+        self.has_frontmatter = source is not None
+        # Digest of the header as it appears in the file (empty if absent)
+        header = ''
+        if self.has_frontmatter:
+            header = FRONTMATTER_DELIMITER + source + FRONTMATTER_DELIMITER
+        self.content_hash = content_hash(header.encode('utf-8'))
+
+    @classmethod
+    def from_path(cls, path: Path) -> 'FrontMatter':
+        """Read a file's front-matter block, leaving the body unread."""
+        try:
+            with path.open('rb') as stream:
+                source = read_frontmatter_source(stream)
+            if source is None:
+                return cls(path, None)
+            return cls(path, source.decode('utf-8'))
+        except (OSError, UnicodeDecodeError) as e:
+            return cls(path, None, read_error=str(e))
+
+
+# Front-matter already read in this process, by path, with the (mtime, size)
+# it was read at
+_frontmatter_memo: Dict[Path, Tuple[Tuple[int, int], FrontMatter]] = {}
+
+
+def read_frontmatter(path: Path) -> FrontMatter:
+    """Front-matter of a file, re-read only if its mtime or size changed."""
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        _frontmatter_memo.pop(path, None)
+        return FrontMatter(path, None, read_error=str(e))
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    memo = _frontmatter_memo.get(path)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    header = FrontMatter.from_path(path)
+    if not header.read_error:
+        _frontmatter_memo[path] = (key, header)
+    return header
+
+
+# Documents already read in this process, by path, with the (mtime, size)
+# they were read at
+_document_memo: Dict[Path, Tuple[Tuple[int, int], Document]] = {}
+
+
+def read_document(path: Path) -> Document:
+    """A markdown file as a Document, re-read only if its mtime or size changed.
+
+    The memoized Document keeps the views already parsed from it, so a later
+    caller in the same process gets them for free.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        _document_memo.pop(path, None)
+        return Document(path, '', read_error=str(e))
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    memo = _document_memo.get(path)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    document = Document.from_path(path)
+    if not document.read_error:
+        _document_memo[path] = (key, document)
+    return document
+
+
+class Corpus:
+    """All markdown documents under a docs directory."""
+
+    def __init__(self, docs_dir: Path, documents: Dict[Path, Document]):
+        self.docs_dir = docs_dir
+        self.documents = documents
+
+    def __iter__(self) -> Iterator[Document]:
+        return iter(self.documents.values())
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self.documents
+
+    def get(self, path: Path) -> Optional[Document]:
+        return self.documents.get(path)
+
+
+def load_corpus(docs_dir: Path, paths: Optional[Iterable[Path]] = None) -> Corpus:
+    """Read every markdown file under docs_dir in a single pass.
+
+    If paths is given, only those files are loaded (changed-files mode).
+    """
+    if paths is None:
+        paths = docs_dir.rglob('*.md')
+    documents = {}
+    for md_file in paths:
+        documents[md_file] = read_document(md_file)
+    return Corpus(docs_dir, documents)
+
+
+def load_frontmatter(docs_dir: Path, paths: Optional[Iterable[Path]] = None) -> List[FrontMatter]:
+    """Read just the front-matter of every markdown file under docs_dir.
+
+    If paths is given, only those files are read (changed-files mode).
+    """
+    if paths is None:
+        paths = docs_dir.rglob('*.md')
+    return [read_frontmatter(md_file) for md_file in paths]
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+External link checking for check-links.py (opt-in with --external).
+
+Every http(s) URL linked from the pages is probed once, however many pages
+link to it, by the asyncio prober in http_prober.py. That module (and
+asyncio with it) is only imported when there is something to probe.
+
+--external-only probes the links of every page without the internal link,
+orphan and nav checks, so a scheduled run fails only on external links.
+
+URLs that answered are kept in the validation cache file with a timestamp
+and only probed again once the entry is older than --external-ttl, so a
+nightly run re-checks just the expired URLs. Failures are not cached: a
+site that was briefly down is re-probed on the next run.
+
+Only the standard library is used, and any http:// server (e.g.
+python -m http.server) can stand in for the real sites.
+"""
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+DEFAULT_TTL_HOURS = 168
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS external_links (
+    url        TEXT PRIMARY KEY,
+    ok         INTEGER NOT NULL,
+    status     INTEGER,
+    detail     TEXT NOT NULL,
+    checked_at REAL NOT NULL
+);
+'''
+
+
+class LinkStatus(NamedTuple):
+    """Outcome of probing one URL; status is None when no response arrived."""
+
+    ok: bool
+    status: Optional[int]
+    detail: str
+
+
+def is_external_url(url: str) -> bool:
+    return url.startswith(('http://', 'https://'))
+
+
+def probe_url(url: str) -> str:
+    """The URL a link is probed at: without its #fragment."""
+    return url.partition('#')[0]
+
+
+class ExternalLinkCache:
+    """Probe results with the time they were taken, in the validation cache file."""
+
+    def __init__(self, cache_file: Path, ttl: float):
+        self.ttl = ttl
+        self.hits = 0
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(cache_file))
+        self.connection.executescript(SCHEMA)
+
+    def lookup(self, url: str, now: float) -> Optional[LinkStatus]:
+        """The cached result for url, or None if there is none younger than the TTL."""
+        row = self.connection.execute(
+            'SELECT ok, status, detail, checked_at FROM external_links WHERE url = ?',
+            (url,)).fetchone()
+        if row is None or now - row[3] >= self.ttl:
+            return None
+        self.hits += 1
+        return LinkStatus(bool(row[0]), row[1], row[2])
+
+    def store(self, url: str, result: LinkStatus, now: float) -> None:
+        self.connection.execute(
+            'INSERT OR REPLACE INTO external_links VALUES (?, ?, ?, ?, ?)',
+            (url, int(result.ok), result.status, result.detail, now))
+
+    def close(self) -> None:
+        # Expired entries would be re-probed anyway; keep the table small
+        self.connection.execute('DELETE FROM external_links WHERE checked_at < ?',
+                                (time.time() - self.ttl,))
+        self.connection.commit()
+        self.connection.close()
+
+
+class NullExternalLinkCache:
+    """Drop-in replacement used when caching is disabled."""
+
+    hits = 0
+
+    def lookup(self, url: str, now: float) -> Optional[LinkStatus]:
+        return None
+
+    def store(self, url: str, result: LinkStatus, now: float) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def add_external_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the external link checking command-line options."""
+    parser.add_argument('--external', action='store_true',
+                        help='Also probe http(s) links on the checked pages (needs network access)')
+    parser.add_argument('--external-only', action='store_true',
+                        help='Only probe http(s) links, skipping the internal checks; '
+                             'the exit status reflects external links alone')
+    parser.add_argument('--external-ttl', type=float, default=DEFAULT_TTL_HOURS, metavar='HOURS',
+                        help=f'Reuse cached external link results younger than this '
+                             f'(default: {DEFAULT_TTL_HOURS})')
+    parser.add_argument('--external-timeout', type=float, default=DEFAULT_TIMEOUT,
+                        metavar='SECONDS',
+                        help=f'Per-request timeout for external links (default: {DEFAULT_TIMEOUT:g})')
+    parser.add_argument('--external-concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        metavar='N',
+                        help=f'External requests in flight at once (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--external-per-host', type=int, default=DEFAULT_PER_HOST, metavar='N',
+                        help=f'External requests in flight per host (default: {DEFAULT_PER_HOST})')
+
+
+def open_external_cache(args: argparse.Namespace):
+    """Open the external link result cache selected on the command line."""
+    if args.no_cache:
+        return NullExternalLinkCache()
+    try:
+        return ExternalLinkCache(args.cache_file, args.external_ttl * 3600)
+    except sqlite3.Error as e:
+        print(f"⚠️  External link cache unavailable ({e}), probing every URL")
+        return NullExternalLinkCache()
+
+
+def check_external_links(urls: Iterable[str],
+                         args: argparse.Namespace) -> Tuple[Dict[str, LinkStatus], int]:
+    """Result for each distinct URL, probing only expired ones, and the number of cache hits."""
+    cache = open_external_cache(args)
+    now = time.time()
+    results: Dict[str, LinkStatus] = {}
+    pending = []
+    for url in dict.fromkeys(urls):
+        cached = cache.lookup(url, now)
+        if cached is None:
+            pending.append(url)
+        else:
+            results[url] = cached
+    from http_prober import ExternalLinkChecker
+
+    checker = ExternalLinkChecker(args.external_timeout, max(1, args.external_concurrency),
+                                  max(1, args.external_per_host))
+    for url, result in checker.check(pending).items():
+        results[url] = result
+        if result.ok:
+            cache.store(url, result, now)
+    cache.close()
+    return results, cache.hits
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Structured findings and their output formats for the SystemCraft validators.
+
+Each finding names the rule that produced it and, where known, the line it
+applies to; severity comes from the validator's rule table. Findings are
+written as they are produced, one file at a time, in one of three formats:
+
+- text: the human report (one line per file, details for failures)
+- jsonl: one JSON object per finding
+- sarif: a SARIF 2.1.0 log for code-scanning tools
+
+In the machine-readable formats stdout carries only the findings; the
+summary and any other console output go to stderr.
+"""
+
+import argparse
+import json
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+# Rule id -> (severity, description); severity is error, warning or note
+RuleTable = Dict[str, Tuple[str, str]]
+
+
+class Finding(NamedTuple):
+    """One problem found in a file: rule id, message and 1-based line."""
+
+    rule: str
+    message: str
+    line: Optional[int] = None
+
+
+def cached_findings(entries: Optional[List]) -> Optional[List[Finding]]:
+    """Rebuild findings stored in the result cache (as JSON arrays)."""
+    if entries is None:
+        return None
+    return [Finding(*entry) for entry in entries]
+
+
+def findings_with_rule(rule: str, messages: Iterable[str],
+                       line: Optional[int] = None) -> List[Finding]:
+    """Tag plain rule messages with their rule id (and a shared line, if any)."""
+    return [Finding(rule, message, line) for message in messages]
+
+
+class TextReporter:
+    """The human-readable report, optionally limited to failures."""
+
+    def __init__(self, validator: str, rules: RuleTable, quiet: bool = False):
+        self.quiet = quiet
+
+    def progress(self, text: str = '') -> None:
+        """Print a line that is not a failure (headers, hints, passing files)."""
+        if not self.quiet:
+            print(text)
+
+    def failure(self, text: str = '') -> None:
+        """Print a line describing a failure."""
+        print(text)
+
+    def file_checked(self, path: Path, findings: List[Finding]) -> None:
+        if findings:
+            print(f"❌ {path}")
+            for finding in findings:
+                print(f"   • {finding.message}")
+            print()
+        else:
+            self.progress(f"✅ {path}")
+
+    def emit(self, path: Path, finding: Finding) -> None:
+        """A finding outside the per-file results; the caller prints it as text."""
+
+    def close(self) -> None:
+        pass
+
+
+class StreamReporter(ABC):
+    """Base for machine-readable formats written to stdout.
+
+    While open, sys.stdout points at stderr so that human-oriented output
+    cannot corrupt the findings stream.
+    """
+
+    def __init__(self, validator: str, rules: RuleTable, quiet: bool = False):
+        self.validator = validator
+        self.rules = rules
+        self.quiet = quiet
+        self.stream = sys.stdout
+        sys.stdout = sys.stderr
+
+    def progress(self, text: str = '') -> None:
+        pass
+
+    def failure(self, text: str = '') -> None:
+        pass
+
+    def severity(self, finding: Finding) -> str:
+        return self.rules.get(finding.rule, ('error', ''))[0]
+
+    def file_checked(self, path: Path, findings: List[Finding]) -> None:
+        for finding in findings:
+            self.emit(path, finding)
+
+    @abstractmethod
+    def emit(self, path: Path, finding: Finding) -> None:
+        """Write one finding to the stream."""
+
+    def close(self) -> None:
+        self.stream.flush()
+        sys.stdout = self.stream
+
+
+class JsonLinesReporter(StreamReporter):
+    """One JSON object per finding."""
+
+    def emit(self, path: Path, finding: Finding) -> None:
+        self.stream.write(json.dumps({
+            'validator': self.validator,
+            'file': Path(path).as_posix(),
+            'line': finding.line,
+            'rule': finding.rule,
+            'severity': self.severity(finding),
+            'message': finding.message,
+        }) + '\n')
+
+
+class SarifReporter(StreamReporter):
+    """A SARIF 2.1.0 log, written incrementally so results are never held in memory."""
+
+    def __init__(self, validator: str, rules: RuleTable, quiet: bool = False):
+        super().__init__(validator, rules, quiet)
+        self.results = 0
+        driver = {
+            'name': f'systemcraft-{validator}',
+            'rules': [{
+                'id': rule,
+                'shortDescription': {'text': description},
+                'defaultConfiguration': {'level': severity},
+            } for rule, (severity, description) in rules.items()],
+        }
+        self.stream.write('{"$schema": %s, "version": "2.1.0", "runs": [{"tool": {"driver": %s}, "results": ['
+                          % (json.dumps(SARIF_SCHEMA), json.dumps(driver)))
+
+    def emit(self, path: Path, finding: Finding) -> None:
+        location = {'artifactLocation': {'uri': Path(path).as_posix()}}
+        if finding.line:
+            location['region'] = {'startLine': finding.line}
+        result = {
+            'ruleId': finding.rule,
+            'level': self.severity(finding),
+            'message': {'text': finding.message},
+            'locations': [{'physicalLocation': location}],
+        }
+        self.stream.write((',\n' if self.results else '\n') + json.dumps(result))
+        self.results += 1
+
+    def close(self) -> None:
+        self.stream.write('\n]}]}\n')
+        super().close()
+
+
+REPORTERS = {
+    'text': TextReporter,
+    'jsonl': JsonLinesReporter,
+    'sarif': SarifReporter,
+}
+
+
+def add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the shared output command-line options."""
+    parser.add_argument('--format', choices=sorted(REPORTERS), default='text',
+                        help='Output format; jsonl and sarif write findings to stdout '
+                             'and the summary to stderr (default: text)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Print only failures and the summary counters')
+
+
+def open_reporter(args: argparse.Namespace, validator: str, rules: RuleTable):
+    """Start the reporter selected on the command line."""
+    return REPORTERS[args.format](validator, rules, args.quiet)
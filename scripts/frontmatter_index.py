@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Columnar index of the SystemCraft pages' front-matter.
+
+Every page's header is stored once, column by column:
+
+- pages: the docs-relative path and URL of each page, in a fixed order;
+- columns: title, summary, estimated_time and last_updated, one list entry
+  per page, for listing results;
+- fields: for content_type, audience, difficulty, status and tags, a
+  dictionary of the values that occur and, per value, a bitmap of the
+  pages that have it (bit i is page i).
+
+A filter such as "L7, advanced, system-design" is then a few bitwise ANDs
+over Python ints, with no header parsed.
+Values within one field are OR-ed, fields are AND-ed.
+
+The index is written as compact JSON, bitmaps base64-encoded little-endian.
+query-frontmatter.py builds it from the headers in docs/ (or loads a
+written one) and answers filters from the command line. As a MkDocs hook it
+collects the page meta MkDocs already parsed and writes the static
+artifact site/frontmatter-index.json, which query-frontmatter.py --index
+reads without touching docs/. Enabled as a hook in mkdocs.yml:
+
+    hooks:
+      - scripts/frontmatter_index.py
+
+Only the standard library is imported.
+"""
+
+import base64
+import json
+import logging
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional
+
+INDEX_FILE = Path('frontmatter-index.json')
+FORMAT_VERSION = 1
+
+# Fields filtered on, each a value or a list of values
+INDEXED_FIELDS = ('content_type', 'audience', 'difficulty', 'status', 'tags')
+# Fields kept as plain columns
+COLUMNS = ('title', 'summary', 'estimated_time', 'last_updated')
+
+log = logging.getLogger('mkdocs.hooks.frontmatter_index')
+
+
+def page_url(src_uri: str) -> str:
+    """Site URL of a page with directory URLs, as MkDocs builds it."""
+    path = PurePosixPath(src_uri)
+    if path.stem in ('index', 'README'):
+        parent = path.parent.as_posix()
+        return '' if parent == '.' else f'{parent}/'
+    return f'{path.with_suffix("").as_posix()}/'
+
+
+def field_values(value) -> List[str]:
+    """The indexed values of one front-matter field."""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return [str(item) for item in value if item is not None]
+    return [str(value)]
+
+
+def column_value(value):
+    """A column entry: JSON scalars as they are, anything else (dates) as text."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def encode_bitmap(bitmap: int, count: int) -> str:
+    return base64.b64encode(bitmap.to_bytes((count + 7) // 8, 'little')).decode('ascii')
+
+
+def decode_bitmap(data: str) -> int:
+    return int.from_bytes(base64.b64decode(data), 'little')
+
+
+class FrontMatterIndex:
+    """Front-matter of many pages: per-page columns and per-value bitmaps."""
+
+    def __init__(self):
+        self.paths: List[str] = []
+        self.urls: List[str] = []
+        self.columns: Dict[str, List] = {name: [] for name in COLUMNS}
+        self.fields: Dict[str, Dict[str, int]] = {name: {} for name in INDEXED_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def add(self, path: str, url: str, frontmatter: Optional[Dict]) -> None:
+        """Add a page; pages without front-matter are listed with empty columns."""
+        if not isinstance(frontmatter, dict):
+            frontmatter = {}
+        bit = 1 << len(self.paths)
+        self.paths.append(path)
+        self.urls.append(url)
+        for name in COLUMNS:
+            self.columns[name].append(column_value(frontmatter.get(name)))
+        for name in INDEXED_FIELDS:
+            bitmaps = self.fields[name]
+            for value in field_values(frontmatter.get(name)):
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+
+    def select(self, filters: Dict[str, Iterable[str]]) -> int:
+        """Bitmap of the pages matching every field filter (any of its values)."""
+        selected = (1 << len(self.paths)) - 1
+        for name, values in filters.items():
+            if name not in self.fields:
+                raise KeyError(f"{name} is not indexed (choose from {', '.join(INDEXED_FIELDS)})")
+            bitmaps = self.fields[name]
+            matching = 0
+            for value in values:
+                matching |= bitmaps.get(value, 0)
+            selected &= matching
+        return selected
+
+    def rows(self, bitmap: int) -> List[int]:
+        """Page numbers set in a bitmap, in page order."""
+        rows = []
+        while bitmap:
+            low = bitmap & -bitmap
+            rows.append(low.bit_length() - 1)
+            bitmap ^= low
+        return rows
+
+    def record(self, row: int) -> Dict:
+        """One page's path, URL and columns."""
+        record = {'path': self.paths[row], 'url': self.urls[row]}
+        record.update((name, values[row]) for name, values in self.columns.items())
+        return record
+
+    def to_json(self) -> str:
+        count = len(self.paths)
+        return json.dumps({
+            'version': FORMAT_VERSION,
+            'count': count,
+            'pages': {'path': self.paths, 'url': self.urls},
+            'columns': self.columns,
+            'fields': {name: {value: encode_bitmap(bitmap, count)
+                              for value, bitmap in sorted(bitmaps.items())}
+                       for name, bitmaps in self.fields.items()},
+        }, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text: str) -> 'FrontMatterIndex':
+        data = json.loads(text)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"unsupported front-matter index version {data.get('version')}")
+        index = cls()
+        index.paths = data['pages']['path']
+        index.urls = data['pages']['url']
+        index.columns = data['columns']
+        index.fields = {name: {value: decode_bitmap(bitmap) for value, bitmap in bitmaps.items()}
+                        for name, bitmaps in data['fields'].items()}
+        return index
+
+
+# MkDocs hook interface
+
+_active: List[FrontMatterIndex] = []
+
+
+def on_pre_build(config) -> None:
+    _active[:] = [FrontMatterIndex()]
+
+
+def on_page_markdown(markdown, page, config, files):
+    if _active:
+        _active[0].add(page.file.src_uri, page.url, page.meta)
+    return markdown
+
+
+def on_post_build(config) -> None:
+    if not _active:
+        return
+    index = _active[0]
+    target = Path(config['site_dir']) / INDEX_FILE
+    target.write_text(index.to_json(), encoding='utf-8')
+    indexed = sum(1 for title in index.columns['title'] if title is not None)
+    log.info(f"Front-matter index: {len(index)} pages ({indexed} with a title) in {INDEX_FILE}")
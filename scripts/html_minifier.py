@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+HTML minification for the built SystemCraft site.
+
+The page is split by a single forward scan into tags, text, comments and
+protected elements, with no external tools and no backtracking regular
+expressions. Then:
+
+- comments are dropped, except IE conditional comments;
+- whitespace runs in text collapse to one space, and disappear next to
+  block-level tags, where browsers would not render them;
+- whitespace inside tags (between attributes) is collapsed, leaving quoted
+  attribute values untouched;
+- inline <style> is stripped of comments and of the spaces around
+  punctuation;
+- inline JavaScript loses its indentation and blank lines. Newlines are
+  kept, so automatic semicolon insertion and // comments behave the same.
+  Scripts containing template literals, and non-JavaScript <script> blocks
+  such as JSON, are left alone;
+- <pre>, <code> and <textarea> content is copied byte for byte.
+
+Used by minify-site.py as a post-build step over site/. It can also run
+during the build as a MkDocs hook:
+
+    hooks:
+      - scripts/html_minifier.py
+
+Results are cached by content hash (MinifyCache), so unchanged pages are
+not minified again. The hook only imports the standard library.
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+DEFAULT_STORE = Path('.cache') / 'minify'
+
+# Elements whose content is copied as-is (or minified as CSS/JS)
+PROTECTED_TAGS = {'pre', 'code', 'textarea', 'script', 'style'}
+# Whitespace next to these tags is not rendered, so it can be dropped
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'base', 'blockquote', 'body', 'br', 'caption', 'col',
+    'colgroup', 'dd', 'details', 'dialog', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'head', 'header', 'hr',
+    'html', 'li', 'link', 'main', 'meta', 'nav', 'ol', 'option', 'p', 'pre', 'section',
+    'summary', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'title', 'tr', 'ul',
+}
+JAVASCRIPT_TYPES = {'', 'text/javascript', 'application/javascript', 'module'}
+
+# HTML whitespace only; \s would also match (and destroy) &nbsp; characters
+WHITESPACE = re.compile(r'[ \t\n\r\f]+')
+# Whitespace in a tag that minify_tag would change
+TAG_SPACING = re.compile(r'[\t\n\r\f]|  | >')
+TAG_NAME = re.compile(r'</?([A-Za-z][A-Za-z0-9-]*)')
+SCRIPT_TYPE = re.compile(r'''\stype\s*=\s*["']?([^"'\s>]*)''', re.IGNORECASE)
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_STRING = re.compile(r'''("(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')''')
+CSS_PUNCTUATION = re.compile(r'[ \t\n\r\f]*([{};,>])[ \t\n\r\f]*')
+CSS_COLON = re.compile(r':[ \t\n\r\f]+')
+
+
+class Token:
+    """A piece of the page: 'tag', 'text', 'comment', 'raw' or 'protected'."""
+
+    __slots__ = ('kind', 'text', 'name')
+
+    def __init__(self, kind: str, text: str, name: str = ''):
+        self.kind = kind
+        self.text = text
+        self.name = name
+
+
+def tag_end(html: str, start: int) -> int:
+    """Index just past the '>' closing the tag at start, skipping quoted values."""
+    position = start + 1
+    quote = None
+    length = len(html)
+    while position < length:
+        char = html[position]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '>':
+            return position + 1
+        position += 1
+    return length
+
+
+def tokenize(html: str) -> List[Token]:
+    """Split a page into tokens in one forward pass."""
+    tokens: List[Token] = []
+    position = 0
+    length = len(html)
+    while position < length:
+        start = html.find('<', position)
+        if start < 0:
+            tokens.append(Token('text', html[position:]))
+            break
+        if start > position:
+            tokens.append(Token('text', html[position:start]))
+        if html.startswith('<!--', start):
+            end = html.find('-->', start + 4)
+            end = length if end < 0 else end + 3
+            tokens.append(Token('comment', html[start:end]))
+            position = end
+            continue
+        name_match = TAG_NAME.match(html, start)
+        if name_match is None:
+            # '<!DOCTYPE ...>', '<?xml ...?>' or a stray '<'
+            end = html.find('>', start) + 1 if html[start + 1:start + 2] in ('!', '?') else start + 1
+            end = end or length
+            tokens.append(Token('raw' if end > start + 1 else 'text', html[start:end]))
+            position = end
+            continue
+        end = tag_end(html, start)
+        name = name_match.group(1).lower()
+        tag = html[start:end]
+        closing = tag.startswith('</')
+        if name in PROTECTED_TAGS and not closing and not tag.endswith('/>'):
+            close = re.compile(r'</%s[ \t\n\r\f]*>' % name, re.IGNORECASE).search(html, end)
+            close_start, close_end = (close.start(), close.end()) if close else (length, length)
+            tokens.append(Token('protected', tag, name))
+            tokens.append(Token('raw', html[end:close_start], name))
+            tokens.append(Token('protected', html[close_start:close_end], name))
+            position = close_end
+            continue
+        tokens.append(Token('tag', tag, name))
+        position = end
+    return tokens
+
+
+def minify_tag(tag: str) -> str:
+    """Collapse whitespace between a tag's attributes, leaving quoted values alone."""
+    if not TAG_SPACING.search(tag):
+        return tag
+    parts = []
+    quote = None
+    run = False
+    for char in tag:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ' \t\n\r\f':
+            run = True
+            continue
+        else:
+            if run and char != '>':
+                parts.append(' ')
+            if char in '"\'':
+                quote = char
+        run = False
+        parts.append(char)
+    return ''.join(parts)
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and the whitespace around CSS punctuation, outside strings."""
+    pieces = CSS_STRING.split(CSS_COMMENT.sub('', css))
+    for index in range(0, len(pieces), 2):
+        piece = CSS_PUNCTUATION.sub(r'\1', pieces[index])
+        piece = CSS_COLON.sub(':', piece)
+        pieces[index] = WHITESPACE.sub(' ', piece)
+    return ''.join(pieces).strip()
+
+
+def minify_javascript(script: str) -> str:
+    """Strip indentation and blank lines, keeping every statement on its own line."""
+    if '`' in script:
+        return script
+    lines = (line.strip() for line in script.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def script_type(tag: str) -> str:
+    match = SCRIPT_TYPE.search(tag)
+    return match.group(1).lower() if match else ''
+
+
+def is_block(token: Optional[Token]) -> bool:
+    """Whether whitespace next to this token is not rendered."""
+    if token is None or token.kind == 'raw' and not token.name:  # page edge or <!DOCTYPE>
+        return True
+    return token.kind in ('tag', 'protected') and token.name in BLOCK_TAGS
+
+
+def minify_html(html: str) -> str:
+    """Minified copy of a page; see the module docstring for what changes."""
+    tokens: List[Token] = []
+    for token in tokenize(html):
+        if token.kind == 'comment' and not token.text.startswith('<!--[if'):
+            continue
+        if token.kind == 'text' and tokens and tokens[-1].kind == 'text':
+            # Text on both sides of a dropped comment
+            tokens[-1] = Token('text', tokens[-1].text + token.text)
+            continue
+        tokens.append(token)
+    output = []
+    opening_tag = ''
+    for index, token in enumerate(tokens):
+        if token.kind == 'text':
+            text = WHITESPACE.sub(' ', token.text)
+            if text.startswith(' ') and is_block(tokens[index - 1] if index else None):
+                text = text[1:]
+            if text.endswith(' ') and is_block(tokens[index + 1] if index + 1 < len(tokens) else None):
+                text = text[:-1]
+            output.append(text)
+        elif token.kind in ('tag', 'protected'):
+            opening_tag = token.text
+            output.append(minify_tag(token.text) if token.text.endswith('>') else token.text)
+        elif token.kind == 'raw' and token.name == 'style':
+            output.append(minify_css(token.text))
+        elif token.kind == 'raw' and token.name == 'script' \
+                and script_type(opening_tag) in JAVASCRIPT_TYPES:
+            output.append(minify_javascript(token.text))
+        else:
+            output.append(token.text)
+    return ''.join(output)
+
+
+@lru_cache(maxsize=None)
+def minifier_version() -> str:
+    """Digest of this module's source; cached pages from other versions are ignored."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+class MinifyCache:
+    """Minified pages stored by a digest of the minifier version and input page."""
+
+    def __init__(self, store: Path = DEFAULT_STORE):
+        self.store = store
+        self.version = minifier_version()
+        self.hits = 0
+        store.mkdir(parents=True, exist_ok=True)
+
+    def key(self, html: str) -> str:
+        return hashlib.blake2b(self.version.encode('ascii') + html.encode('utf-8'),
+                               digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            text = (self.store / f'{key}.html').read_text(encoding='utf-8')
+        except OSError:
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        target = self.store / f'{key}.html'
+        temporary = target.with_suffix(f'.{os.getpid()}.tmp')
+        temporary.write_text(text, encoding='utf-8')
+        os.replace(temporary, target)
+
+    def prune(self, live: Iterable[str]) -> None:
+        """Remove stored pages not produced by the current build."""
+        keep = {f'{key}.html' for key in live}
+        for name in os.listdir(self.store):
+            if name not in keep:
+                os.remove(self.store / name)
+
+    def minify(self, html: str) -> Tuple[str, str]:
+        """(key, minified page), from the store when this exact page was seen before."""
+        key = self.key(html)
+        cached = self.get(key)
+        if cached is None:
+            cached = minify_html(html)
+            self.put(key, cached)
+        return key, cached
+
+
+# MkDocs hook interface
+
+_hook_cache: List[MinifyCache] = []
+_hook_keys: List[str] = []
+
+
+def on_pre_build(config) -> None:
+    _hook_cache[:] = [MinifyCache()]
+    _hook_keys.clear()
+
+
+def on_post_page(output: str, page, config) -> str:
+    if not _hook_cache:
+        on_pre_build(config)
+    key, minified = _hook_cache[0].minify(output)
+    _hook_keys.append(key)
+    return minified
+
+
+def on_post_build(config) -> None:
+    if _hook_cache:
+        _hook_cache[0].prune(_hook_keys)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Concurrent HTTP prober behind check-links.py --external.
+
+Probes run on an asyncio event loop. The blocking http.client requests are
+handed to worker threads, and each host keeps a small pool of keep-alive
+connections. A HEAD request is tried first, and a GET is sent when the
+server rejects HEAD. Each host has its own concurrency limit, and a host
+that answers 429 or 503 is backed off (honouring Retry-After) before it is
+retried.
+"""
+
+import asyncio
+import http.client
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, urljoin, urlsplit
+
+from external_links import DEFAULT_CONCURRENCY, DEFAULT_PER_HOST, DEFAULT_TIMEOUT, LinkStatus
+
+USER_AGENT = 'SystemCraft-link-checker/1.0 (+https://github.com/deepaucksharma/SystemCraft)'
+MAX_REDIRECTS = 5
+MAX_RETRIES = 2
+# Seconds; doubled on every retry and capped at MAX_BACKOFF
+BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Answers that mean "slow down and try again later"
+THROTTLE_STATUSES = {429, 503}
+# Characters left unescaped when turning a URL path into a request target
+SAFE_URL_CHARS = "/%:@!$&'()*+,;=-._~?"
+
+
+class ConnectionPool:
+    """Idle keep-alive connections by (scheme, host, port).
+
+    Only touched from the event loop thread; a connection is handed to one
+    worker thread at a time while a request runs on it.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.context = ssl.create_default_context()
+        self.idle: Dict[Tuple[str, str, Optional[int]], List[http.client.HTTPConnection]] = {}
+
+    def acquire(self, key: Tuple[str, str, Optional[int]]) -> http.client.HTTPConnection:
+        idle = self.idle.get(key)
+        if idle:
+            return idle.pop()
+        scheme, host, port = key
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout,
+                                               context=self.context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, key: Tuple[str, str, Optional[int]],
+                connection: http.client.HTTPConnection) -> None:
+        self.idle.setdefault(key, []).append(connection)
+
+    def close(self) -> None:
+        for connections in self.idle.values():
+            for connection in connections:
+                connection.close()
+        self.idle.clear()
+
+
+def send_request(connection: http.client.HTTPConnection, method: str,
+                 target: str) -> Tuple[int, Dict[str, str], bool]:
+    """Send one request; returns (status, headers, whether the connection can be reused).
+
+    Runs in a worker thread. GET bodies are not read: the connection is
+    closed instead, since a page's size says nothing about the link.
+    """
+    connection.request(method, target, headers={'User-Agent': USER_AGENT, 'Accept': '*/*'})
+    response = connection.getresponse()
+    headers = {name.lower(): value for name, value in response.getheaders()}
+    if method == 'HEAD':
+        response.read()
+        return response.status, headers, not response.will_close
+    response.close()
+    connection.close()
+    return response.status, headers, False
+
+
+def retry_delay(headers: Dict[str, str], attempt: int) -> float:
+    """Seconds to wait before retrying a throttled request."""
+    try:
+        delay = float(headers.get('retry-after', ''))
+    except ValueError:  # absent, or an HTTP date
+        delay = BACKOFF * 2 ** attempt
+    return min(max(delay, 0.0), MAX_BACKOFF)
+
+
+class ExternalLinkChecker:
+    """Probes URLs concurrently with per-host limits and shared connections."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, concurrency: int = DEFAULT_CONCURRENCY,
+                 per_host: int = DEFAULT_PER_HOST):
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.per_host = per_host
+
+    def check(self, urls: Iterable[str]) -> Dict[str, LinkStatus]:
+        """Probe each distinct URL once and return its result."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        return asyncio.run(self._check_all(urls))
+
+    async def _check_all(self, urls: List[str]) -> Dict[str, LinkStatus]:
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(self.concurrency, thread_name_prefix='external-links')
+        loop.set_default_executor(executor)
+        self.pool = ConnectionPool(self.timeout)
+        self.limit = asyncio.Semaphore(self.concurrency)
+        self.hosts: Dict[str, asyncio.Semaphore] = {}
+        try:
+            results = await asyncio.gather(*(self.probe(url) for url in urls))
+        finally:
+            self.pool.close()
+        return dict(zip(urls, results))
+
+    async def probe(self, url: str) -> LinkStatus:
+        """Follow redirects from url to a final answer."""
+        target = url
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(target)
+            if parts.scheme not in ('http', 'https') or not parts.hostname:
+                return LinkStatus(False, None, f"unsupported URL: {target}")
+            try:
+                status, headers = await self.fetch(parts)
+            except (OSError, http.client.HTTPException, UnicodeError, ValueError) as e:
+                return LinkStatus(False, None, str(e) or type(e).__name__)
+            if status in REDIRECT_STATUSES and headers.get('location'):
+                target = urljoin(target, headers['location'])
+                continue
+            return LinkStatus(status < 400, status, f"HTTP {status}")
+        return LinkStatus(False, None, f"more than {MAX_REDIRECTS} redirects")
+
+    async def fetch(self, parts) -> Tuple[int, Dict[str, str]]:
+        """HEAD the URL, falling back to GET when the server rejects HEAD."""
+        host = parts.hostname.encode('idna').decode('ascii')
+        key = (parts.scheme, host, parts.port)
+        request_target = quote(parts.path or '/', safe=SAFE_URL_CHARS)
+        if parts.query:
+            request_target += '?' + quote(parts.query, safe=SAFE_URL_CHARS)
+        semaphore = self.hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+        # The host slot is held through any backoff, so a throttling host
+        # sees no other requests from us until it has recovered
+        async with semaphore:
+            status, headers = await self.request(key, 'HEAD', request_target)
+            if status >= 400 and status not in THROTTLE_STATUSES:
+                status, headers = await self.request(key, 'GET', request_target)
+            return status, headers
+
+    async def request(self, key: Tuple[str, str, Optional[int]], method: str,
+                      target: str) -> Tuple[int, Dict[str, str]]:
+        """One request, retried with backoff when throttled or on a network error."""
+        attempt = 0
+        while True:
+            connection = self.pool.acquire(key)
+            reused = connection.sock is not None
+            try:
+                async with self.limit:
+                    status, headers, reusable = await asyncio.get_running_loop().run_in_executor(
+                        None, send_request, connection, method, target)
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection; not a failure
+                    continue
+                if attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(min(BACKOFF * 2 ** attempt, MAX_BACKOFF))
+                attempt += 1
+                continue
+            if reusable:
+                self.pool.release(key, connection)
+            else:
+                connection.close()
+            if status in THROTTLE_STATUSES and attempt < MAX_RETRIES:
+                await asyncio.sleep(retry_delay(headers, attempt))
+                attempt += 1
+                continue
+            return status, headers
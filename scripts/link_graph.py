@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Path index and link graph for the SystemCraft link checker.
+
+The docs tree is scanned once into an in-memory index of files and
+directories, so link targets are resolved and checked for existence without
+a Path.resolve()/exists() pair per link. Resolved links between pages form
+an explicit forward/reverse graph, which makes orphan detection a single
+O(pages + links) pass and can be exported as JSON or Graphviz DOT.
+
+Fragment links are checked against each target page's anchor ids, taken
+from the documents already parsed for validation.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from doc_corpus import Corpus, Document
+
+# Fragments generated by extensions rather than headings (footnotes,
+# code line numbers, tabs) and browser text fragments are not checked
+UNCHECKED_FRAGMENT_PREFIXES = ('fn:', 'fnref:', '__', ':~:')
+
+
+def link_fragment(link_url: str) -> Optional[str]:
+    """Decoded fragment of a link if it should be checked, else None."""
+    fragment = unquote(link_url.partition('#')[2])
+    if not fragment or fragment.startswith(UNCHECKED_FRAGMENT_PREFIXES):
+        return None
+    return fragment
+
+
+class PathIndex:
+    """Every file and directory under a docs directory, from one scan.
+
+    If files (absolute paths) is given, e.g. the file collection of a MkDocs
+    build, it is used instead of walking the tree.
+    """
+
+    def __init__(self, docs_dir: Path, files: Optional[Iterable[str]] = None):
+        self.docs_dir = docs_dir
+        self.root = os.path.abspath(str(docs_dir))
+        self.files: Set[str] = set()
+        self.dirs: Set[str] = {self.root}
+        if files is not None:
+            for path in files:
+                self.add_file(path)
+            return
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            self.dirs.update(os.path.join(dirpath, name) for name in dirnames)
+            self.files.update(os.path.join(dirpath, name) for name in filenames)
+
+    def add_file(self, path: str) -> None:
+        """Record a file created since the scan, along with any new parent directories."""
+        self.files.add(path)
+        parent = os.path.dirname(path)
+        while parent not in self.dirs and parent.startswith(self.root + os.sep):
+            self.dirs.add(parent)
+            parent = os.path.dirname(parent)
+
+    def remove_file(self, path: str) -> None:
+        """Forget a file deleted since the scan."""
+        self.files.discard(path)
+
+    def resolve(self, current_file: Path, link_url: str) -> Tuple[str, Path]:
+        """Resolve a link lexically to (absolute target, display path).
+
+        The display path used in reports is docs-rooted for absolute links
+        and absolute for relative ones.
+        """
+        decoded_url = unquote(link_url.split('#')[0])
+        if decoded_url.startswith('/'):
+            relative = decoded_url.lstrip('/')
+            target = os.path.normpath(os.path.join(self.root, relative))
+            return target, self.docs_dir / relative
+        source_dir = os.path.dirname(os.path.abspath(str(current_file)))
+        target = os.path.normpath(os.path.join(source_dir, decoded_url))
+        return target, Path(target)
+
+    def exists(self, target: str) -> bool:
+        """Existence check answered from the index for paths under docs/."""
+        if target in self.files or target in self.dirs:
+            return True
+        if target == self.root or target.startswith(self.root + os.sep):
+            return False
+        # Links may legitimately point outside docs/ (e.g. repository files)
+        return os.path.exists(target)
+
+    def page_file(self, target: str) -> Optional[str]:
+        """The markdown file a link target renders from (index.md for directories)."""
+        if target in self.dirs:
+            target = os.path.join(target, 'index.md')
+        return target if target.endswith('.md') and target in self.files else None
+
+    def page_key(self, target: str) -> Optional[str]:
+        """Docs-relative POSIX key for an existing markdown page, else None."""
+        if not target.endswith('.md') or target not in self.files:
+            return None
+        return Path(os.path.relpath(target, self.root)).as_posix()
+
+    def pages(self) -> List[str]:
+        """Docs-relative keys of every markdown page, sorted."""
+        return sorted(Path(os.path.relpath(path, self.root)).as_posix()
+                      for path in self.files if path.endswith('.md'))
+
+
+class LinkGraph:
+    """Forward and reverse links between markdown pages."""
+
+    def __init__(self, pages: Iterable[str] = ()):
+        self.forward: Dict[str, Set[str]] = {page: set() for page in pages}
+        self.reverse: Dict[str, Set[str]] = {page: set() for page in self.forward}
+
+    def add_page(self, page: str, targets: Iterable[str] = ()) -> None:
+        self.forward.setdefault(page, set())
+        self.reverse.setdefault(page, set())
+        for target in targets:
+            self.forward[page].add(target)
+            self.reverse.setdefault(target, set()).add(page)
+            self.forward.setdefault(target, set())
+
+    def remove_links(self, page: str) -> None:
+        """Drop a page's outgoing links, e.g. before adding its new ones."""
+        for target in self.forward.get(page, ()):
+            self.reverse.get(target, set()).discard(page)
+        if page in self.forward:
+            self.forward[page] = set()
+
+    def remove_page(self, page: str) -> None:
+        """Drop a deleted page; pages still linking to it must be re-added."""
+        self.remove_links(page)
+        self.forward.pop(page, None)
+        self.reverse.pop(page, None)
+
+    def orphans(self, roots: Iterable[str], excluded: Set[str]) -> List[str]:
+        """Pages with no inbound link from a non-excluded page and not a nav root.
+
+        Page keys whose file name is in excluded are neither reported nor
+        counted as link sources.
+        """
+        roots = set(roots)
+        orphaned = []
+        for page in sorted(self.forward):
+            if Path(page).name in excluded or page in roots:
+                continue
+            if not any(Path(source).name not in excluded for source in self.reverse[page]):
+                orphaned.append(page)
+        return orphaned
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'nodes': sorted(self.forward),
+            'edges': [[source, target]
+                      for source in sorted(self.forward)
+                      for target in sorted(self.forward[source])],
+        }, indent=2)
+
+    def to_dot(self) -> str:
+        lines = ['digraph links {']
+        lines.extend(f'  {json.dumps(page)};' for page in sorted(self.forward))
+        for source in sorted(self.forward):
+            for target in sorted(self.forward[source]):
+                lines.append(f'  {json.dumps(source)} -> {json.dumps(target)};')
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: Path) -> None:
+        """Write the graph as DOT for a .dot/.gv file, JSON otherwise."""
+        if path.suffix in ('.dot', '.gv'):
+            path.write_text(self.to_dot(), encoding='utf-8')
+        else:
+            path.write_text(self.to_json(), encoding='utf-8')
+
+
+class AnchorIndex:
+    """Anchor ids per markdown page, keyed by absolute path.
+
+    Pages already loaded in the corpus are reused; any other page (e.g. a
+    link target outside the changed files) is read on first use.
+    """
+
+    def __init__(self, corpus: Optional[Corpus] = None):
+        self.documents: Dict[str, Document] = {}
+        if corpus is not None:
+            self.add_corpus(corpus)
+
+    def add_corpus(self, corpus: Corpus) -> None:
+        """Reuse documents that have already been loaded."""
+        for document in corpus:
+            self.documents[os.path.abspath(str(document.path))] = document
+
+    def update(self, document: Document) -> None:
+        """Replace a page's anchors after it was edited."""
+        self.documents[os.path.abspath(str(document.path))] = document
+
+    def discard(self, target: str) -> None:
+        """Forget a deleted page."""
+        self.documents.pop(target, None)
+
+    def document(self, target: str) -> Document:
+        """The page at target, read on first use."""
+        document = self.documents.get(target)
+        if document is None:
+            document = Document.from_path(Path(target))
+            self.documents[target] = document
+        return document
+
+    def has(self, target: str, fragment: str) -> bool:
+        """Whether the page at target renders an element with id fragment."""
+        return fragment in self.document(target).anchors
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Line tokenizer for the markdown read by the SystemCraft validators.
+
+A page body is classified in one pass over its lines into typed tokens:
+fenced code blocks, headings (ATX and setext), link and image spans,
+reference definitions, raw HTML ids and prose. Rules read these streams
+instead of running their own regular expressions over the raw text, so a
+link, heading or phrase inside a code block or an inline code span is never
+mistaken for content.
+
+Every scan moves forward through a line. Link spans are found with
+str.find rather than a backtracking regex. The cost of a page is therefore
+linear in its length, even for pathological input such as a line of
+thousands of unmatched brackets.
+
+Not modelled: indented (4-space) code blocks, HTML blocks and links whose
+text wraps onto a second line. The site's pages use fences, and the
+validators never relied on the others.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Opening or closing code fence, e.g. ```python or ~~~
+FENCE_PATTERN = re.compile(r'^(\s*)(`{3,}|~{3,})(.*)$')
+FENCE_LANGUAGE_PATTERN = re.compile(r'^\s*(\w+)')
+# Setext heading underlines (=== for level 1, --- for level 2)
+SETEXT_PATTERN = re.compile(r'^(=+|-+)\s*$')
+# attr_list block at the end of a heading, e.g. {#custom-id} or {: #id .class}
+ATTR_LIST_PATTERN = re.compile(r'\s*\{:?([^}]*)\}\s*$')
+ATTR_ID_PATTERN = re.compile(r'#([^\s}]+)')
+# Reference definitions: [ref]: url
+REF_DEF_PATTERN = re.compile(r'^\[([^\]]+)\]:\s*(.+)$')
+# Explicit ids in raw HTML, e.g. <a id="..."> or <a name="...">
+HTML_ID_PATTERN = re.compile(r'<[^<>]*\b(?:id|name)=["\']([^"\']+)["\']')
+INLINE_CODE_PATTERN = re.compile(r'(`+)[^`]+?\1')
+
+
+class Heading(NamedTuple):
+    """An ATX or setext heading; line is 1-based in the file.
+
+    text excludes a trailing attr_list block, whose #id (if any) is kept
+    as explicit_id.
+    """
+
+    level: int
+    text: str
+    line: int
+    explicit_id: Optional[str] = None
+
+
+class CodeBlock(NamedTuple):
+    """A fenced code block; language is '' when the fence has none."""
+
+    language: str
+    code: str
+    line: int
+
+
+class LinkSpan(NamedTuple):
+    """An inline or reference link, or an image (text is its alt text)."""
+
+    text: str
+    url: str
+    line: int
+    image: bool = False
+
+
+class MarkdownTokens:
+    """The typed token streams of one markdown body."""
+
+    def __init__(self):
+        self.headings: List[Heading] = []
+        self.code_blocks: List[CodeBlock] = []
+        # Inline links and images in order, then resolved reference links
+        self.links: List[LinkSpan] = []
+        self.html_ids: List[str] = []
+        # One entry per body line: the line outside code, '' inside code, with
+        # inline code spans blanked out, so line numbers and columns still match
+        self.prose_lines: List[str] = []
+
+    @property
+    def prose_text(self) -> str:
+        """The body with code removed, line-aligned with the original."""
+        return '\n'.join(self.prose_lines)
+
+    @property
+    def inline_links(self) -> List[LinkSpan]:
+        """Links (not images)."""
+        return [link for link in self.links if not link.image]
+
+    @property
+    def images(self) -> List[LinkSpan]:
+        return [link for link in self.links if link.image]
+
+    @property
+    def title_heading(self) -> Optional[str]:
+        """Text of the first level-1 heading, if any."""
+        for heading in self.headings:
+            if heading.level == 1:
+                return heading.text
+        return None
+
+
+def atx_heading(line: str) -> Optional[Tuple[int, str]]:
+    """(level, text) of an ATX heading line, else None.
+
+    As in Python-Markdown, a closing run of '#' is dropped even without a
+    space before it. Parsed without a regex, since the equivalent pattern
+    backtracks quadratically on long runs of whitespace.
+    """
+    if not line.startswith('#'):
+        return None
+    level = len(line) - len(line.lstrip('#'))
+    if level > 6 or level == len(line) or not line[level].isspace():
+        return None
+    text = line[level:].strip()
+    if not text:
+        return None
+    return level, text.rstrip('#').rstrip() or text[0]
+
+
+def heading_token(level: int, text: str, line: int) -> Heading:
+    """A Heading with any trailing attr_list block split off."""
+    attr_list = ATTR_LIST_PATTERN.search(text) if text.endswith('}') else None
+    if attr_list is None:
+        return Heading(level, text, line)
+    id_match = ATTR_ID_PATTERN.search(attr_list.group(1))
+    return Heading(level, text[:attr_list.start()], line, id_match.group(1) if id_match else None)
+
+
+def blank_inline_code(line: str) -> str:
+    """Replace inline code spans with spaces, keeping the line length."""
+    if '`' not in line:
+        return line
+    return INLINE_CODE_PATTERN.sub(lambda match: ' ' * len(match.group(0)), line)
+
+
+def scan_links(line: str, number: int, links: List[LinkSpan],
+               references: List[Tuple[str, str, int]]) -> None:
+    """Find [text](url), ![alt](src) and [text][ref] spans in one line.
+
+    Link text runs to the first ']' and may not contain '['; a url runs to
+    the first ')'. The next ']' and ')' found are remembered while the scan
+    moves forward, so no part of the line is searched twice.
+    """
+    end = len(line)
+    pos = 0
+    close = -1  # first ']' after the current '[' (valid while > start)
+    paren = -1  # first ')' after the current '(' (valid while > its position); end if none
+    while True:
+        start = line.find('[', pos)
+        if start < 0:
+            return
+        if close <= start:
+            close = line.find(']', start + 1)
+            if close < 0:
+                return
+        nested = line.find('[', start + 1, close)
+        if nested >= 0:
+            pos = nested
+            continue
+        after = close + 1
+        if line.startswith('(', after):
+            if paren <= after:
+                paren = line.find(')', after + 1)
+                if paren < 0:
+                    paren = end
+            if after + 1 < paren < end:
+                image = start > 0 and line[start - 1] == '!'
+                links.append(LinkSpan(line[start + 1:close], line[after + 1:paren], number, image))
+                pos = paren + 1
+            else:
+                pos = after
+        elif line.startswith('[', after):
+            ref_close = line.find(']', after + 1)
+            if ref_close < 0:
+                return
+            if ref_close > after + 1:
+                references.append((line[start + 1:close], line[after + 1:ref_close], number))
+            pos = ref_close + 1
+        else:
+            pos = after
+
+
+def tokenize(body: str, first_line: int = 1) -> MarkdownTokens:
+    """Tokenize a markdown body whose first line is line first_line of its file."""
+    tokens = MarkdownTokens()
+    references: List[Tuple[str, str, int]] = []
+    definitions: Dict[str, str] = {}
+    fence: Optional[Tuple[str, int, str, int]] = None  # (char, length, language, line)
+    code: List[str] = []
+    previous = ''
+
+    for number, line in enumerate(body.split('\n'), first_line):
+        fence_match = FENCE_PATTERN.match(line)
+        if fence is not None:
+            marker = fence_match.group(2) if fence_match else ''
+            if (marker and marker[0] == fence[0] and len(marker) >= fence[1]
+                    and not fence_match.group(3).strip()):
+                tokens.code_blocks.append(CodeBlock(fence[2], ''.join(code), fence[3]))
+                fence, code = None, []
+            else:
+                code.append(line + '\n')
+            tokens.prose_lines.append('')
+            continue
+        if fence_match:
+            marker = fence_match.group(2)
+            language = FENCE_LANGUAGE_PATTERN.match(fence_match.group(3))
+            fence = (marker[0], len(marker), language.group(1) if language else '', number)
+            tokens.prose_lines.append('')
+            previous = ''
+            continue
+
+        text = blank_inline_code(line)
+        tokens.prose_lines.append(text)
+
+        atx = atx_heading(line)
+        setext = SETEXT_PATTERN.match(line)
+        heading = None
+        if atx:
+            heading = heading_token(atx[0], atx[1], number)
+        elif (setext and previous.strip()
+              and not previous.lstrip().startswith(('#', '-', '*', '+', '|', '>'))):
+            heading = heading_token(1 if setext.group(1)[0] == '=' else 2, previous.strip(), number - 1)
+        if heading:
+            tokens.headings.append(heading)
+        if '<' in text and ('id=' in text or 'name=' in text):
+            tokens.html_ids.extend(HTML_ID_PATTERN.findall(text))
+
+        definition = REF_DEF_PATTERN.match(text.strip())
+        if definition:
+            definitions[definition.group(1)] = definition.group(2)
+        elif '[' in text:
+            scan_links(text, number, tokens.links, references)
+        # A heading's text cannot also be the first line of a setext heading
+        previous = '' if heading else line
+
+    if fence is not None:
+        # An unclosed fence runs to the end of the page
+        tokens.code_blocks.append(CodeBlock(fence[2], ''.join(code), fence[3]))
+    tokens.links.extend(LinkSpan(text, definitions[ref], number)
+                        for text, ref, number in references if ref in definitions)
+    return tokens
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Minify the HTML pages of the built SystemCraft site.
+
+Replaces the per-file html-minifier-terser calls in build-optimized.sh:
+every page under site/ is rewritten by html_minifier.minify_html
+(whitespace collapsed, comments removed, inline CSS/JS tightened, <pre>,
+<code> and <textarea> untouched) in one Python process, or across a
+process pool with --jobs.
+
+Minified pages are kept in .cache/minify/ by a hash of the page and of the
+minifier source, so a rebuild only minifies the pages whose content
+changed. Run it before compress-site.py so the precompressed siblings are
+made from the minified pages.
+
+    python scripts/minify-site.py --jobs 0
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from html_minifier import DEFAULT_STORE, MinifyCache, minify_html
+from worker_pool import add_jobs_arguments, map_in_order
+
+DEFAULT_SITE_DIR = Path('site')
+
+
+def minify_page(job: Tuple[str, str, str]) -> int:
+    """Minify one page in place and into the store; returns its new size. Runs in a pool worker."""
+    path, key, store = job
+    page = Path(path)
+    minified = minify_html(page.read_bytes().decode('utf-8'))
+    MinifyCache(Path(store)).put(key, minified)
+    encoded = minified.encode('utf-8')
+    page.write_bytes(encoded)
+    return len(encoded)
+
+
+def main():
+    """Minify the built site, reusing pages minified by an earlier run."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--site-dir', type=Path, default=DEFAULT_SITE_DIR,
+                        help=f'Built site to minify (default: {DEFAULT_SITE_DIR})')
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE,
+                        help=f'Minified page store (default: {DEFAULT_STORE})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Minify every page instead of reusing stored results')
+    add_jobs_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.site_dir.is_dir():
+        print(f"ERROR: {args.site_dir} not found; build the site first")
+        sys.exit(1)
+
+    print(f"🧹 Minifying HTML in {args.site_dir}/...")
+    cache = MinifyCache(args.store)
+    live: Dict[str, bool] = {}
+    pending: List[Tuple[str, str, str]] = []
+    original = minified = 0
+    pages = sorted(args.site_dir.rglob('*.html'))
+    for page in pages:
+        data = page.read_bytes()
+        original += len(data)
+        key = cache.key(data.decode('utf-8'))
+        live[key] = True
+        cached = None if args.no_cache else cache.get(key)
+        if cached is None:
+            pending.append((str(page), key, str(args.store)))
+            continue
+        encoded = cached.encode('utf-8')
+        if encoded != data:
+            page.write_bytes(encoded)
+        minified += len(encoded)
+
+    minified += sum(map_in_order(minify_page, pending, args.jobs))
+    cache.prune(live)
+
+    saved = original - minified
+    print(f"   Pages minified: {len(pending)}")
+    print(f"   Reused from {args.store}: {len(pages) - len(pending)}")
+    print(f"   Bytes: {original:,} -> {minified:,} "
+          f"({saved:,} saved, {saved / original if original else 0:.1%})")
+    print("✅ HTML minification complete")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Incremental MkDocs builds: reuse the rendered HTML of unchanged pages.
+
+Enabled as a hook in mkdocs.yml:
+
+    hooks:
+      - scripts/mkdocs_build_cache.py
+
+Most of a build's time goes into running each page through the full
+markdown_extensions stack. This hook wraps Page.render. The state a render
+leaves on a page (content, table of contents, title, anchors) is stored in
+.cache/build.sqlite under a key made of:
+
+- the page's markdown, after other plugins have run, plus its source path
+  and URL;
+- the content of every snippet it includes, including nested
+  pymdownx.snippets includes and the auto_append files;
+- the markdown extensions and their configuration, the MkDocs version and
+  this module's source;
+- where each page it links to now lives, so renaming or removing a target
+  re-renders the pages that link to it;
+- its nav context, i.e. its title and the sections it sits in.
+
+A page whose key is unchanged gets its stored state back instead of being
+rendered again. The theme template is still rendered for every page, so
+nav changes reach every page without throwing away the stored HTML. Pages
+whose render logged a warning are never stored, so --strict keeps failing
+on them.
+
+Only the standard library (and MkDocs itself) is imported. Set
+SYSTEMCRAFT_BUILD_CACHE=0 to render every page.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+import posixpath
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+import mkdocs
+from mkdocs.structure.files import File
+from mkdocs.structure.pages import Page
+
+DEFAULT_CACHE_FILE = Path('.cache') / 'build.sqlite'
+DISABLE_VARIABLE = 'SYSTEMCRAFT_BUILD_CACHE'
+# Nested snippet includes followed when hashing a page's inputs
+MAX_SNIPPET_DEPTH = 4
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS rendered_pages (
+    src_uri TEXT PRIMARY KEY,
+    key     TEXT NOT NULL,
+    state   BLOB NOT NULL
+);
+'''
+
+LINK_TARGET = re.compile(r'\]\(\s*<?([^)\s>]+)')
+REFERENCE_TARGET = re.compile(r'^ {0,3}\[[^\]]+\]:\s*<?([^\s>]+)', re.MULTILINE)
+HTML_TARGET = re.compile(r'''\b(?:href|src)\s*=\s*["']([^"']+)''')
+SNIPPET_MARKER = re.compile(r'-+8<-+')
+SNIPPET_LINE = re.compile(r'-+8<-+\s+(["\']?)(.+?)\1')
+SNIPPET_RANGE = re.compile(r'(?::-?\d*){1,2}$|:[A-Za-z_][\w-]*$')
+
+log = logging.getLogger('mkdocs.hooks.build_cache')
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def stable_name(value) -> object:
+    """JSON stand-in for config values such as functions, without memory addresses."""
+    func = getattr(value, 'func', None)
+    if func is not None:  # functools.partial
+        return [stable_name(func), list(value.args), dict(value.keywords)]
+    module = getattr(value, '__module__', type(value).__module__)
+    name = getattr(value, '__qualname__', type(value).__qualname__)
+    return f'{module}.{name}'
+
+
+def snippet_names(markdown: str) -> List[str]:
+    """Files included with pymdownx.snippets, in line and block form."""
+    names = []
+    in_block = False
+    for line in markdown.splitlines():
+        stripped = line.strip()
+        if SNIPPET_MARKER.fullmatch(stripped):
+            in_block = not in_block
+        elif in_block:
+            if stripped and not stripped.startswith(';'):
+                names.append(stripped.strip('"\''))
+        else:
+            match = SNIPPET_LINE.fullmatch(stripped)
+            if match:
+                names.append(match.group(2))
+    return names
+
+
+def dump_state(state: dict) -> bytes:
+    """Pickle a page's render state, storing File objects by source path.
+
+    The hook module itself is imported under its file path, so nothing it
+    defines can be pickled by reference; Files go in as persistent ids.
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = lambda value: value.src_uri if isinstance(value, File) else None
+    pickler.dump(state)
+    return buffer.getvalue()
+
+
+def load_state(blob: bytes, files) -> dict:
+    """Inverse of dump_state; raises KeyError for a File no longer in the build."""
+    def resolve(src_uri: str) -> File:
+        found = files.get_file_from_path(src_uri)
+        if found is None:
+            raise KeyError(src_uri)
+        return found
+
+    unpickler = pickle.Unpickler(io.BytesIO(blob))
+    unpickler.persistent_load = resolve
+    return unpickler.load()
+
+
+class WarningCounter(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+class BuildCache:
+    """Stored page render state for one build, keyed by everything the render read."""
+
+    def __init__(self, config, cache_file: Path = DEFAULT_CACHE_FILE):
+        snippets = (config['mdx_configs'] or {}).get('pymdownx.snippets', {})
+        base_path = snippets.get('base_path', ['.'])
+        self.snippet_bases = [base_path] if isinstance(base_path, str) else list(base_path)
+        self._snippets: Dict[str, Tuple[Optional[str], List[str]]] = {}
+        self.config_key = content_hash(json.dumps([
+            mkdocs.__version__,
+            content_hash(Path(__file__).read_bytes()),
+            config['markdown_extensions'],
+            config['mdx_configs'],
+            config['use_directory_urls'],
+            config.get('validation'),
+            self.snippet_inputs(snippets.get('auto_append', [])),
+        ], sort_keys=True, default=stable_name).encode('utf-8'))
+        self.hits = 0
+        self.misses = 0
+        self.seen: Set[str] = set()
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(cache_file))
+        self.connection.executescript(SCHEMA)
+
+    def resolve_snippet(self, name: str) -> Optional[str]:
+        for candidate in (name, SNIPPET_RANGE.sub('', name)):
+            for base in self.snippet_bases:
+                path = os.path.join(base, candidate)
+                if os.path.isfile(path):
+                    return path
+        return None
+
+    def snippet_inputs(self, names: List[str], depth: int = 0) -> List[Tuple[str, Optional[str]]]:
+        """(name, content hash) of each included snippet, nested includes following it."""
+        inputs = []
+        for name in names:
+            path = self.resolve_snippet(name)
+            if path is None:
+                inputs.append((name, None))
+                continue
+            if path not in self._snippets:
+                data = Path(path).read_bytes()
+                nested = snippet_names(data.decode('utf-8', errors='replace'))
+                self._snippets[path] = (content_hash(data), nested)
+            digest, nested = self._snippets[path]
+            inputs.append((name, digest))
+            if depth < MAX_SNIPPET_DEPTH:
+                inputs.extend(self.snippet_inputs(nested, depth + 1))
+        return inputs
+
+    def link_inputs(self, page: Page, files) -> Dict[str, Optional[str]]:
+        """URL each relative link on the page resolves to now (None if missing)."""
+        markdown = page.markdown or ''
+        targets = (LINK_TARGET.findall(markdown) + REFERENCE_TARGET.findall(markdown)
+                   + HTML_TARGET.findall(markdown))
+        directory = posixpath.dirname(page.file.src_uri)
+        resolved: Dict[str, Optional[str]] = {}
+        for target in targets:
+            path = target.split('#', 1)[0].split('?', 1)[0]
+            if not path or path in resolved or ':' in path or path.startswith('/'):
+                continue
+            found = files.get_file_from_path(
+                posixpath.normpath(posixpath.join(directory, unquote(path))))
+            resolved[path] = found.url if found is not None else None
+        return resolved
+
+    def key(self, page: Page, files) -> str:
+        markdown = page.markdown or ''
+        return content_hash(json.dumps([
+            self.config_key,
+            page.file.src_uri,
+            page.url,
+            content_hash(markdown.encode('utf-8')),
+            self.snippet_inputs(snippet_names(markdown)),
+            self.link_inputs(page, files),
+            page.title,
+            [getattr(section, 'title', None) for section in page.ancestors],
+        ], sort_keys=True, default=stable_name).encode('utf-8'))
+
+    def lookup(self, src_uri: str, key: str, files) -> Optional[dict]:
+        row = self.connection.execute(
+            'SELECT key, state FROM rendered_pages WHERE src_uri = ?', (src_uri,)).fetchone()
+        if row is None or row[0] != key:
+            return None
+        try:
+            return load_state(row[1], files)
+        except (KeyError, pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+            return None
+
+    def store(self, src_uri: str, key: str, state: dict) -> None:
+        try:
+            blob = dump_state(state)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            log.debug(f"Not caching {src_uri}: render state cannot be stored")
+            return
+        self.connection.execute('INSERT OR REPLACE INTO rendered_pages VALUES (?, ?, ?)',
+                                (src_uri, key, blob))
+
+    def render(self, original, page: Page, config, files) -> None:
+        """Page.render, replaying the stored state when the page's inputs are unchanged."""
+        src_uri = page.file.src_uri
+        self.seen.add(src_uri)
+        key = self.key(page, files)
+        state = self.lookup(src_uri, key, files)
+        if state is not None:
+            self.hits += 1
+            page.__dict__.update(state)
+            return
+
+        self.misses += 1
+        before = dict(vars(page))
+        counter = WarningCounter()
+        logger = logging.getLogger('mkdocs')
+        logger.addHandler(counter)
+        try:
+            original(page, config, files)
+        finally:
+            logger.removeHandler(counter)
+        if counter.count == 0:
+            self.store(src_uri, key, {name: value for name, value in vars(page).items()
+                                      if name not in before or before[name] is not value})
+
+    def close(self, prune: bool) -> None:
+        if prune:
+            stale = [(src_uri,) for (src_uri,) in
+                     self.connection.execute('SELECT src_uri FROM rendered_pages')
+                     if src_uri not in self.seen]
+            self.connection.executemany('DELETE FROM rendered_pages WHERE src_uri = ?', stale)
+        self.connection.commit()
+        self.connection.close()
+
+
+# MkDocs hook interface
+
+_active: List[BuildCache] = []
+
+
+def _install(cache: BuildCache) -> None:
+    """Route Page.render through cache, keeping the original for misses."""
+    original = getattr(Page, '_uncached_render', Page.render)
+    Page._uncached_render = original
+
+    def render(page, config, files):
+        cache.render(original, page, config, files)
+
+    Page.render = render
+
+
+def on_config(config):
+    _close(prune=False)
+    if os.environ.get(DISABLE_VARIABLE, '1') == '0':
+        Page.render = getattr(Page, '_uncached_render', Page.render)
+        return config
+    try:
+        cache = BuildCache(config)
+    except (OSError, sqlite3.Error) as e:
+        # Not a warning: a missing cache must not fail --strict builds
+        log.info(f"Build cache unavailable ({e}), rendering every page")
+        return config
+    _active.append(cache)
+    _install(cache)
+    return config
+
+
+def on_post_build(config) -> None:
+    if _active:
+        cache = _active[0]
+        log.info(f"Build cache: {cache.hits} pages reused, {cache.misses} rendered")
+    _close(prune=True)
+
+
+def on_build_error(error) -> None:
+    _close(prune=False)
+
+
+def _close(prune: bool) -> None:
+    while _active:
+        _active.pop().close(prune)
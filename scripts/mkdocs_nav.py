@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Parsed MkDocs navigation for the SystemCraft validation scripts.
+
+The nav section of mkdocs.yml (and of mkdocs-optimized.yml, when present)
+is loaded with a YAML parser rather than scraped with a regular expression,
+so commented-out entries are ignored and page paths with dots or non-ASCII
+characters are kept. The configs use Python tags such as
+!!python/name:pymdownx.superfences.fence_code_format; those are read as
+plain values instead of being imported.
+
+Each config is parsed once per process and memoized by mtime and size.
+The resulting NavTree keeps its entries in nav order, with a set of page
+paths and a page -> position map, so nav membership and order checks are
+set lookups.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+MKDOCS_CONFIG = Path('mkdocs.yml')
+OPTIMIZED_CONFIG = Path('mkdocs-optimized.yml')
+# Every config whose nav the site may be built from; mkdocs.yml is required
+NAV_CONFIGS = (MKDOCS_CONFIG, OPTIMIZED_CONFIG)
+
+
+class NavEntry(NamedTuple):
+    """A page in the nav; path is docs-relative as written in the config."""
+
+    title: Optional[str]
+    path: str
+    # Titles of the enclosing sections, outermost first
+    section: Tuple[str, ...]
+    position: int
+
+
+class NavTree:
+    """The pages listed in one config's nav, in nav order."""
+
+    def __init__(self, config: Path, entries: List[NavEntry], error: Optional[str] = None):
+        self.config = config
+        self.entries = entries
+        # Why the nav could not be read; entries is empty when set
+        self.error = error
+        self.order: Dict[str, int] = {}
+        for entry in entries:
+            self.order.setdefault(normalize_page(entry.path), entry.position)
+        # Normalized docs-relative paths of every page in the nav
+        self.pages: Set[str] = set(self.order)
+
+    def __contains__(self, page: str) -> bool:
+        return normalize_page(page) in self.order
+
+    def position(self, page: str) -> Optional[int]:
+        """Index of a page's first nav entry, or None if it is not in the nav."""
+        return self.order.get(normalize_page(page))
+
+    def missing(self, exists: Callable[[str], bool]) -> List[str]:
+        """Nav paths, as written, for which exists(normalized path) is false."""
+        missing = []
+        seen: Set[str] = set()
+        for entry in self.entries:
+            page = normalize_page(entry.path)
+            if page not in seen and not exists(page):
+                missing.append(entry.path)
+            seen.add(page)
+        return missing
+
+
+def normalize_page(path: str) -> str:
+    """Docs-relative POSIX form of a nav path, e.g. './a/../b.md' -> 'b.md'."""
+    return PurePosixPath(os.path.normpath(path.lstrip('/'))).as_posix()
+
+
+def is_external(target: str) -> bool:
+    """Whether a nav target is a URL rather than a docs page."""
+    return '://' in target or target.startswith(('mailto:', '#'))
+
+
+def nav_entries(items, section: Tuple[str, ...] = (),
+                entries: Optional[List[NavEntry]] = None) -> List[NavEntry]:
+    """Flatten a nav list into its page entries, in order.
+
+    Items are 'page.md', {title: 'page.md'} or {title: [items]}; external
+    links and malformed items are skipped.
+    """
+    if entries is None:
+        entries = []
+    if not isinstance(items, list):
+        return entries
+    for item in items:
+        if isinstance(item, str):
+            if not is_external(item):
+                entries.append(NavEntry(None, item, section, len(entries)))
+            continue
+        if not isinstance(item, dict):
+            continue
+        for title, value in item.items():
+            if isinstance(value, list):
+                nav_entries(value, section + (str(title),), entries)
+            elif isinstance(value, str) and not is_external(value):
+                entries.append(NavEntry(str(title), value, section, len(entries)))
+    return entries
+
+
+@lru_cache(maxsize=None)
+def config_loader():
+    """A safe YAML loader that reads custom tags as plain values."""
+    import yaml
+
+    base = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    class ConfigLoader(base):
+        pass
+
+    def construct_untagged(loader, suffix, node):
+        if isinstance(node, yaml.MappingNode):
+            return loader.construct_mapping(node)
+        if isinstance(node, yaml.SequenceNode):
+            return loader.construct_sequence(node)
+        return loader.construct_scalar(node)
+
+    # !!python/name:..., !!python/object/apply:..., !ENV and any other tag
+    ConfigLoader.add_multi_constructor('', construct_untagged)
+    return ConfigLoader
+
+
+def parse_nav(config: Path) -> NavTree:
+    """Read a config's nav section."""
+    import yaml
+
+    try:
+        data = yaml.load(config.read_text(encoding='utf-8'), Loader=config_loader())
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+        return NavTree(config, [], f"Error reading {config}: {e}")
+    if not isinstance(data, dict):
+        return NavTree(config, [], f"Error reading {config}: not a mapping")
+    return NavTree(config, nav_entries(data.get('nav')))
+
+
+# Navs already parsed in this process, by config path, with the
+# (mtime, size) they were read at
+_nav_memo: Dict[Path, Tuple[Tuple[int, int], NavTree]] = {}
+
+
+def load_nav(config: Path = MKDOCS_CONFIG) -> NavTree:
+    """A config's nav, re-parsed only if its mtime or size changed."""
+    try:
+        stat = os.stat(config)
+    except OSError:
+        _nav_memo.pop(config, None)
+        return NavTree(config, [], f"{config} not found")
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    memo = _nav_memo.get(config)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    nav = parse_nav(config)
+    _nav_memo[config] = (key, nav)
+    return nav
+
+
+def load_navs(configs: Sequence[Path] = NAV_CONFIGS) -> List[NavTree]:
+    """The navs of mkdocs.yml and of every optional config that exists."""
+    return [load_nav(config) for config in configs
+            if config == MKDOCS_CONFIG or config.exists()]
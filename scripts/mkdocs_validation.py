@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Run the SystemCraft validators inside the MkDocs build.
+
+Enabled as a hook in mkdocs.yml:
+
+    hooks:
+      - scripts/mkdocs_validation.py
+
+The front-matter, content and link rules run on the pages MkDocs is
+already building, so CI reads and parses the corpus once instead of once
+per validator plus once for the build:
+
+- each page is read once, through doc_corpus.read_document(), and that text
+  is handed to MkDocs as the page source;
+- front-matter rules use the page meta MkDocs parsed instead of parsing the
+  YAML again;
+- links resolve against MkDocs' file collection rather than a walk of
+  docs/, and #fragments are checked against the ids MkDocs rendered (its
+  TOC and the anchors it found in the HTML);
+- orphans are pages outside the nav of the config being built with no
+  link from another page.
+
+Findings of error severity are logged as warnings, so `mkdocs build
+--strict` fails on them; warnings and notes are logged at info level.
+Navigation entries are not checked here: MkDocs reports nav entries that
+point at missing files itself.
+
+Set SYSTEMCRAFT_BUILD_VALIDATION=0 to build without validating.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from doc_corpus import Document, read_document
+from findings import Finding, RuleTable
+from link_graph import AnchorIndex, LinkGraph, PathIndex
+from mkdocs_nav import NavTree, nav_entries
+from validator_loader import load_validator
+
+DISABLE_VARIABLE = 'SYSTEMCRAFT_BUILD_VALIDATION'
+
+log = logging.getLogger('mkdocs.hooks.validation')
+
+# MkDocs puts this file's directory on sys.path only while importing it, so
+# the validators (and the modules they import) are loaded now
+frontmatter = load_validator('validate-frontmatter')
+links = load_validator('check-links')
+try:
+    content = load_validator('validate-content')
+    content_error = None
+except ImportError as e:
+    content = None
+    content_error = str(e)
+
+
+def toc_ids(items) -> Set[str]:
+    """Anchor ids of a rendered table of contents, nested entries included."""
+    ids = set()
+    for item in items:
+        ids.add(item.id)
+        ids.update(toc_ids(item.children))
+    return ids
+
+
+class RenderedAnchors(AnchorIndex):
+    """Anchor ids as MkDocs rendered them, falling back to the parsed headings."""
+
+    def __init__(self):
+        super().__init__()
+        self.rendered: Dict[str, Set[str]] = {}
+
+    def has(self, target: str, fragment: str) -> bool:
+        ids = self.rendered.get(target)
+        if ids is None:
+            return super().has(target, fragment)
+        return fragment in ids
+
+
+class BuildValidation:
+    """Findings for the pages of one build."""
+
+    def __init__(self, config):
+        self.docs_dir = Path(os.path.relpath(config['docs_dir']))
+        self.nav: Optional[NavTree] = None
+        if config['nav'] is not None:
+            self.nav = NavTree(Path(config.config_file_path or 'mkdocs.yml'),
+                               nav_entries(config['nav']))
+        self.index: Optional[PathIndex] = None
+        self.anchors = RenderedAnchors()
+        self.documents: Dict[Path, Document] = {}
+        self.issues = 0
+        self.failing: Set[Path] = set()
+
+    def page_path(self, page) -> Optional[Path]:
+        """Docs path of a page read from disk; None for generated pages."""
+        if page.file.abs_src_path is None:
+            return None
+        return self.docs_dir / page.file.src_uri
+
+    def report(self, path: Path, rules: RuleTable, findings: List[Finding]) -> None:
+        for finding in findings:
+            location = f'{path}:{finding.line}' if finding.line else str(path)
+            severity = rules.get(finding.rule, ('error', ''))[0]
+            level = logging.WARNING if severity == 'error' else logging.INFO
+            log.log(level, f"{location}: {finding.message} [{finding.rule}]")
+            self.issues += 1
+            self.failing.add(path)
+
+    def read_source(self, page) -> Optional[str]:
+        """A page's source, read once and kept for the link rules."""
+        path = self.page_path(page)
+        if path is None:
+            return None
+        document = read_document(path)
+        if document.read_error:
+            # MkDocs reads the file again and reports the error itself
+            return None
+        self.documents[path] = document
+        return document.text
+
+    def check_page(self, page) -> None:
+        """Front-matter and content rules for one page."""
+        path = self.page_path(page)
+        if path is None:
+            return
+        document = self.documents.get(path)
+        if document is None:
+            document = self.documents[path] = read_document(path)
+        if page.meta and document.has_frontmatter:
+            document.adopt_frontmatter(page.meta)
+        self.anchors.update(document)
+
+        if not frontmatter.check_excluded_files(path):
+            self.report(path, frontmatter.RULES, frontmatter.validate_frontmatter(path, document))
+        if content is not None and not content.should_exclude_file(path):
+            self.report(path, content.RULES, content.validate_content_file(path, document))
+
+    def record_anchors(self, page) -> None:
+        path = self.page_path(page)
+        if path is None:
+            return
+        ids = getattr(page, 'present_anchor_ids', None)
+        if ids is None:
+            # MkDocs before 1.6 only exposes the TOC
+            ids = toc_ids(page.toc) | self.documents[path].tokens.html_ids
+        self.anchors.rendered[os.path.abspath(str(path))] = set(ids)
+
+    def check_links(self) -> None:
+        """Link rules for every page, then orphans, once all pages are rendered."""
+        graph = LinkGraph()
+        for path in sorted(self.documents):
+            dependencies = {}
+            self.report(path, links.RULES,
+                        links.validate_internal_links(path, self.documents[path], dependencies,
+                                                      self.index, self.anchors))
+            key = self.index.page_key(os.path.abspath(str(path)))
+            if key is not None:
+                graph.add_page(key, links.page_links(dependencies, self.index))
+
+        if self.nav is None:
+            # Without a nav MkDocs lists every page, so none is unreachable
+            return
+        for page in graph.orphans(self.nav.pages, links.ORPHAN_CHECK_EXCLUDED):
+            orphan = self.docs_dir / page
+            self.report(orphan, links.RULES, [Finding('orphaned-file', f"Orphaned file: {orphan}")])
+
+
+# MkDocs hook interface
+
+_active: List[BuildValidation] = []
+
+
+def on_config(config):
+    _active.clear()
+    if os.environ.get(DISABLE_VARIABLE, '1') == '0':
+        return config
+    if content is None:
+        log.info(f"Content rules disabled: {content_error}")
+    _active.append(BuildValidation(config))
+    return config
+
+
+def on_files(files, config):
+    if _active:
+        _active[0].index = PathIndex(_active[0].docs_dir,
+                                     (file.abs_src_path for file in files
+                                      if file.abs_src_path is not None))
+    return files
+
+
+def on_page_read_source(page, config) -> Optional[str]:
+    if not _active:
+        return None
+    return _active[0].read_source(page)
+
+
+def on_page_markdown(markdown, page, config, files):
+    if _active:
+        _active[0].check_page(page)
+    return markdown
+
+
+def on_page_content(html, page, config, files):
+    if _active:
+        _active[0].record_anchors(page)
+    return html
+
+
+def on_env(env, config, files):
+    if _active:
+        validation = _active[0]
+        validation.check_links()
+        log.info(f"Validation: {validation.issues} issue(s) in {len(validation.failing)} of "
+                 f"{len(validation.documents)} pages")
+    return env
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Multi-phrase matching for the SystemCraft content rules.
+
+A table of literal phrases is compiled into a single regular expression
+shaped like a trie (shared prefixes are factored out, so at any position at
+most one branch can continue). Scanning a document once with it finds every
+occurrence of every phrase, so the cost of a rule table grows with the
+length of the text rather than with text length times the number of rules.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, Tuple
+
+
+def _trie_pattern(node: Dict[str, Dict]) -> str:
+    """Regex for the phrases below a trie node; the '' key marks a phrase end."""
+    branches = [re.escape(char) + _trie_pattern(child)
+                for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    # A phrase ends here but longer ones continue: prefer the longest match
+    return f'(?:{body})?' if '' in node else body
+
+
+def fold_case(text: str) -> str:
+    """Lower-case text without changing its length, so offsets stay valid.
+
+    Characters whose lower-case form is longer (e.g. 'İ') are left as is.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+class PhraseMatcher:
+    """Finds every occurrence of a fixed set of literal phrases in one pass.
+
+    Matching is case-sensitive; for case-insensitive matching use lower-case
+    phrases and scan fold_case(text).
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = sorted({phrase for phrase in phrases if phrase})
+        trie: Dict[str, Dict] = {}
+        for phrase in self.phrases:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        self.pattern = re.compile(_trie_pattern(trie) if trie else '(?!)')
+        # The match at a position is the longest phrase starting there; every
+        # other phrase starting there is one of its prefixes
+        self.prefixes = {
+            phrase: [other for other in self.phrases if phrase.startswith(other)]
+            for phrase in self.phrases
+        }
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (offset, phrase) for every occurrence in text, by offset.
+
+        Overlapping occurrences are all reported: the search resumes one
+        character after the start of each match rather than at its end.
+        """
+        search = self.pattern.search
+        match = search(text)
+        while match:
+            offset = match.start()
+            for phrase in self.prefixes[match.group()]:
+                yield offset, phrase
+            match = search(text, offset + 1)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Service-worker precache manifest for the built SystemCraft site.
+
+docs/service-worker.js declares its precache manifest on one line:
+
+    const PRECACHE_MANIFEST = {"version": "dev", "critical": [...], "entries": []};
+
+After the build this hook fills in the copy under site/:
+
+- entries: every critical URL plus the site's static assets (CSS,
+  JavaScript, fonts and images under assets/, stylesheets/ and
+  javascripts/), each with a hash of its content as its revision;
+- version: a hash of all the entries, which names the worker's runtime
+  caches.
+
+The worker stores each entry under its revision, so a returning visitor
+downloads only the files whose content changed. A critical URL that is not
+in the built site is logged as a warning (failing --strict builds) and left
+out, since a single missing file would make the worker's install fail.
+
+Enabled as a hook in mkdocs.yml:
+
+    hooks:
+      - scripts/precache_manifest.py
+
+Only the standard library is imported.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SERVICE_WORKER = Path('service-worker.js')
+# Directories whose static assets are precached, relative to the site
+ASSET_DIRS = ('assets', 'stylesheets', 'javascripts')
+ASSET_SUFFIXES = {'.css', '.js', '.svg', '.png', '.jpg', '.jpeg', '.webp', '.gif', '.ico',
+                  '.woff', '.woff2'}
+# Search language packs are only fetched for the configured languages
+EXCLUDED_ASSET_DIRS = (('assets', 'javascripts', 'lunr'),)
+
+MANIFEST_LINE = re.compile(r'^const PRECACHE_MANIFEST = (\{.*\});$', re.MULTILINE)
+
+log = logging.getLogger('mkdocs.hooks.precache_manifest')
+
+
+def revision(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=8).hexdigest()
+
+
+def url_file(site_dir: Path, url: str) -> Path:
+    """The file a site-relative URL is served from (index.html for directories)."""
+    path = site_dir / url.split('#', 1)[0].split('?', 1)[0]
+    if url.endswith('/') or url in ('', '.'):
+        path = path / 'index.html'
+    return path
+
+
+def asset_urls(site_dir: Path) -> List[str]:
+    """Site-relative URLs of the static assets to precache, sorted."""
+    urls = []
+    for directory in ASSET_DIRS:
+        for path in (site_dir / directory).rglob('*'):
+            relative = path.relative_to(site_dir)
+            if (path.suffix in ASSET_SUFFIXES and path.is_file()
+                    and not any(relative.parts[:len(excluded)] == excluded
+                                for excluded in EXCLUDED_ASSET_DIRS)):
+                urls.append(relative.as_posix())
+    return sorted(urls)
+
+
+def build_manifest(site_dir: Path, critical: List[str]) -> Tuple[Dict, List[str]]:
+    """(manifest, missing critical URLs) for a built site."""
+    missing = [url for url in critical if not url_file(site_dir, url).is_file()]
+    urls = [url for url in critical if url not in missing]
+    urls.extend(url for url in asset_urls(site_dir) if url not in urls)
+    entries = [{'url': url, 'revision': revision(url_file(site_dir, url))} for url in urls]
+
+    version = hashlib.blake2b(digest_size=6)
+    for entry in entries:
+        version.update(f"{entry['url']}\0{entry['revision']}\n".encode('utf-8'))
+    return {'version': version.hexdigest(), 'critical': critical, 'entries': entries}, missing
+
+
+def inject_manifest(site_dir: Path) -> Optional[Tuple[Dict, List[str]]]:
+    """Fill in the built service worker's manifest; None if there is no worker to fill."""
+    worker = site_dir / SERVICE_WORKER
+    if not worker.is_file():
+        return None
+    source = worker.read_text(encoding='utf-8')
+    match = MANIFEST_LINE.search(source)
+    if match is None:
+        return None
+    manifest, missing = build_manifest(site_dir, json.loads(match.group(1))['critical'])
+    line = f'const PRECACHE_MANIFEST = {json.dumps(manifest, separators=(",", ":"))};'
+    worker.write_text(source[:match.start()] + line + source[match.end():], encoding='utf-8')
+    return manifest, missing
+
+
+# MkDocs hook interface
+
+def on_post_build(config) -> None:
+    result = inject_manifest(Path(config['site_dir']))
+    if result is None:
+        log.info(f"No PRECACHE_MANIFEST in {SERVICE_WORKER}; precache manifest not written")
+        return
+    manifest, missing = result
+    for url in missing:
+        log.warning(f"Critical URL '{url}' in {SERVICE_WORKER} is not in the built site")
+    log.info(f"Precache manifest: {len(manifest['entries'])} files, "
+             f"cache version {manifest['version']}")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Query the SystemCraft pages by front-matter.
+
+Builds the columnar front-matter index (see frontmatter_index.py) from the
+page headers under docs/, or loads one written by the MkDocs build, and
+lists the pages matching every filter. A filter repeated, or given
+comma-separated values, matches any of them:
+
+    python scripts/query-frontmatter.py --tag L7 --difficulty advanced
+    python scripts/query-frontmatter.py --audience L6,L7 --content-type practice --json
+    python scripts/query-frontmatter.py --index site/frontmatter-index.json --tag behavioral
+    python scripts/query-frontmatter.py --values tags
+    python scripts/query-frontmatter.py --write site/frontmatter-index.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from doc_corpus import load_frontmatter
+from frontmatter_index import INDEXED_FIELDS, FrontMatterIndex, page_url
+
+DEFAULT_DOCS_DIR = Path('docs')
+
+
+def build_index(docs_dir: Path) -> FrontMatterIndex:
+    """Index the front-matter of every page under docs_dir, reading headers only."""
+    index = FrontMatterIndex()
+    for header in sorted(load_frontmatter(docs_dir), key=lambda header: header.path):
+        src_uri = header.path.relative_to(docs_dir).as_posix()
+        index.add(src_uri, page_url(src_uri), header.frontmatter)
+    return index
+
+
+def parse_filters(args) -> Dict[str, List[str]]:
+    filters = {}
+    for field in INDEXED_FIELDS:
+        given = getattr(args, field)
+        if given:
+            filters[field] = [value.strip() for item in given for value in item.split(',')
+                              if value.strip()]
+    return filters
+
+
+def main():
+    """List the pages whose front-matter matches the filters."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--docs-dir', type=Path, default=DEFAULT_DOCS_DIR,
+                        help=f'Index the pages under this directory (default: {DEFAULT_DOCS_DIR})')
+    source.add_argument('--index', type=Path, metavar='FILE',
+                        help='Query a written index (such as site/frontmatter-index.json)')
+    parser.add_argument('--tag', dest='tags', action='append', metavar='TAG',
+                        help='Pages tagged TAG')
+    parser.add_argument('--audience', action='append', help='Pages for this audience')
+    parser.add_argument('--difficulty', action='append', help='Pages of this difficulty')
+    parser.add_argument('--content-type', dest='content_type', action='append',
+                        help='Pages of this content type')
+    parser.add_argument('--status', action='append', help='Pages with this status')
+    parser.add_argument('--values', choices=INDEXED_FIELDS, metavar='FIELD',
+                        help='List the values of FIELD and their page counts instead')
+    parser.add_argument('--json', action='store_true', help='Print the matching pages as JSON')
+    parser.add_argument('--write', type=Path, metavar='FILE',
+                        help='Write the index to FILE (and query it, if filters are given)')
+    args = parser.parse_args()
+
+    try:
+        if args.index:
+            index = FrontMatterIndex.from_json(args.index.read_text(encoding='utf-8'))
+        else:
+            if not args.docs_dir.is_dir():
+                print(f"❌ {args.docs_dir} is not a directory")
+                sys.exit(1)
+            index = build_index(args.docs_dir)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not load {args.index or args.docs_dir}: {e}")
+        sys.exit(1)
+
+    if args.write:
+        args.write.parent.mkdir(parents=True, exist_ok=True)
+        args.write.write_text(index.to_json(), encoding='utf-8')
+        print(f"📇 Wrote the front-matter of {len(index)} pages to {args.write}")
+
+    if args.values:
+        counts = {value: bin(bitmap).count('1')
+                  for value, bitmap in index.fields.get(args.values, {}).items()}
+        for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+            print(f"{count:6}  {value}")
+        return
+
+    filters = parse_filters(args)
+    if args.write and not filters:
+        return
+
+    start = time.perf_counter()
+    rows = index.rows(index.select(filters))
+    microseconds = (time.perf_counter() - start) * 1e6
+
+    if args.json:
+        print(json.dumps([index.record(row) for row in rows], indent=2, ensure_ascii=False))
+        return
+    for row in rows:
+        title = index.columns['title'][row]
+        print(f"{index.paths[row]}" + (f"  —  {title}" if title else ''))
+    print()
+    print(f"🔎 {len(rows)} of {len(index)} pages match ({microseconds:.0f} µs)")
+
+
+if __name__ == '__main__':
+    main()
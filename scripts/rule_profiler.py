@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Per-rule timing and memory instrumentation for the SystemCraft validators.
+
+With --profile, a validator wraps its rule functions and per-file entry
+point so every call is timed and its findings counted, and each stage of
+the run records its wall time and tracemalloc peak. A report of the
+slowest rules and files is printed at the end, and the raw numbers can be
+written as JSON or as a speedscope trace (https://www.speedscope.app).
+
+Without --profile nothing is wrapped and tracemalloc stays off, so the
+validators run exactly the code they would without this module.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_TOP = 10
+
+
+class RuleStats:
+    """Accumulated calls, wall time and findings for one rule or file."""
+
+    __slots__ = ('calls', 'seconds', 'findings')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.findings = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'calls': self.calls, 'seconds': round(self.seconds, 6),
+                'findings': self.findings}
+
+
+def count_findings(result: Any) -> int:
+    """Number of findings in a rule result: a list, or a tuple led by one."""
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    return len(result) if isinstance(result, list) else 0
+
+
+class Profiler:
+    """Collects rule, file and stage measurements for one validator run."""
+
+    def __init__(self, validator: str):
+        self.validator = validator
+        self.rules: Dict[str, RuleStats] = {}
+        self.files: Dict[str, RuleStats] = {}
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.frames: Dict[str, int] = {}
+        self.events: List[Tuple[str, int, float]] = []
+        self.started = time.perf_counter()
+        self._stage: Optional[Tuple[str, float]] = None
+
+    def _frame(self, name: str) -> int:
+        return self.frames.setdefault(name, len(self.frames))
+
+    def _timed(self, func: Callable, stats: Callable[..., List[RuleStats]],
+               frame: Callable[..., str], findings: bool = True) -> Callable:
+        events = self.events
+        clock = time.perf_counter
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            frame_id = self._frame(frame(*args))
+            events.append(('O', frame_id, clock()))
+            start = clock()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                end = clock()
+                events.append(('C', frame_id, end))
+            found = count_findings(result) if findings else 0
+            for entry in stats(*args):
+                entry.calls += 1
+                entry.seconds += end - start
+                entry.findings += found
+            return result
+        return wrapper
+
+    def instrument(self, owner: Any, names: Iterable[str], findings: bool = True) -> None:
+        """Replace each named function of a module or class with a timed one.
+
+        Rules return their findings as a list; pass findings=False for
+        helpers whose return value is something else.
+        """
+        for name in names:
+            func = getattr(owner, name)
+            stats = self.rules.setdefault(func.__qualname__, RuleStats())
+            label = func.__qualname__
+            setattr(owner, name, self._timed(func, lambda *args, s=stats: (s,),
+                                             lambda *args, l=label: l, findings))
+
+    def instrument_files(self, owner: Any, name: str) -> None:
+        """Time a per-file entry point whose first argument has a .path."""
+        func = getattr(owner, name)
+
+        def stats(document, *args):
+            return (self.files.setdefault(str(document.path), RuleStats()),)
+
+        setattr(owner, name, self._timed(func, stats, lambda document, *args: str(document.path)))
+
+    def stage(self, name: str) -> None:
+        """Close the current stage, if any, and start measuring a new one."""
+        self._close_stage()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        self.events.append(('O', self._frame(f'stage: {name}'), start))
+        self._stage = (name, start)
+
+    def _close_stage(self) -> None:
+        if self._stage is None:
+            return
+        name, start = self._stage
+        end = time.perf_counter()
+        self.events.append(('C', self._frame(f'stage: {name}'), end))
+        _, peak = tracemalloc.get_traced_memory()
+        self.stages[name] = {'seconds': round(end - start, 6), 'peak_kb': peak // 1024}
+        self._stage = None
+
+    def finish(self) -> None:
+        """Close the last stage and stop tracing memory."""
+        self._close_stage()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'validator': self.validator,
+            'stages': self.stages,
+            'rules': {name: stats.to_dict() for name, stats in self.rules.items()},
+            'files': {path: stats.to_dict() for path, stats in self.files.items()},
+        }
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """The recorded calls as a speedscope evented profile."""
+        names = sorted(self.frames, key=self.frames.get)
+        end = self.events[-1][2] if self.events else self.started
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': self.validator,
+            'exporter': 'systemcraft rule_profiler',
+            'shared': {'frames': [{'name': name} for name in names]},
+            'profiles': [{
+                'type': 'evented',
+                'name': self.validator,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': round(end - self.started, 6),
+                'events': [{'type': kind, 'frame': frame, 'at': round(at - self.started, 6)}
+                           for kind, frame, at in self.events],
+            }],
+        }
+
+    def write(self, path: Path, format: str) -> None:
+        data = self.to_speedscope() if format == 'speedscope' else self.to_dict()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+
+    def report(self, top: int) -> None:
+        """Print stage totals and the top slowest rules and files."""
+        self.finish()
+        print()
+        print("=" * 60)
+        print(f"⏱️  Profile ({self.validator}):")
+        print("   Stages (wall time, tracemalloc peak):")
+        for name, stage in self.stages.items():
+            print(f"   {name:<28} {stage['seconds']:>9.3f}s {stage['peak_kb']:>9} KiB")
+        for title, table in (('rules', self.rules), ('files', self.files)):
+            ranked = sorted(table.items(), key=lambda item: item[1].seconds, reverse=True)[:top]
+            if not ranked:
+                continue
+            print()
+            print(f"   Slowest {title}:")
+            for name, stats in ranked:
+                print(f"   {stats.seconds:>9.3f}s {stats.calls:>7} calls {stats.findings:>6} findings  {name}")
+        print()
+        print("   Times include tracemalloc overhead; compare them with each other, not across runs.")
+
+
+class NullProfiler:
+    """Drop-in replacement used when profiling is disabled."""
+
+    def instrument(self, owner: Any, names: Iterable[str], findings: bool = True) -> None:
+        pass
+
+    def instrument_files(self, owner: Any, name: str) -> None:
+        pass
+
+    def stage(self, name: str) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+    def report(self, top: int) -> None:
+        pass
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the shared profiling command-line options."""
+    parser.add_argument('--profile', type=int, nargs='?', const=DEFAULT_TOP, metavar='N',
+                        help=f'Time each rule, file and stage and report the N slowest '
+                             f'(default N: {DEFAULT_TOP}); implies --jobs 1')
+    parser.add_argument('--profile-output', type=Path, metavar='FILE',
+                        help='With --profile, also write the measurements to FILE')
+    parser.add_argument('--profile-format', choices=['json', 'speedscope'], default='json',
+                        help='Format of --profile-output (default: json)')
+
+
+def open_profiler(args: argparse.Namespace, validator: str):
+    """Start the profiler selected on the command line.
+
+    Rules are timed in this process only, so profiling runs serially.
+    """
+    if args.profile is None:
+        return NullProfiler()
+    if getattr(args, 'jobs', 1) != 1:
+        print("ℹ️  --profile runs in a single process; ignoring --jobs")
+        args.jobs = 1
+    return Profiler(validator)
+
+
+def finish_profile(profiler, args: argparse.Namespace) -> None:
+    """Print the profile report and write --profile-output, if profiling."""
+    if args.profile is None:
+        return
+    profiler.report(args.profile)
+    if args.profile_output:
+        profiler.write(args.profile_output, args.profile_format)
+        print(f"💾 Profile written to {args.profile_output}")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Prefix-sharded client search index for the built SystemCraft site.
+
+The search plugin writes one search/search_index.json holding the full
+text of every section, and search-enhancements.js used to download all of
+it before answering the first query. This hook splits it, after the
+build, into files under search/shards/ that the script fetches on demand:
+
+- manifest.json: the tokenizer separator, the prefix length and the list
+  of shard prefixes (fetched first, and small);
+- one shard per token prefix (the first PREFIX_LENGTH characters), mapping
+  each token to the sections whose title, text or keywords contain it;
+- docs-N.json: title, location and a short snippet for DOCS_PER_CHUNK
+  sections, fetched only for the results shown;
+- facets.json: level, difficulty, topic and content type per section, as
+  one digit per section, for the result badges and filters.
+
+Text is tokenized here, with the separator configured for the search
+plugin, so the browser only splits the query. Search for "lead" fetches
+the "le" shard and matches every token starting with "lead".
+
+Enabled as a hook in mkdocs.yml:
+
+    hooks:
+      - scripts/search_shards.py
+
+Only the standard library is imported.
+"""
+
+import hashlib
+import html
+import json
+import logging
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+SEARCH_INDEX = Path('search') / 'search_index.json'
+SHARD_DIR = Path('search') / 'shards'
+PREFIX_LENGTH = 2
+# Shorter tokens are not indexed (the script ignores shorter query terms)
+MIN_TOKEN_LENGTH = 2
+DOCS_PER_CHUNK = 64
+SNIPPET_LENGTH = 160
+KEYWORDS_PER_DOC = 10
+# The search plugin's default separator, for indexes written without one
+DEFAULT_SEPARATOR = r'[\s\-]+'
+
+HTML_TAG = re.compile(r'<[^>]*>')
+SAFE_PREFIX = re.compile(r'[a-z0-9]+')
+# Same as extractKeywords() in search-enhancements.js
+KEYWORD = re.compile(r'\b\w{4,}\b', re.ASCII)
+COMMON_WORDS = {'that', 'this', 'with', 'from', 'they', 'have', 'will', 'been', 'were', 'said',
+                'what', 'your'}
+
+# Facet -> values; a section's facet is stored as the index of its value
+FACETS = {
+    'level': [None, 'l6', 'l7'],
+    'difficulty': [None, 'beginner', 'intermediate', 'advanced'],
+    'topic': [None, 'behavioral', 'system-design', 'coding', 'leadership'],
+    'contentType': ['guide', 'practice', 'template', 'example'],
+}
+
+# Token field in a shard posting: [title ids, text ids, keyword ids]
+TITLE, TEXT, KEYWORDS = range(3)
+
+log = logging.getLogger('mkdocs.hooks.search_shards')
+
+
+def shard_name(prefix: str) -> str:
+    """File name of a prefix's shard; non-alphanumeric prefixes are hex-encoded."""
+    if SAFE_PREFIX.fullmatch(prefix):
+        return f'{prefix}.json'
+    return f"u{prefix.encode('utf-8').hex()}.json"
+
+
+def plain_text(markup: str) -> str:
+    return ' '.join(html.unescape(HTML_TAG.sub(' ', markup)).split())
+
+
+def level(text: str) -> Optional[str]:
+    if 'l7' in text or 'principal' in text:
+        return 'l7'
+    if 'l6' in text or 'senior' in text:
+        return 'l6'
+    return None
+
+
+def difficulty(text: str) -> Optional[str]:
+    if 'beginner' in text or 'basic' in text:
+        return 'beginner'
+    if 'advanced' in text or 'expert' in text:
+        return 'advanced'
+    if 'intermediate' in text:
+        return 'intermediate'
+    return None
+
+
+def topic(location: str) -> Optional[str]:
+    for name in ('behavioral', 'system-design', 'coding', 'leadership'):
+        if name in location:
+            return name
+    return None
+
+
+def content_type(location: str) -> str:
+    for name in ('practice', 'template', 'example'):
+        if name in location:
+            return name
+    return 'guide'
+
+
+def keywords(text: str) -> List[str]:
+    return [word for word in KEYWORD.findall(text) if word not in COMMON_WORDS][:KEYWORDS_PER_DOC]
+
+
+class ShardBuilder:
+    """Tokens, section records and facets of one search index."""
+
+    def __init__(self, separator: str):
+        self.separator = separator
+        self.pattern = re.compile(separator)
+        # Prefix -> token -> [title ids, text ids, keyword ids]
+        self.shards: Dict[str, Dict[str, Tuple[Set[int], Set[int], Set[int]]]] = {}
+        self.docs: List[Dict[str, str]] = []
+        self.facets: Dict[str, List[int]] = {name: [] for name in FACETS}
+
+    def tokens(self, text: str) -> Set[str]:
+        """Index terms of a text, split the way the script splits a query."""
+        return {token.lower() for token in self.pattern.split(text)
+                if len(token) >= MIN_TOKEN_LENGTH}
+
+    def post(self, tokens, field: int, doc_id: int) -> None:
+        for token in tokens:
+            postings = self.shards.setdefault(token[:PREFIX_LENGTH], {})
+            postings.setdefault(token, (set(), set(), set()))[field].add(doc_id)
+
+    def add(self, doc: Dict) -> None:
+        doc_id = len(self.docs)
+        location = doc.get('location', '')
+        title = plain_text(doc.get('title', ''))
+        text = plain_text(doc.get('text', ''))
+        self.docs.append({'location': location, 'title': title, 'text': text[:SNIPPET_LENGTH]})
+
+        self.post(self.tokens(title), TITLE, doc_id)
+        self.post(self.tokens(text), TEXT, doc_id)
+        self.post(keywords(text.lower()), KEYWORDS, doc_id)
+
+        lowered = text.lower()
+        for name, value in (('level', level(lowered)), ('difficulty', difficulty(lowered)),
+                            ('topic', topic(location)), ('contentType', content_type(location))):
+            self.facets[name].append(FACETS[name].index(value))
+
+    def write(self, target: Path) -> Tuple[int, int]:
+        """Write the shard files into target (replacing it); returns (files, bytes)."""
+        if target.exists():
+            shutil.rmtree(target)
+        target.mkdir(parents=True)
+        outputs: Dict[str, str] = {}
+        for prefix, postings in self.shards.items():
+            outputs[shard_name(prefix)] = compact_json({
+                token: [sorted(ids) for ids in fields] for token, fields in sorted(postings.items())})
+        for start in range(0, len(self.docs), DOCS_PER_CHUNK):
+            outputs[f'docs-{start // DOCS_PER_CHUNK}.json'] = compact_json(
+                self.docs[start:start + DOCS_PER_CHUNK])
+        outputs['facets.json'] = compact_json({
+            'values': FACETS,
+            **{name: ''.join(map(str, values)) for name, values in self.facets.items()},
+        })
+
+        version = hashlib.blake2b(digest_size=8)
+        for name in sorted(outputs):
+            version.update(name.encode('utf-8'))
+            version.update(outputs[name].encode('utf-8'))
+        outputs['manifest.json'] = compact_json({
+            'version': version.hexdigest(),
+            'separator': self.separator,
+            'prefixLength': PREFIX_LENGTH,
+            'minTokenLength': MIN_TOKEN_LENGTH,
+            'docsPerChunk': DOCS_PER_CHUNK,
+            'docCount': len(self.docs),
+            'shards': sorted(self.shards),
+        })
+
+        size = 0
+        for name, data in outputs.items():
+            encoded = data.encode('utf-8')
+            (target / name).write_bytes(encoded)
+            size += len(encoded)
+        return len(outputs), size
+
+
+def compact_json(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def shard_search_index(site_dir: Path) -> Optional[Tuple[int, int, int]]:
+    """Shard site_dir's search index; (sections, files, bytes), or None without an index."""
+    source = site_dir / SEARCH_INDEX
+    if not source.is_file():
+        return None
+    index = json.loads(source.read_text(encoding='utf-8'))
+    separator = (index.get('config') or {}).get('separator') or DEFAULT_SEPARATOR
+    builder = ShardBuilder(separator)
+    for doc in index.get('docs', []):
+        builder.add(doc)
+    files, size = builder.write(site_dir / SHARD_DIR)
+    return len(builder.docs), files, size
+
+
+# MkDocs hook interface
+
+def on_post_build(config) -> None:
+    site_dir = Path(config['site_dir'])
+    result = shard_search_index(site_dir)
+    if result is None:
+        log.info(f"No {SEARCH_INDEX} in {site_dir}; search shards not written")
+        return
+    sections, files, size = result
+    original = (site_dir / SEARCH_INDEX).stat().st_size
+    log.info(f"Search index: {sections} sections in {files} files under {SHARD_DIR} "
+             f"({size:,} bytes in total, {original:,} in {SEARCH_INDEX})")
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic SystemCraft docs tree for benchmarking the validators.
+
+The generated tree mirrors the real site: section directories with an
+index page each, pages with YAML front-matter, headings, cross-links (some
+with #fragments, a few broken), code fences and images, plus an mkdocs.yml
+whose nav lists most - but not all - pages. Output is deterministic for a
+given page count and seed.
+
+Usage:
+    python scripts/synthetic_corpus.py OUTPUT_DIR --pages 1000 [--seed 42]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+from doc_corpus import slugify
+
+# Section directory -> (nav title, content type, primary tag)
+SECTIONS = {
+    'behavioral': ('Behavioral Leadership', 'guide', 'behavioral'),
+    'system-design': ('System Design', 'guide', 'system-design'),
+    'coding': ('Coding', 'tutorial', 'coding'),
+    'fundamentals': ('Fundamentals', 'reference', 'fundamentals'),
+    'practice': ('Practice', 'assessment', 'practice'),
+    'deep-dives': ('Deep Dives', 'guide', 'deep-dive'),
+    'portfolio': ('Portfolio', 'template', 'portfolio'),
+    'interactive': ('Interactive', 'tutorial', 'assessment'),
+}
+
+# Nav title, content type and primary tag for the home page
+HOME_SECTION = ('Home', 'overview', 'fundamentals')
+
+# Image every generated page may embed
+IMAGE_PATH = 'assets/diagram.png'
+
+TYPE_FIELDS = {
+    'guide': {'guide_type': 'strategic', 'deliverables': ['plan'], 'success_criteria': ['clarity']},
+    'tutorial': {'tutorial_type': 'hands-on', 'skills_taught': ['design'], 'validation_method': 'exercise'},
+    'reference': {'reference_type': 'lookup', 'lookup_optimized': True, 'comprehensive_coverage': True},
+    'assessment': {'assessment_type': 'self', 'scoring_method': 'rubric', 'feedback_type': 'written'},
+}
+
+SKILL_TAGS = ['leadership', 'technical-strategy', 'scalability', 'aws',
+              'algorithms', 'communication', 'decision-making', 'team-building']
+
+WORDS = (
+    'team service latency throughput customer ownership design tradeoff '
+    'scale partition replica cache queue stream region budget hiring roadmap '
+    'incident review metric dashboard stakeholder delivery architecture api '
+    'AWS platform migration consistency availability durability cost risk '
+    'mentor feedback decision principle story impact result clearly will be '
+    'simple advanced organization billion interview behavioral technical'
+).split()
+
+CODE_SNIPPETS = {
+    'python': 'def handle(request):\n    result = cache.get(request.key)\n    return result or load(request)\n',
+    'bash': 'aws s3 sync ./site s3://bucket\naws cloudfront create-invalidation --paths "/*"\n',
+    'yaml': 'service:\n  replicas: 3\n  region: us-east-1\n',
+}
+
+# Share of pages left out of the nav, and share of links that are broken
+UNLISTED_RATE = 0.1
+BROKEN_LINK_RATE = 0.01
+
+
+class Page:
+    """A generated page: its docs-relative path, title and heading texts."""
+
+    def __init__(self, path: str, section: str, title: str, headings: List[str]):
+        self.path = path
+        self.section = section
+        self.title = title
+        self.headings = headings
+
+
+def plan_pages(pages: int, rng: random.Random) -> List[Page]:
+    """Decide every page's path and headings up front so links can target them."""
+    sections = list(SECTIONS)
+    plan = [Page(f'{section}/index.md', section, f'{SECTIONS[section][0]} Overview',
+                 ['Overview', 'Key Takeaways'])
+            for section in sections]
+    for i in range(max(pages - len(plan) - 1, 0)):
+        section = sections[i % len(sections)]
+        topic = ' '.join(rng.choice(WORDS) for _ in range(3)).title()
+        headings = [f'{rng.choice(WORDS).title()} {rng.choice(WORDS)} {k}'
+                    for k in range(1, rng.randint(4, 9))]
+        plan.append(Page(f'{section}/page-{i:06d}.md', section,
+                         f'{topic} {i}', headings))
+    return plan
+
+
+def frontmatter(page: Page, rng: random.Random) -> str:
+    """YAML header; most are complete, some miss fields, a few are absent."""
+    roll = rng.random()
+    if roll < 0.05:
+        return ''
+    content_type, primary_tag = SECTIONS.get(page.section, HOME_SECTION)[1:]
+    fields = {
+        'title': page.title,
+        'summary': f'Practical guidance on {page.title.lower()} for engineering managers.',
+        'content_type': content_type,
+        'audience': ['L6', 'L7'],
+        'difficulty': rng.choice(['beginner', 'intermediate', 'advanced', 'expert']),
+        'estimated_time': f'{rng.randint(5, 45)} minutes',
+        'tags': [primary_tag, 'L6', rng.choice(SKILL_TAGS)],
+        'last_updated': '2025-01-15',
+        'version': '1.0',
+        'status': 'published',
+    }
+    fields.update(TYPE_FIELDS.get(content_type, {}))
+    if roll < 0.15:
+        for key in rng.sample(sorted(fields), 2):
+            del fields[key]
+
+    lines = ['---']
+    for key, value in fields.items():
+        if isinstance(value, list):
+            lines.append(f'{key}: [{", ".join(value)}]')
+        elif isinstance(value, bool):
+            lines.append(f'{key}: {str(value).lower()}')
+        else:
+            lines.append(f'{key}: "{value}"' if key != 'last_updated' else f'{key}: {value}')
+    lines.append('---')
+    return '\n'.join(lines) + '\n'
+
+
+def paragraph(rng: random.Random) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(30, 70))).capitalize() + '.'
+
+
+def link(source: Page, plan: List[Page], rng: random.Random) -> str:
+    """A relative markdown link from source to a random page."""
+    target = rng.choice(plan)
+    relative = os.path.relpath(target.path, os.path.dirname(source.path))
+    relative = Path(relative).as_posix()
+    if rng.random() < BROKEN_LINK_RATE:
+        relative = relative.replace('.md', '-missing.md')
+    elif rng.random() < 0.3:
+        relative += '#' + slugify(rng.choice(target.headings))
+    return f'[{target.title}]({relative})'
+
+
+def render_page(page: Page, plan: List[Page], rng: random.Random) -> str:
+    parts = [frontmatter(page, rng), f'# {page.title}\n', paragraph(rng) + '\n']
+    for heading in page.headings:
+        parts.append(f'## {heading}\n')
+        for _ in range(rng.randint(1, 3)):
+            links = ' '.join(link(page, plan, rng) for _ in range(rng.randint(0, 3)))
+            parts.append(f'{paragraph(rng)} {links}\n')
+        if rng.random() < 0.3:
+            language = rng.choice(sorted(CODE_SNIPPETS))
+            parts.append(f'```{language}\n{CODE_SNIPPETS[language]}```\n')
+        if rng.random() < 0.1:
+            image = Path(os.path.relpath(IMAGE_PATH, os.path.dirname(page.path))).as_posix()
+            parts.append(f'![{heading}]({image})\n')
+    return '\n'.join(parts)
+
+
+def render_mkdocs(plan: List[Page], rng: random.Random) -> str:
+    lines = [
+        'site_name: Synthetic SystemCraft',
+        'docs_dir: docs',
+        '',
+        'markdown_extensions:',
+        '  - toc:',
+        '      permalink: true',
+        '      slugify: !!python/object/apply:pymdownx.slugs.slugify',
+        '        kwds:',
+        '          case: lower',
+        '  - attr_list',
+        '',
+        'nav:',
+        '  - Home: index.md',
+    ]
+    for section, (title, _, _) in SECTIONS.items():
+        lines.append(f'  - {title}:')
+        for page in plan:
+            if page.section != section:
+                continue
+            if page.path.endswith('/index.md') or rng.random() >= UNLISTED_RATE:
+                lines.append(f'    - {page.title}: {page.path}')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_corpus(root: Path, pages: int, seed: int = 42) -> Tuple[int, int]:
+    """Write docs/ and mkdocs.yml for a synthetic site under root.
+
+    Any existing docs/ directory under root is replaced. Returns the number
+    of pages and total bytes written.
+    """
+    rng = random.Random(seed)
+    docs_dir = root / 'docs'
+    if docs_dir.exists():
+        shutil.rmtree(docs_dir)
+    plan = plan_pages(pages, rng)
+    (docs_dir / IMAGE_PATH).parent.mkdir(parents=True)
+    (docs_dir / IMAGE_PATH).write_bytes(b'')
+
+    total_bytes = 0
+    home = Page('index.md', '', 'Synthetic SystemCraft', ['Start Here'])
+    for page in [home] + plan:
+        path = docs_dir / page.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = render_page(page, plan, rng)
+        path.write_text(text, encoding='utf-8')
+        total_bytes += len(text.encode('utf-8'))
+
+    (root / 'mkdocs.yml').write_text(render_mkdocs(plan, rng), encoding='utf-8')
+    return len(plan) + 1, total_bytes
+
+
+def main():
+    """Generate a synthetic docs tree from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output', type=Path, help='Directory to write docs/ and mkdocs.yml into')
+    parser.add_argument('--pages', type=int, default=1000,
+                        help='Number of markdown pages to generate (default: 1000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if args.pages < 1:
+        print("ERROR: --pages must be at least 1")
+        sys.exit(1)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    pages, total_bytes = generate_corpus(args.output, args.pages, args.seed)
+    print(f"📝 Generated {pages} pages ({total_bytes / 1_000_000:.1f} MB) in {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Run the SystemCraft validators in a single process.
+
+One interpreter start-up, one import of the shared modules and one read of
+docs/ serve every selected check: the front-matter, link and content
+validators run in turn, and each page is read and tokenized only once
+(doc_corpus.read_document() memoizes it for the validators that follow).
+
+    python scripts/systemcraft-validate.py                      # all checks
+    python scripts/systemcraft-validate.py --checks frontmatter,links FILE...
+
+The options are those of the individual validators. Only the selected
+validators are imported, and the exit status is non-zero if any of them
+failed. Watch mode, SARIF output and --profile-output need a single check;
+use the validator's own script (or --checks with one name) for those.
+"""
+
+import argparse
+import sys
+from typing import List
+
+from validator_loader import load_validator
+from watch_mode import check_watch_arguments
+
+# Check name -> validator script, in the order the checks run
+CHECKS = {
+    'frontmatter': 'validate-frontmatter',
+    'links': 'check-links',
+    'content': 'validate-content',
+}
+
+
+def parse_checks(value: str) -> List[str]:
+    """The --checks list, in run order."""
+    names = {name.strip() for name in value.split(',') if name.strip()}
+    unknown = names - CHECKS.keys() - {'all'}
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown check(s): {', '.join(sorted(unknown))} (choose from {', '.join(CHECKS)}, all)")
+    if 'all' in names:
+        return list(CHECKS)
+    return [name for name in CHECKS if name in names]
+
+
+def check_combined_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace,
+                             checks: List[str]) -> None:
+    """Reject options that only make sense for one validator at a time."""
+    check_watch_arguments(parser, args)
+    if len(checks) == 1:
+        return
+    if args.watch:
+        parser.error('--watch runs a single check; select one with --checks')
+    if args.format == 'sarif':
+        parser.error('--format sarif writes one log per check; select one with --checks')
+    if args.profile_output:
+        parser.error('--profile-output writes one profile per check; select one with --checks')
+
+
+def main():
+    """Run the selected validators over docs/ in this process."""
+    # The checks are picked first, so that only their validators are imported
+    selector = argparse.ArgumentParser(add_help=False)
+    selector.add_argument('--checks', type=parse_checks, default=list(CHECKS))
+    selected, _ = selector.parse_known_args()
+    checks = selected.checks or list(CHECKS)
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--checks', type=parse_checks, default=list(CHECKS), metavar='NAME[,NAME...]',
+                        help=f"Checks to run, in this order: {', '.join(CHECKS)} or all (default: all)")
+    validators = {name: load_validator(CHECKS[name]) for name in checks}
+    for position, validator in enumerate(validators.values()):
+        validator.add_arguments(parser, common=position == 0)
+    args = parser.parse_args()
+    check_combined_arguments(parser, args, checks)
+
+    # As with the validators' own summaries, keep machine-readable stdout clean
+    log = sys.stdout if args.format == 'text' else sys.stderr
+    failed = []
+    for name, validator in validators.items():
+        try:
+            validator.main(args)
+        except SystemExit as e:
+            if e.code:
+                failed.append(name)
+        print(file=log)
+        sys.stdout.flush()
+
+    if failed:
+        print(f"❌ Failed checks: {', '.join(failed)}", file=log)
+        sys.exit(1)
+    print(f"✅ Passed checks: {', '.join(checks)}", file=log)
+
+if __name__ == '__main__':
+    main()
@@ -6,137 +6,263 @@ This script checks content quality, structure, and adherence to editorial guidel
 as defined in CONTENT_STANDARDS.md.
 """
 
+import argparse
 import re
-import yaml
 import sys
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-import markdown
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Set, Tuple
 
-def extract_frontmatter_and_content(file_path: Path) -> Tuple[Dict, str]:
-    """Extract YAML front-matter and content from markdown file."""
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        
-        if not content.startswith('---\n'):
-            return {}, content
-            
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:
-            return {}, content
-            
-        frontmatter = yaml.safe_load(parts[1])
-        main_content = parts[2]
-        
-        return frontmatter, main_content
+import doc_corpus
+import markdown_tokens
+import phrase_matcher
+from doc_corpus import Document, load_corpus
+from changed_files import add_change_arguments, changes_from_args
+from content_metrics import add_metrics_arguments, open_metrics
+from findings import (Finding, add_output_arguments, cached_findings, findings_with_rule,
+                      open_reporter)
+from markdown_tokens import MarkdownTokens, tokenize
+from phrase_matcher import PhraseMatcher, fold_case
+from rule_profiler import add_profile_arguments, finish_profile, open_profiler
+from validation_cache import add_cache_arguments, open_cache, ruleset_version
+from watch_mode import DocsWatcher, add_watch_arguments, check_watch_arguments, revalidate_files, watch
+from worker_pool import add_jobs_arguments, map_in_order
+
+# Section headings expected for each content type
+STRUCTURE_REQUIREMENTS = {
+    'guide': {
+        'required_sections': ['overview', 'learning', 'prerequisites', 'main content', 'summary', 'next steps'],
+        'suggested_headings': ['what you\'ll master', 'learning outcomes', 'prerequisites', 'key takeaways']
+    },
+    'tutorial': {
+        'required_sections': ['what you\'ll build', 'getting started', 'implementation', 'testing', 'next steps'],
+        'suggested_headings': ['tutorial overview', 'environment setup', 'core implementation']
+    },
+    'reference': {
+        'required_sections': ['quick reference', 'core concepts', 'patterns', 'examples'],
+        'suggested_headings': ['tl;dr', 'quick reference', 'essential information']
+    },
+    'assessment': {
+        'required_sections': ['overview', 'instructions', 'questions', 'scoring', 'results'],
+        'suggested_headings': ['assessment overview', 'scoring guide', 'results analysis']
+    }
+}
+
+# Writing quality phrases (matched case-insensitively, per line)
+PASSIVE_INDICATORS = ['is being', 'was being', 'will be', 'has been', 'have been']
+WEAK_PHRASES = ['it should be noted', 'it is important to note', 'please note', 'obviously', 'clearly']
+
+# Preferred term -> variations to flag (matched case-sensitively, per line)
+TERMINOLOGY_CHECKS = {
+    'L6': ['l6', 'level 6', 'level-6'],
+    'L7': ['l7', 'level 7', 'level-7'],
+    'Amazon': ['amazon.com', 'AMZN'],
+    'API': ['api', 'Api'],
+    'AWS': ['aws', 'Aws']
+}
+
+# Outdated technical references (matched case-insensitively), each with the
+# literal word it starts with
+OUTDATED_REFERENCES = [
+    ('python', r'python\s+[12]\.'),  # Python 2.x references
+    ('node', r'node\s+[0-9]\.'),     # Very old Node.js versions
+    ('java', r'java\s+[1-7]\.'),     # Old Java versions
+    ('aws', r'aws\s+cli\s+v1'),      # AWS CLI v1
+]
+
+GENERIC_LINK_TEXTS = {'here', 'click here', 'link', 'this', 'read more'}
+
+# Potentially exclusive term -> suggested alternative
+INCLUSIVE_LANGUAGE = {
+    'guys': 'everyone/folks/team',
+    'whitelist': 'allowlist',
+    'blacklist': 'blocklist',
+    'master/slave': 'primary/replica',
+    'sanity check': 'validation/verification',
+    'dummy': 'placeholder/sample',
+    'crazy': 'unexpected/unusual',
+    'insane': 'extreme/significant'
+}
+
+INCORRECT_PRINCIPLES = [
+    'customer first', 'take ownership', 'be curious', 'hire the best',
+    'high standards', 'disagree and commit', 'get results'
+]
+SCALE_INDICATORS = ['billion', 'petabyte', 'organization', 'platform', 'industry']
+INTERVIEW_ELEMENTS = ['star', 'behavioral', 'technical', 'system design']
+COMPLEX_INDICATORS = ['advanced', 'expert', 'sophisticated', 'complex', 'cutting-edge']
+SIMPLE_INDICATORS = ['basic', 'simple', 'introduction', 'getting started', 'beginner']
+
+# Rule ids reported with each finding: id -> (severity, description)
+RULES = {
+    'frontmatter-missing': ('warning', 'Content files need YAML front-matter to be checked'),
+    'structure': ('warning', 'Content uses the recommended headings for its type'),
+    'writing-quality': ('warning', 'Active voice, no weak phrases, consistent terminology'),
+    'technical-accuracy': ('warning', 'No outdated references; code examples follow conventions'),
+    'accessibility': ('warning', 'Descriptive link text, image alt text and inclusive language'),
+    'amazon-context': ('warning', 'Leadership Principles and L6/L7 context are used accurately'),
+    'metadata-consistency': ('warning', 'Front-matter title, time and difficulty match the content'),
+}
+
+# Messages that point at a line of the page body start with this
+LINE_PREFIX_PATTERN = re.compile(r'^Line (\d+): ')
+
+def term_spellings() -> Dict[str, List[str]]:
+    """Case-folded form of each terminology term and variation -> exact spellings."""
+    spellings: Dict[str, List[str]] = {}
+    for correct_term, variations in TERMINOLOGY_CHECKS.items():
+        for spelling in [correct_term] + variations:
+            spellings.setdefault(spelling.lower(), []).append(spelling)
+    return spellings
+
+def outdated_triggers() -> Dict[str, List[re.Pattern]]:
+    """Trigger word -> compiled outdated-reference patterns starting with it."""
+    triggers: Dict[str, List[re.Pattern]] = {}
+    for trigger, pattern in OUTDATED_REFERENCES:
+        triggers.setdefault(trigger, []).append(re.compile(pattern, re.IGNORECASE))
+    return triggers
+
+TERM_SPELLINGS = term_spellings()
+OUTDATED_TRIGGERS = outdated_triggers()
+
+# Every phrase table compiled into one matcher, so each document is scanned
+# once and the hits are dispatched to the rules that use them
+RULE_PHRASES = PhraseMatcher(
+    PASSIVE_INDICATORS + WEAK_PHRASES + list(INCLUSIVE_LANGUAGE) + INCORRECT_PRINCIPLES
+    + SCALE_INDICATORS + INTERVIEW_ELEMENTS + COMPLEX_INDICATORS + SIMPLE_INDICATORS
+    + [heading for requirements in STRUCTURE_REQUIREMENTS.values()
+       for heading in requirements['suggested_headings']]
+    + list(TERM_SPELLINGS) + list(OUTDATED_TRIGGERS))
+
+class ContentScan:
+    """Rule phrases found in a document's content, from a single pass.
+
+    The content scanned is the prose token stream, so phrases inside code
+    are ignored. Phrases are matched on the case-folded text. Terminology hits are then
+    confirmed case-sensitively against the original text, and outdated
+    reference patterns are only tried where their trigger word occurs.
+    """
+
+    def __init__(self, content: str):
+        # Line number -> case-folded phrases on that line
+        self.lines: Dict[int, Set[str]] = {}
+        # Line number -> exact terminology spellings on that line
+        self.terms: Dict[int, Set[str]] = {}
+        # Case-folded phrases anywhere in the content
+        self.phrases: Set[str] = set()
+        # Outdated reference patterns that matched
+        self.outdated: Set[str] = set()
         
-    except Exception as e:
+        folded = fold_case(content)
+        line, previous = 1, 0
+        for offset, phrase in RULE_PHRASES.finditer(folded):
+            line += folded.count('\n', previous, offset)
+            previous = offset
+            self.phrases.add(phrase)
+            self.lines.setdefault(line, set()).add(phrase)
+            for spelling in TERM_SPELLINGS.get(phrase, ()):
+                if content.startswith(spelling, offset):
+                    self.terms.setdefault(line, set()).add(spelling)
+            for pattern in OUTDATED_TRIGGERS.get(phrase, ()):
+                if pattern.match(content, offset):
+                    self.outdated.add(pattern.pattern)
+
+def content_scan(content: str) -> ContentScan:
+    """Scan the prose of content, for rules called without a shared scan."""
+    return ContentScan(tokenize(content).prose_text)
+
+def extract_frontmatter_and_content(file_path: Path, document: Optional[Document] = None) -> Tuple[Dict, str]:
+    """Extract YAML front-matter and content from markdown file."""
+    if document is None:
+        document = Document.from_path(file_path)
+    
+    if document.read_error or document.frontmatter_error:
         return {}, ""
+    
+    if not document.has_frontmatter:
+        return {}, document.body
+    
+    return document.frontmatter, document.body
 
-def validate_content_structure(frontmatter: Dict, content: str, file_path: Path) -> List[str]:
+def validate_content_structure(frontmatter: Dict, content: str, file_path: Path,
+                               scan: Optional[ContentScan] = None) -> List[str]:
     """Validate content follows proper structure for its type."""
     errors = []
     content_type = frontmatter.get('content_type', 'unknown')
     
     # Check for required sections based on content type
-    structure_requirements = {
-        'guide': {
-            'required_sections': ['overview', 'learning', 'prerequisites', 'main content', 'summary', 'next steps'],
-            'suggested_headings': ['what you\'ll master', 'learning outcomes', 'prerequisites', 'key takeaways']
-        },
-        'tutorial': {
-            'required_sections': ['what you\'ll build', 'getting started', 'implementation', 'testing', 'next steps'],
-            'suggested_headings': ['tutorial overview', 'environment setup', 'core implementation']
-        },
-        'reference': {
-            'required_sections': ['quick reference', 'core concepts', 'patterns', 'examples'],
-            'suggested_headings': ['tl;dr', 'quick reference', 'essential information']
-        },
-        'assessment': {
-            'required_sections': ['overview', 'instructions', 'questions', 'scoring', 'results'],
-            'suggested_headings': ['assessment overview', 'scoring guide', 'results analysis']
-        }
-    }
-    
-    if content_type in structure_requirements:
-        requirements = structure_requirements[content_type]
-        content_lower = content.lower()
+    if content_type in STRUCTURE_REQUIREMENTS:
+        requirements = STRUCTURE_REQUIREMENTS[content_type]
+        if scan is None:
+            scan = content_scan(content)
         
         # Check for suggested headings
-        found_headings = 0
-        for heading in requirements['suggested_headings']:
-            if heading in content_lower:
-                found_headings += 1
+        found_headings = sum(1 for heading in requirements['suggested_headings']
+                             if heading in scan.phrases)
         
         if found_headings < len(requirements['suggested_headings']) // 2:
             errors.append(f"Content may be missing recommended structure for {content_type}")
     
     return errors
 
-def validate_writing_quality(content: str, file_path: Path) -> List[str]:
+def validate_writing_quality(content: str, file_path: Path,
+                             scan: Optional[ContentScan] = None,
+                             tokens: Optional[MarkdownTokens] = None) -> List[str]:
     """Validate writing quality and style guidelines."""
     errors = []
-    
-    # Check for common writing issues
-    lines = content.split('\n')
-    
-    for i, line in enumerate(lines, 1):
-        line_lower = line.lower().strip()
-        
-        # Check for passive voice (basic detection)
-        passive_indicators = ['is being', 'was being', 'will be', 'has been', 'have been']
-        if any(indicator in line_lower for indicator in passive_indicators):
-            if i < 20:  # Only check first 20 lines to avoid false positives
-                errors.append(f"Line {i}: Consider using active voice instead of passive")
-        
-        # Check for weak phrases
-        weak_phrases = ['it should be noted', 'it is important to note', 'please note', 'obviously', 'clearly']
-        for phrase in weak_phrases:
-            if phrase in line_lower:
-                errors.append(f"Line {i}: Avoid weak phrase '{phrase}'")
+    if tokens is None:
+        tokens = tokenize(content)
+    if scan is None:
+        scan = ContentScan(tokens.prose_text)
+    
+    # Check for common writing issues (code lines are blank in the prose stream)
+    for i, line in enumerate(tokens.prose_lines, 1):
+        found = scan.lines.get(i)
+        if found:
+            # Check for passive voice (basic detection)
+            if not found.isdisjoint(PASSIVE_INDICATORS):
+                if i < 20:  # Only check first 20 lines to avoid false positives
+                    errors.append(f"Line {i}: Consider using active voice instead of passive")
+            
+            # Check for weak phrases
+            for phrase in WEAK_PHRASES:
+                if phrase in found:
+                    errors.append(f"Line {i}: Avoid weak phrase '{phrase}'")
         
         # Check for overly complex sentences
         if len(line.split()) > 30:
             errors.append(f"Line {i}: Consider breaking down long sentence for readability")
     
     # Check for consistent terminology
-    terminology_checks = {
-        'L6': ['l6', 'level 6', 'level-6'],
-        'L7': ['l7', 'level 7', 'level-7'],
-        'Amazon': ['amazon.com', 'AMZN'],
-        'API': ['api', 'Api'],
-        'AWS': ['aws', 'Aws']
-    }
-    
-    for correct_term, variations in terminology_checks.items():
-        content_lines = content.split('\n')
-        for i, line in enumerate(content_lines, 1):
+    term_lines = sorted(scan.terms)
+    for correct_term, variations in TERMINOLOGY_CHECKS.items():
+        for i in term_lines:
+            found = scan.terms[i]
+            if correct_term in found:
+                continue
             for variation in variations:
-                if variation in line and correct_term not in line:
+                if variation in found:
                     errors.append(f"Line {i}: Use consistent terminology '{correct_term}' instead of '{variation}'")
     
     return errors
 
-def validate_technical_accuracy(frontmatter: Dict, content: str, file_path: Path) -> List[str]:
+def validate_technical_accuracy(frontmatter: Dict, content: str, file_path: Path,
+                                tokens: Optional[MarkdownTokens] = None,
+                                scan: Optional[ContentScan] = None) -> List[str]:
     """Validate technical content for accuracy and completeness."""
     errors = []
+    if tokens is None:
+        tokens = tokenize(content)
     
     # Check for outdated information
-    outdated_patterns = [
-        r'python\s+[12]\.',  # Python 2.x references
-        r'node\s+[0-9]\.',   # Very old Node.js versions
-        r'java\s+[1-7]\.',   # Old Java versions
-        r'aws\s+cli\s+v1',  # AWS CLI v1
-    ]
-    
-    for pattern in outdated_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
+    if scan is None:
+        scan = ContentScan(tokens.prose_text)
+    for _, pattern in OUTDATED_REFERENCES:
+        if pattern in scan.outdated:
             errors.append(f"Potentially outdated technical reference: {pattern}")
     
     # Check for proper code examples
-    code_blocks = re.findall(r'```(\w+)?\n(.*?)```', content, re.DOTALL)
-    for i, (language, code) in enumerate(code_blocks):
+    for i, (language, code, _) in enumerate(tokens.code_blocks):
         if language:
             # Check for common code issues
             if language.lower() == 'python':
@@ -166,48 +292,35 @@ def validate_technical_accuracy(frontmatter: Dict, content: str, file_path: Path
     
     return errors
 
-def validate_accessibility(content: str, file_path: Path) -> List[str]:
+def validate_accessibility(content: str, file_path: Path,
+                           scan: Optional[ContentScan] = None,
+                           tokens: Optional[MarkdownTokens] = None) -> List[str]:
     """Validate content for accessibility and inclusion."""
     errors = []
+    if tokens is None:
+        tokens = tokenize(content)
+    if scan is None:
+        scan = ContentScan(tokens.prose_text)
     
     # Check for descriptive link text
-    links = re.findall(r'\[([^\]]*)\]\([^)]+\)', content)
-    for link_text in links:
-        generic_texts = {'here', 'click here', 'link', 'this', 'read more'}
-        if link_text.lower().strip() in generic_texts:
-            errors.append(f"Non-descriptive link text: '{link_text}'")
+    for link in tokens.inline_links:
+        if link.text.lower().strip() in GENERIC_LINK_TEXTS:
+            errors.append(f"Non-descriptive link text: '{link.text}'")
     
     # Check for alt text on images
-    images = re.findall(r'!\[([^\]]*)\]\([^)]+\)', content)
-    for alt_text in images:
-        if not alt_text.strip():
+    for image in tokens.images:
+        if not image.text.strip():
             errors.append("Image missing alt text for accessibility")
     
     # Check for inclusive language
-    potentially_exclusive = [
-        'guys', 'whitelist', 'blacklist', 'master/slave', 'sanity check',
-        'dummy', 'crazy', 'insane'
-    ]
-    
-    content_lower = content.lower()
-    for term in potentially_exclusive:
-        if term in content_lower:
-            suggestions = {
-                'guys': 'everyone/folks/team',
-                'whitelist': 'allowlist',
-                'blacklist': 'blocklist',
-                'master/slave': 'primary/replica',
-                'sanity check': 'validation/verification',
-                'dummy': 'placeholder/sample',
-                'crazy': 'unexpected/unusual',
-                'insane': 'extreme/significant'
-            }
-            suggestion = suggestions.get(term, 'more inclusive alternative')
+    for term, suggestion in INCLUSIVE_LANGUAGE.items():
+        if term in scan.phrases:
             errors.append(f"Consider replacing '{term}' with {suggestion}")
     
     return errors
 
-def validate_amazon_context(frontmatter: Dict, content: str, file_path: Path) -> List[str]:
+def validate_amazon_context(frontmatter: Dict, content: str, file_path: Path,
+                            scan: Optional[ContentScan] = None) -> List[str]:
     """Validate Amazon-specific context and accuracy."""
     errors = []
     
@@ -220,52 +333,50 @@ def validate_amazon_context(frontmatter: Dict, content: str, file_path: Path) ->
         'success and scale bring broad responsibility'
     }
     
-    content_lower = content.lower()
+    if scan is None:
+        scan = content_scan(content)
     
     # Check for incorrect principle names
-    incorrect_principles = [
-        'customer first', 'take ownership', 'be curious', 'hire the best',
-        'high standards', 'disagree and commit', 'get results'
-    ]
-    
-    for incorrect in incorrect_principles:
-        if incorrect in content_lower:
+    for incorrect in INCORRECT_PRINCIPLES:
+        if incorrect in scan.phrases:
             errors.append(f"Potentially incorrect Leadership Principle reference: '{incorrect}'")
     
     # Check for appropriate scale references
     audience = frontmatter.get('audience', [])
     if 'L7' in audience:
         # L7 content should mention large scale
-        scale_indicators = ['billion', 'petabyte', 'organization', 'platform', 'industry']
-        if not any(indicator in content_lower for indicator in scale_indicators):
+        if not any(indicator in scan.phrases for indicator in SCALE_INDICATORS):
             errors.append("L7 content should include organizational/platform scale examples")
     
     # Check for interview context
     if 'interview' in str(file_path).lower():
-        interview_elements = ['star', 'behavioral', 'technical', 'system design']
-        found_elements = sum(1 for element in interview_elements if element in content_lower)
+        found_elements = sum(1 for element in INTERVIEW_ELEMENTS if element in scan.phrases)
         if found_elements == 0:
             errors.append("Interview content should reference relevant interview elements")
     
     return errors
 
-def validate_metadata_consistency(frontmatter: Dict, content: str, file_path: Path) -> List[str]:
+def validate_metadata_consistency(frontmatter: Dict, content: str, file_path: Path,
+                                  tokens: Optional[MarkdownTokens] = None,
+                                  scan: Optional[ContentScan] = None) -> List[str]:
     """Validate that metadata is consistent with content."""
     errors = []
+    if tokens is None:
+        tokens = tokenize(content)
     
     # Check title consistency
     title = frontmatter.get('title', '')
-    first_heading = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-    if first_heading:
-        content_title = first_heading.group(1).strip()
+    title_heading = tokens.title_heading
+    if title_heading:
+        content_title = title_heading.strip()
         # Remove emojis for comparison
         content_title_clean = re.sub(r'[📚🎯🏗️🔧⚡🛡️🎬🚀📊🔍📈✅🎓💡⚠️📋🗓️🔄📝🎉🌐🛠️]', '', content_title).strip()
         if title.lower() != content_title_clean.lower():
             errors.append(f"Title mismatch: metadata='{title}' vs content='{content_title_clean}'")
     
-    # Check estimated time vs content length
+    # Check estimated time vs content length (prose only, as in the metrics)
     estimated_time = frontmatter.get('estimated_time', '')
-    word_count = len(content.split())
+    word_count = len(tokens.prose_text.split())
     
     if estimated_time:
         # Extract minutes from time estimate
@@ -281,12 +392,10 @@ def validate_metadata_consistency(frontmatter: Dict, content: str, file_path: Pa
     # Check difficulty vs content complexity
     difficulty = frontmatter.get('difficulty', '')
     if difficulty:
-        complex_indicators = ['advanced', 'expert', 'sophisticated', 'complex', 'cutting-edge']
-        simple_indicators = ['basic', 'simple', 'introduction', 'getting started', 'beginner']
-        
-        content_lower = content.lower()
-        has_complex = any(indicator in content_lower for indicator in complex_indicators)
-        has_simple = any(indicator in content_lower for indicator in simple_indicators)
+        if scan is None:
+            scan = ContentScan(tokens.prose_text)
+        has_complex = any(indicator in scan.phrases for indicator in COMPLEX_INDICATORS)
+        has_simple = any(indicator in scan.phrases for indicator in SIMPLE_INDICATORS)
         
         if difficulty in ['beginner', 'intermediate'] and has_complex and not has_simple:
             errors.append(f"Difficulty '{difficulty}' may not match complex content")
@@ -295,27 +404,55 @@ def validate_metadata_consistency(frontmatter: Dict, content: str, file_path: Pa
     
     return errors
 
-def validate_content_file(file_path: Path) -> List[str]:
+def body_findings(rule: str, messages: List[str], body_start_line: int) -> List[Finding]:
+    """Tag a rule's messages, mapping 'Line N:' body lines to file lines."""
+    findings = []
+    for message in messages:
+        match = LINE_PREFIX_PATTERN.match(message)
+        line = int(match.group(1)) + body_start_line - 1 if match else None
+        findings.append(Finding(rule, message, line))
+    return findings
+
+def validate_content_file(file_path: Path, document: Optional[Document] = None) -> List[Finding]:
     """Validate a single content file against all standards."""
     all_errors = []
     
+    if document is None:
+        document = Document.from_path(file_path)
+    
     # Extract front-matter and content
-    frontmatter, content = extract_frontmatter_and_content(file_path)
+    frontmatter, content = extract_frontmatter_and_content(file_path, document)
     
     if not frontmatter:
-        all_errors.append("Missing YAML front-matter")
+        all_errors.append(Finding('frontmatter-missing', "Missing YAML front-matter", 1))
         return all_errors
     
-    # Run all validation checks
-    all_errors.extend(validate_content_structure(frontmatter, content, file_path))
-    all_errors.extend(validate_writing_quality(content, file_path))
-    all_errors.extend(validate_technical_accuracy(frontmatter, content, file_path))
-    all_errors.extend(validate_accessibility(content, file_path))
-    all_errors.extend(validate_amazon_context(frontmatter, content, file_path))
-    all_errors.extend(validate_metadata_consistency(frontmatter, content, file_path))
+    # Run all validation checks, sharing the document's tokens and one
+    # phrase scan of its prose
+    tokens = document.tokens
+    scan = ContentScan(tokens.prose_text)
+    start = document.body_start_line
+    all_errors.extend(findings_with_rule(
+        'structure', validate_content_structure(frontmatter, content, file_path, scan)))
+    all_errors.extend(body_findings(
+        'writing-quality', validate_writing_quality(content, file_path, scan, tokens), start))
+    all_errors.extend(findings_with_rule(
+        'technical-accuracy', validate_technical_accuracy(frontmatter, content, file_path,
+                                                          tokens, scan)))
+    all_errors.extend(findings_with_rule(
+        'accessibility', validate_accessibility(content, file_path, scan, tokens)))
+    all_errors.extend(findings_with_rule(
+        'amazon-context', validate_amazon_context(frontmatter, content, file_path, scan)))
+    all_errors.extend(findings_with_rule(
+        'metadata-consistency', validate_metadata_consistency(frontmatter, content, file_path,
+                                                              tokens, scan)))
     
     return all_errors
 
+def validate_document(document: Document) -> List[Finding]:
+    """Validate one corpus document (process-pool entry point)."""
+    return validate_content_file(document.path, document)
+
 def should_exclude_file(file_path: Path) -> bool:
     """Check if file should be excluded from content validation."""
     excluded_patterns = [
@@ -329,65 +466,139 @@ def should_exclude_file(file_path: Path) -> bool:
     
     return any(pattern in str(file_path) for pattern in excluded_patterns)
 
-def main():
-    """Validate all markdown files for content standards compliance."""
+def add_arguments(parser: argparse.ArgumentParser, common: bool = True) -> None:
+    """Register this validator's command-line options.
+
+    With common=False only the options the other validators lack are added,
+    for a parser that already has the shared ones.
+    """
+    if common:
+        add_change_arguments(parser)
+        add_cache_arguments(parser)
+        add_jobs_arguments(parser)
+        add_profile_arguments(parser)
+        add_output_arguments(parser)
+        add_watch_arguments(parser)
+    add_metrics_arguments(parser)
+
+def main(args: Optional[argparse.Namespace] = None):
+    """Validate all markdown files for content standards compliance.
+
+    args is given when the validator runs inside systemcraft-validate.py;
+    otherwise the command line is parsed here.
+    """
+    if args is None:
+        parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+        add_arguments(parser)
+        args = parser.parse_args()
+        check_watch_arguments(parser, args)
+    
+    profiler = open_profiler(args, 'content')
+    profiler.instrument(ContentScan, ['__init__'], findings=False)
+    profiler.instrument(sys.modules[__name__], [
+        'validate_content_structure', 'validate_writing_quality',
+        'validate_technical_accuracy', 'validate_accessibility', 'validate_amazon_context',
+        'validate_metadata_consistency'])
+    profiler.instrument(doc_corpus, ['parse_frontmatter'], findings=False)
+    profiler.instrument_files(sys.modules[__name__], 'validate_document')
+    
     docs_dir = Path('docs')
     if not docs_dir.exists():
         print("ERROR: docs directory not found")
         sys.exit(1)
     
-    print("📋 Validating content standards compliance...")
-    print()
+    reporter = open_reporter(args, 'content', RULES)
+    reporter.progress("📋 Validating content standards compliance...")
+    reporter.progress()
     
-    all_errors = []
+    total_issues = 0
     files_checked = 0
     files_with_errors = 0
     
-    for md_file in docs_dir.rglob('*.md'):
-        # Skip excluded files
-        if should_exclude_file(md_file):
-            continue
-            
+    watcher = DocsWatcher(docs_dir) if args.watch else None
+    results = {}
+    
+    profiler.stage('load')
+    # Front-matter and content rules only look at the file itself, so
+    # changed-files mode needs no reverse-dependency expansion here
+    changes = changes_from_args(args, docs_dir)
+    corpus = load_corpus(docs_dir, changes.modified if changes else None)
+    ruleset = ruleset_version(Path(__file__), Path(doc_corpus.__file__), Path(markdown_tokens.__file__),
+                              Path(phrase_matcher.__file__))
+    cache = open_cache(args, 'content', ruleset)
+    metrics = open_metrics(args, docs_dir)
+    
+    # Skip excluded files
+    documents = [document for document in corpus if not should_exclude_file(document.path)]
+    cached = {document.path: cached_findings(cache.lookup(document.path, document.content_hash))
+              for document in documents}
+    pending = [document for document in documents if cached[document.path] is None]
+    validated = map_in_order(validate_document, pending, args.jobs)
+    
+    profiler.stage('validate')
+    for document in documents:
+        md_file = document.path
         files_checked += 1
-        errors = validate_content_file(md_file)
+        errors = cached[md_file]
+        if errors is None:
+            errors = next(validated)
+            cache.store(md_file, document.content_hash, errors)
         
         if errors:
             files_with_errors += 1
-            print(f"❌ {md_file}")
-            for error in errors:
-                print(f"   • {error}")
-            print()
-            all_errors.extend([f"{md_file}: {error}" for error in errors])
-        else:
-            print(f"✅ {md_file}")
+            total_issues += len(errors)
+        reporter.file_checked(md_file, errors)
+        if watcher:
+            results[md_file] = errors
+    
+    if changes is None:
+        cache.prune(corpus.documents)
+    cache.close()
+    
+    profiler.stage('metrics')
+    # Metrics cover every page, including those excluded from validation
+    for document in corpus:
+        metrics.add(document)
+    metrics.finish(full_run=changes is None)
+    finish_profile(profiler, args)
     
     # Summary
     print()
     print("=" * 60)
     print(f"📊 Content Validation Summary:")
     print(f"   Files checked: {files_checked}")
+    print(f"   Results reused from cache: {cache.hits}")
     print(f"   Files with issues: {files_with_errors}")
     print(f"   Files passing: {files_checked - files_with_errors}")
-    print(f"   Total issues: {len(all_errors)}")
-    
-    if all_errors:
-        print()
-        print("🎯 Content Quality Recommendations:")
-        print("1. Review and fix writing quality issues")
-        print("2. Ensure technical accuracy and current information")
-        print("3. Improve accessibility with descriptive links and alt text")
-        print("4. Verify Amazon-specific context and terminology")
-        print("5. Align metadata with actual content")
-        print("6. Refer to CONTENT_STANDARDS.md for detailed guidelines")
+    print(f"   Total issues: {total_issues}")
+    reporter.close()
+    
+    if watcher:
+        def check_file(md_file: Path) -> List[Finding]:
+            return validate_document(Document.from_path(md_file))
+        watch(watcher, partial(revalidate_files, results=results, validate=check_file,
+                               excluded=should_exclude_file, reporter=reporter),
+              args.watch_interval)
+        return
+    
+    if total_issues:
+        reporter.progress()
+        reporter.progress("🎯 Content Quality Recommendations:")
+        reporter.progress("1. Review and fix writing quality issues")
+        reporter.progress("2. Ensure technical accuracy and current information")
+        reporter.progress("3. Improve accessibility with descriptive links and alt text")
+        reporter.progress("4. Verify Amazon-specific context and terminology")
+        reporter.progress("5. Align metadata with actual content")
+        reporter.progress("6. Refer to CONTENT_STANDARDS.md for detailed guidelines")
         
         # Don't fail the build for content quality issues, just warn
-        print()
-        print("⚠️  Content quality issues found but not blocking build.")
-        print("   Please address these issues to improve content quality.")
+        reporter.progress()
+        reporter.progress("⚠️  Content quality issues found but not blocking build.")
+        reporter.progress("   Please address these issues to improve content quality.")
     else:
-        print()
-        print("🎉 All content validation passed!")
-        print("   Content meets SystemCraft quality standards")
+        reporter.progress()
+        reporter.progress("🎉 All content validation passed!")
+        reporter.progress("   Content meets SystemCraft quality standards")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
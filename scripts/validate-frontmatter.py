@@ -6,13 +6,24 @@ This script ensures all markdown files have complete and valid YAML front-matter
 metadata as defined in CONTENT_STANDARDS.md.
 """
 
-import yaml
+import argparse
 import sys
 import re
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple, Union
 from datetime import datetime
 
+import doc_corpus
+from doc_corpus import Document, FrontMatter, load_frontmatter, read_frontmatter
+from changed_files import add_change_arguments, changes_from_args
+from findings import (Finding, add_output_arguments, cached_findings, findings_with_rule,
+                      open_reporter)
+from rule_profiler import add_profile_arguments, finish_profile, open_profiler
+from validation_cache import add_cache_arguments, open_cache, ruleset_version
+from watch_mode import DocsWatcher, add_watch_arguments, check_watch_arguments, revalidate_files, watch
+from worker_pool import add_jobs_arguments, map_in_order
+
 # Required fields for all content types
 REQUIRED_FIELDS = {
     'title', 'summary', 'content_type', 'audience', 
@@ -55,26 +66,37 @@ FORMAT_TAGS = {
     'framework', 'reference'
 }
 
-def extract_frontmatter(file_path: Path) -> Optional[Dict]:
-    """Extract YAML front-matter from markdown file."""
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        
-        # Check for front-matter existence
-        if not content.startswith('---\n'):
-            return None
-            
-        # Extract front-matter
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:
-            return None
-            
-        return yaml.safe_load(parts[1])
-        
-    except Exception as e:
-        print(f"Error reading {file_path}: {str(e)}")
+# Rule ids reported with each finding: id -> (severity, description)
+RULES = {
+    'frontmatter-missing': ('error', 'Files must start with a valid YAML front-matter block'),
+    'required-fields': ('error', 'All required and content-type-specific fields are present'),
+    'field-values': ('error', 'Field values use the allowed formats and vocabularies'),
+    'tag-taxonomy': ('error', 'Tags follow the primary/level/skill taxonomy'),
+    'content-consistency': ('error', 'content_type matches the file location'),
+}
+
+# Line findings are reported at: the header opens the file
+FRONTMATTER_LINE = 1
+
+def extract_frontmatter(file_path: Path,
+                        document: Optional[Union[Document, FrontMatter]] = None) -> Optional[Dict]:
+    """Extract YAML front-matter from markdown file.
+
+    Only the header is read from disk unless an already loaded document is given.
+    """
+    if document is None:
+        document = read_frontmatter(file_path)
+
+    error = document.read_error or document.frontmatter_error
+    if error:
+        print(f"Error reading {file_path}: {error}")
+        return None
+
+    if not document.has_frontmatter:
         return None
 
+    return document.frontmatter
+
 def validate_required_fields(frontmatter: Dict, file_path: Path) -> List[str]:
     """Validate that all required fields are present."""
     errors = []
@@ -218,24 +240,36 @@ def validate_content_consistency(frontmatter: Dict, file_path: Path) -> List[str
     
     return errors
 
-def validate_frontmatter(file_path: Path) -> List[str]:
+def validate_frontmatter(file_path: Path,
+                         document: Optional[Union[Document, FrontMatter]] = None) -> List[Finding]:
     """Validate YAML front-matter in a markdown file."""
     errors = []
     
     # Extract front-matter
-    frontmatter = extract_frontmatter(file_path)
+    frontmatter = extract_frontmatter(file_path, document)
     if frontmatter is None:
-        errors.append("Missing or invalid YAML front-matter")
+        errors.append(Finding('frontmatter-missing', "Missing or invalid YAML front-matter",
+                              FRONTMATTER_LINE))
         return errors
     
     # Run all validation checks
-    errors.extend(validate_required_fields(frontmatter, file_path))
-    errors.extend(validate_field_values(frontmatter, file_path))
-    errors.extend(validate_tag_taxonomy(frontmatter, file_path))
-    errors.extend(validate_content_consistency(frontmatter, file_path))
+    for rule, check in (('required-fields', validate_required_fields),
+                        ('field-values', validate_field_values),
+                        ('tag-taxonomy', validate_tag_taxonomy),
+                        ('content-consistency', validate_content_consistency)):
+        errors.extend(findings_with_rule(rule, check(frontmatter, file_path), FRONTMATTER_LINE))
     
     return errors
 
+def validate_document(document: FrontMatter) -> Tuple[List[Finding], bool]:
+    """Validate one file's front-matter (process-pool entry point).
+    
+    Returns the errors and whether they may be cached; unreadable files are
+    re-validated each run so their diagnostics are printed.
+    """
+    errors = validate_frontmatter(document.path, document)
+    return errors, not (document.read_error or document.frontmatter_error)
+
 def check_excluded_files(file_path: Path) -> bool:
     """Check if file should be excluded from validation."""
     excluded_patterns = [
@@ -248,59 +282,124 @@ def check_excluded_files(file_path: Path) -> bool:
     
     return any(pattern in str(file_path) for pattern in excluded_patterns)
 
-def main():
-    """Validate all markdown files in docs directory."""
+def add_arguments(parser: argparse.ArgumentParser, common: bool = True) -> None:
+    """Register this validator's command-line options.
+
+    With common=False only the options the other validators lack are added,
+    for a parser that already has the shared ones.
+    """
+    if common:
+        add_change_arguments(parser)
+        add_cache_arguments(parser)
+        add_jobs_arguments(parser)
+        add_profile_arguments(parser)
+        add_output_arguments(parser)
+        add_watch_arguments(parser)
+
+def main(args: Optional[argparse.Namespace] = None):
+    """Validate all markdown files in docs directory.
+
+    args is given when the validator runs inside systemcraft-validate.py;
+    otherwise the command line is parsed here.
+    """
+    if args is None:
+        parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+        add_arguments(parser)
+        args = parser.parse_args()
+        check_watch_arguments(parser, args)
+    
+    profiler = open_profiler(args, 'frontmatter')
+    profiler.instrument(sys.modules[__name__], [
+        'validate_required_fields', 'validate_field_values',
+        'validate_tag_taxonomy', 'validate_content_consistency'])
+    profiler.instrument(sys.modules[__name__], ['extract_frontmatter'], findings=False)
+    profiler.instrument(doc_corpus, ['parse_frontmatter'], findings=False)
+    profiler.instrument_files(sys.modules[__name__], 'validate_document')
+    
     docs_dir = Path('docs')
     if not docs_dir.exists():
         print("ERROR: docs directory not found")
         sys.exit(1)
     
-    all_errors = []
+    reporter = open_reporter(args, 'frontmatter', RULES)
+    total_errors = 0
     files_checked = 0
     files_with_errors = 0
     
-    print("🔍 Validating YAML front-matter in markdown files...")
-    print()
-    
-    for md_file in docs_dir.rglob('*.md'):
-        # Skip excluded files
-        if check_excluded_files(md_file):
-            continue
-            
+    reporter.progress("🔍 Validating YAML front-matter in markdown files...")
+    reporter.progress()
+    
+    watcher = DocsWatcher(docs_dir) if args.watch else None
+    results = {}
+    
+    profiler.stage('load')
+    # Front-matter and content rules only look at the file itself, so
+    # changed-files mode needs no reverse-dependency expansion here
+    changes = changes_from_args(args, docs_dir)
+    # Only the YAML headers are read; page bodies are never loaded
+    headers = load_frontmatter(docs_dir, changes.modified if changes else None)
+    cache = open_cache(args, 'frontmatter', ruleset_version(Path(__file__), Path(doc_corpus.__file__)))
+    
+    # Skip excluded files
+    documents = [header for header in headers if not check_excluded_files(header.path)]
+    cached = {document.path: cached_findings(cache.lookup(document.path, document.content_hash))
+              for document in documents}
+    pending = [document for document in documents if cached[document.path] is None]
+    validated = map_in_order(validate_document, pending, args.jobs)
+    
+    profiler.stage('validate')
+    for document in documents:
+        md_file = document.path
         files_checked += 1
-        errors = validate_frontmatter(md_file)
+        errors = cached[md_file]
+        if errors is None:
+            errors, cacheable = next(validated)
+            if cacheable:
+                cache.store(md_file, document.content_hash, errors)
         
         if errors:
             files_with_errors += 1
-            print(f"❌ {md_file}")
-            for error in errors:
-                print(f"   • {error}")
-            print()
-            all_errors.extend([f"{md_file}: {error}" for error in errors])
-        else:
-            print(f"✅ {md_file}")
+            total_errors += len(errors)
+        reporter.file_checked(md_file, errors)
+        if watcher:
+            results[md_file] = errors
+    
+    if changes is None:
+        cache.prune(header.path for header in headers)
+    cache.close()
+    finish_profile(profiler, args)
     
     # Summary
     print()
     print("=" * 60)
     print(f"📊 Validation Summary:")
     print(f"   Files checked: {files_checked}")
+    print(f"   Results reused from cache: {cache.hits}")
     print(f"   Files with errors: {files_with_errors}")
     print(f"   Files passing: {files_checked - files_with_errors}")
-    print(f"   Total errors: {len(all_errors)}")
-    
-    if all_errors:
-        print()
-        print("🎯 Next Steps:")
-        print("1. Add missing YAML front-matter to files without it")
-        print("2. Fix validation errors listed above")
-        print("3. Run validation again to verify fixes")
-        print("4. Refer to CONTENT_STANDARDS.md for detailed requirements")
+    print(f"   Total errors: {total_errors}")
+    reporter.close()
+    
+    if watcher:
+        def check_file(md_file: Path) -> List[Finding]:
+            return validate_document(read_frontmatter(md_file))[0]
+        watch(watcher, partial(revalidate_files, results=results, validate=check_file,
+                               excluded=check_excluded_files, reporter=reporter),
+              args.watch_interval)
+        return
+    
+    if total_errors:
+        reporter.progress()
+        reporter.progress("🎯 Next Steps:")
+        reporter.progress("1. Add missing YAML front-matter to files without it")
+        reporter.progress("2. Fix validation errors listed above")
+        reporter.progress("3. Run validation again to verify fixes")
+        reporter.progress("4. Refer to CONTENT_STANDARDS.md for detailed requirements")
         sys.exit(1)
     else:
-        print()
-        print("🎉 All front-matter validation passed!")
-        print("   All markdown files meet SystemCraft content standards")
+        reporter.progress()
+        reporter.progress("🎉 All front-matter validation passed!")
+        reporter.progress("   All markdown files meet SystemCraft content standards")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Resident SystemCraft validation server for editors (Language Server Protocol).
+
+Run it from the repository root. Editors start it on stdio; it can also
+listen on a local TCP port, serving one connection at a time:
+
+    python scripts/validation-server.py
+    python scripts/validation-server.py --tcp 2087
+
+docs/ is loaded once, and the front-matter, content and link validators
+run in this process against that in-memory model. Open documents are
+validated from the editor's buffer on every change, without saving. Their
+links resolve against the in-memory path and anchor indexes. Open pages
+that link to an edited page are re-checked when its headings change.
+
+Completions are offered for link targets inside ](...), for headings after
+a #, and for front-matter tags from the taxonomy in validate-frontmatter.py.
+
+Positions are exchanged in UTF-32 (code points) when the client offers it,
+otherwise in LSP's default UTF-16 code units.
+"""
+
+import argparse
+import json
+import os
+import re
+import socket
+import sys
+import traceback
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from doc_corpus import Document, load_corpus
+from findings import Finding
+from link_graph import AnchorIndex, PathIndex
+from validator_loader import load_validator
+
+# LSP DiagnosticSeverity for each rule severity
+SEVERITIES = {'error': 1, 'warning': 2, 'note': 3}
+
+# LSP CompletionItemKind values
+COMPLETION_VALUE = 12
+COMPLETION_FILE = 17
+COMPLETION_REFERENCE = 18
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+# Full-document sync: every didChange carries the whole buffer
+SYNC_FULL = 1
+
+# LSP position encodings: offsets in code points, or LSP's default UTF-16 units
+UTF32 = 'utf-32'
+UTF16 = 'utf-16'
+
+# Link target typed so far, up to the cursor
+LINK_PREFIX_PATTERN = re.compile(r'\]\(([^)\s]*)$')
+FRONTMATTER_KEY_PATTERN = re.compile(r'^([\w-]+):')
+LIST_ITEM_PATTERN = re.compile(r'^\s*-')
+
+
+def utf16_to_index(text: str, offset: int) -> int:
+    """Index into text of a UTF-16 code-unit offset."""
+    units = 0
+    for index, char in enumerate(text):
+        if units >= offset:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(text)
+
+
+def index_to_utf16(text: str, index: int) -> int:
+    """UTF-16 code-unit offset of an index into text."""
+    return index + sum(1 for char in text[:index] if ord(char) > 0xFFFF)
+
+
+def uri_to_path(uri: str) -> Path:
+    """File path for a file:// URI, relative to the working directory when inside it."""
+    path = os.path.abspath(url2pathname(urlparse(uri).path))
+    cwd = os.getcwd()
+    if path.startswith(cwd + os.sep):
+        return Path(os.path.relpath(path, cwd))
+    return Path(path)
+
+
+class MessageStream:
+    """JSON-RPC messages framed with LSP Content-Length headers."""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO):
+        self.reader = reader
+        self.writer = writer
+
+    def read(self) -> Optional[Dict]:
+        """The next message, or None once the client has gone away."""
+        length = None
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                if length is not None:
+                    break
+                continue
+            name, _, value = line.decode('ascii').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        body = self.reader.read(length)
+        if len(body) < length:
+            return None
+        return json.loads(body)
+
+    def write(self, message: Dict) -> None:
+        body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+        self.writer.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+        self.writer.flush()
+
+
+class ValidationServer:
+    """Keeps the docs model in memory and answers editor requests."""
+
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = docs_dir
+        self.frontmatter = load_validator('validate-frontmatter')
+        self.links = load_validator('check-links')
+        try:
+            self.content = load_validator('validate-content')
+            self.content_error = None
+        except ImportError as e:
+            self.content = None
+            self.content_error = str(e)
+        self.tags = {}
+        for category, tags in (('primary', self.frontmatter.PRIMARY_TAGS),
+                               ('skill', self.frontmatter.SKILL_TAGS),
+                               ('level', self.frontmatter.LEVEL_TAGS),
+                               ('format', self.frontmatter.FORMAT_TAGS)):
+            self.tags.update((tag, category) for tag in tags)
+
+        self.index: Optional[PathIndex] = None
+        self.anchors: Optional[AnchorIndex] = None
+        self.stream: Optional[MessageStream] = None
+        self.handlers: Dict[str, Callable[[Dict], object]] = {
+            'initialize': self.initialize,
+            'initialized': lambda params: None,
+            'shutdown': self.shutdown,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didSave': self.did_save,
+            'textDocument/didClose': self.did_close,
+            'textDocument/diagnostic': self.document_diagnostic,
+            'textDocument/completion': self.completion,
+            'workspace/didChangeWatchedFiles': self.did_change_watched_files,
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the state of a previous connection."""
+        self.documents: Dict[str, Document] = {}
+        self.versions: Dict[str, Optional[int]] = {}
+        self.dependencies: Dict[str, Dict[str, bool]] = {}
+        self.pull_diagnostics = False
+        self.position_encoding = UTF16
+        self.shutdown_requested = False
+        self.next_request_id = 0
+
+    # Protocol plumbing
+
+    def serve(self, stream: MessageStream) -> int:
+        """Answer messages until the client exits; returns the exit code."""
+        self.stream = stream
+        self.reset()
+        while True:
+            message = stream.read()
+            if message is None:
+                return 0 if self.shutdown_requested else 1
+            method = message.get('method')
+            if method is None:
+                # A response to one of our requests (diagnostic refresh)
+                continue
+            if method == 'exit':
+                return 0 if self.shutdown_requested else 1
+            self.dispatch(method, message)
+
+    def dispatch(self, method: str, message: Dict) -> None:
+        request_id = message.get('id')
+        handler = self.handlers.get(method)
+        if handler is None:
+            if request_id is not None:
+                self.respond_error(request_id, METHOD_NOT_FOUND, f"Unsupported method: {method}")
+            return
+        if self.index is None and method != 'initialize':
+            if request_id is not None:
+                self.respond_error(request_id, SERVER_NOT_INITIALIZED, "Server not initialized")
+            return
+        try:
+            result = handler(message.get('params') or {})
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            if request_id is not None:
+                self.respond_error(request_id, INTERNAL_ERROR, str(e))
+            return
+        if request_id is not None:
+            self.stream.write({'jsonrpc': '2.0', 'id': request_id, 'result': result})
+
+    def respond_error(self, request_id, code: int, message: str) -> None:
+        self.stream.write({'jsonrpc': '2.0', 'id': request_id,
+                           'error': {'code': code, 'message': message}})
+
+    def notify(self, method: str, params: Dict) -> None:
+        self.stream.write({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def log(self, text: str) -> None:
+        self.notify('window/logMessage', {'type': 3, 'message': text})
+
+    # Lifecycle
+
+    def initialize(self, params: Dict) -> Dict:
+        root_uri = params.get('rootUri')
+        if root_uri:
+            root = url2pathname(urlparse(root_uri).path)
+            if (Path(root) / self.docs_dir).is_dir():
+                os.chdir(root)
+        if self.index is None:
+            corpus = load_corpus(self.docs_dir)
+            self.index = PathIndex(self.docs_dir)
+            self.anchors = AnchorIndex(corpus)
+            print(f"📚 Loaded {len(corpus)} pages from {self.docs_dir}/", file=sys.stderr)
+        if self.content is None:
+            self.log(f"Content rules disabled: {self.content_error}")
+
+        capabilities = params.get('capabilities', {})
+        self.pull_diagnostics = 'diagnostic' in capabilities.get('textDocument', {})
+        encodings = capabilities.get('general', {}).get('positionEncodings', [])
+        self.position_encoding = UTF32 if UTF32 in encodings else UTF16
+        server_capabilities = {
+            'positionEncoding': self.position_encoding,
+            'textDocumentSync': {'openClose': True, 'change': SYNC_FULL,
+                                 'save': {'includeText': False}},
+            'completionProvider': {'triggerCharacters': ['(', '/', '#', '[', ' ', ',']},
+        }
+        if self.pull_diagnostics:
+            server_capabilities['diagnosticProvider'] = {'interFileDependencies': True,
+                                                         'workspaceDiagnostics': False}
+        return {'capabilities': server_capabilities,
+                'serverInfo': {'name': 'systemcraft-validation-server'}}
+
+    def shutdown(self, params: Dict) -> None:
+        self.shutdown_requested = True
+
+    # Document synchronisation
+
+    def did_open(self, params: Dict) -> None:
+        item = params['textDocument']
+        self.update_document(item['uri'], item['text'], item.get('version'))
+
+    def did_change(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        full_texts = [change['text'] for change in params['contentChanges'] if 'range' not in change]
+        if full_texts:
+            self.update_document(uri, full_texts[-1], params['textDocument'].get('version'))
+
+    def did_save(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        target = os.path.abspath(str(uri_to_path(uri)))
+        if target not in self.index.files:
+            self.index.add_file(target)
+            self.refresh_dependents(target)
+
+    def did_close(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        document = self.documents.pop(uri, None)
+        self.versions.pop(uri, None)
+        self.dependencies.pop(uri, None)
+        if document is None:
+            return
+        # Unsaved edits are discarded: other pages see the file on disk again
+        target = os.path.abspath(str(document.path))
+        self.anchors.discard(target)
+        if not self.pull_diagnostics:
+            self.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+        self.refresh_dependents(target)
+
+    def did_change_watched_files(self, params: Dict) -> None:
+        """Files created, changed or deleted outside the editor buffers."""
+        for change in params.get('changes', []):
+            path = uri_to_path(change['uri'])
+            if path.suffix != '.md':
+                continue
+            target = os.path.abspath(str(path))
+            if change['type'] == 3:
+                self.index.remove_file(target)
+            else:
+                self.index.add_file(target)
+            if change['uri'] not in self.documents:
+                self.anchors.discard(target)
+            self.refresh_dependents(target)
+
+    def update_document(self, uri: str, text: str, version: Optional[int]) -> None:
+        document = Document(uri_to_path(uri), text.replace('\r\n', '\n'))
+        self.documents[uri] = document
+        self.versions[uri] = version
+        self.anchors.update(document)
+        self.publish(uri)
+        self.refresh_dependents(os.path.abspath(str(document.path)), skip=uri)
+
+    def refresh_dependents(self, target: str, skip: Optional[str] = None) -> None:
+        """Re-check open documents with a link to (or into) the page at target."""
+        dependents = [uri for uri, dependencies in self.dependencies.items()
+                      if uri != skip and any(self.depends_on(dependency, target)
+                                             for dependency in dependencies)]
+        if not dependents:
+            return
+        if self.pull_diagnostics:
+            self.next_request_id += 1
+            self.stream.write({'jsonrpc': '2.0', 'id': f'refresh-{self.next_request_id}',
+                               'method': 'workspace/diagnostic/refresh'})
+            return
+        for uri in dependents:
+            self.publish(uri)
+
+    @staticmethod
+    def depends_on(dependency: str, target: str) -> bool:
+        linked = dependency.partition('#')[0]
+        return linked == target or os.path.join(linked, 'index.md') == target
+
+    # Diagnostics
+
+    def is_doc(self, path: Path) -> bool:
+        return (path.suffix == '.md'
+                and os.path.abspath(str(path)).startswith(self.index.root + os.sep))
+
+    def diagnostics(self, uri: str) -> List[Dict]:
+        """Findings of all three validators for one document, as LSP diagnostics."""
+        document = self.documents.get(uri)
+        if document is None:
+            document = Document.from_path(uri_to_path(uri))
+        path = document.path
+        if not self.is_doc(path):
+            return []
+
+        results = []
+        if not self.frontmatter.check_excluded_files(path):
+            results.append(('frontmatter', self.frontmatter.RULES,
+                            self.frontmatter.validate_frontmatter(path, document)))
+        if self.content is not None and not self.content.should_exclude_file(path):
+            results.append(('content', self.content.RULES,
+                            self.content.validate_content_file(path, document)))
+        dependencies = {}
+        results.append(('links', self.links.RULES,
+                        self.links.validate_internal_links(path, document, dependencies,
+                                                           self.index, self.anchors)))
+        if uri in self.documents:
+            self.dependencies[uri] = dependencies
+
+        return [self.diagnostic(validator, rules, finding)
+                for validator, rules, findings in results for finding in findings]
+
+    @staticmethod
+    def diagnostic(validator: str, rules: Dict, finding: Finding) -> Dict:
+        line = (finding.line or 1) - 1
+        severity = rules.get(finding.rule, ('error', ''))[0]
+        return {
+            'range': {'start': {'line': line, 'character': 0},
+                      'end': {'line': line + 1, 'character': 0}},
+            'severity': SEVERITIES[severity],
+            'code': finding.rule,
+            'source': f'systemcraft-{validator}',
+            'message': finding.message,
+        }
+
+    def publish(self, uri: str) -> None:
+        if self.pull_diagnostics:
+            return
+        params = {'uri': uri, 'diagnostics': self.diagnostics(uri)}
+        if self.versions.get(uri) is not None:
+            params['version'] = self.versions[uri]
+        self.notify('textDocument/publishDiagnostics', params)
+
+    def document_diagnostic(self, params: Dict) -> Dict:
+        return {'kind': 'full', 'items': self.diagnostics(params['textDocument']['uri'])}
+
+    # Completion
+
+    def completion(self, params: Dict) -> List[Dict]:
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return []
+        lines = document.text.split('\n')
+        line = params['position']['line']
+        if line >= len(lines):
+            return []
+        text = lines[line]
+        character = self.to_index(text, params['position']['character'])
+        match = LINK_PREFIX_PATTERN.search(text[:character])
+        if match:
+            return self.link_completions(document, match.group(1), line, text, character)
+        if self.in_tags(lines, line):
+            return self.tag_completions(document)
+        return []
+
+    def to_index(self, text: str, character: int) -> int:
+        """Index into a line of a client position's character offset."""
+        if self.position_encoding == UTF32:
+            return min(character, len(text))
+        return utf16_to_index(text, character)
+
+    def to_character(self, text: str, index: int) -> int:
+        """Client character offset of an index into a line."""
+        if self.position_encoding == UTF32:
+            return index
+        return index_to_utf16(text, index)
+
+    def link_completions(self, document: Document, typed: str,
+                         line: int, text: str, character: int) -> List[Dict]:
+        """Pages relative to the document, or headings of the page before '#'."""
+        edit_range = {'start': {'line': line,
+                                'character': self.to_character(text, character - len(typed))},
+                      'end': {'line': line, 'character': self.to_character(text, character)}}
+
+        def item(label: str, new_text: str, kind: int, detail: str) -> Dict:
+            return {'label': label, 'kind': kind, 'detail': detail, 'filterText': new_text,
+                    'textEdit': {'range': edit_range, 'newText': new_text}}
+
+        url, hash_mark, _ = typed.partition('#')
+        if hash_mark:
+            if url:
+                target, _ = self.index.resolve(document.path, url)
+                page = self.index.page_file(target)
+                if page is None:
+                    return []
+                anchors = self.anchors.document(page).anchors
+            else:
+                anchors = document.anchors
+            return [item(anchor, f'{url}#{anchor}', COMPLETION_REFERENCE, 'heading')
+                    for anchor in sorted(anchors)]
+
+        source_dir = os.path.dirname(os.path.abspath(str(document.path)))
+        own_page = os.path.abspath(str(document.path))
+        items = []
+        for page in self.index.pages():
+            page_path = os.path.join(self.index.root, page)
+            if page_path == own_page:
+                continue
+            relative = Path(os.path.relpath(page_path, source_dir)).as_posix()
+            items.append(item(relative, relative, COMPLETION_FILE, page))
+        return items
+
+    @staticmethod
+    def in_tags(lines: List[str], line: int) -> bool:
+        """Whether a line is the tags: entry (or one of its items) in the front-matter."""
+        if not lines or lines[0].rstrip() != '---' or line == 0:
+            return False
+        if any(lines[number].rstrip() == '---' for number in range(1, line + 1)):
+            return False
+        for number in range(line, 0, -1):
+            key = FRONTMATTER_KEY_PATTERN.match(lines[number])
+            if key:
+                return key.group(1) == 'tags'
+            if not LIST_ITEM_PATTERN.match(lines[number]) and number != line:
+                return False
+        return False
+
+    def tag_completions(self, document: Document) -> List[Dict]:
+        """Taxonomy tags not already on the page."""
+        frontmatter = document.frontmatter if isinstance(document.frontmatter, dict) else {}
+        present = frontmatter.get('tags')
+        present = set(present) if isinstance(present, list) else set()
+        return [{'label': tag, 'kind': COMPLETION_VALUE, 'detail': f'{category} tag'}
+                for tag, category in sorted(self.tags.items()) if tag not in present]
+
+
+def main():
+    """Serve validation results to an editor over stdio or a local socket."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tcp', type=int, metavar='PORT',
+                        help='Listen on 127.0.0.1:PORT instead of using stdio')
+    args = parser.parse_args()
+
+    server = ValidationServer(Path('docs'))
+    if args.tcp is None:
+        stream = MessageStream(sys.stdin.buffer, sys.stdout.buffer)
+        # stdout carries the protocol; anything the validators print goes to stderr
+        sys.stdout = sys.stderr
+        return server.serve(stream)
+
+    sys.stdout = sys.stderr
+    with socket.create_server(('127.0.0.1', args.tcp)) as listener:
+        print(f"👂 Listening on 127.0.0.1:{args.tcp} (Ctrl+C to stop)...")
+        try:
+            while True:
+                connection, address = listener.accept()
+                print(f"🔌 Client connected from {address[0]}:{address[1]}")
+                with connection, connection.makefile('rb') as reader, \
+                        connection.makefile('wb') as writer:
+                    server.serve(MessageStream(reader, writer))
+                print("👋 Client disconnected")
+        except KeyboardInterrupt:
+            print()
+            print("👋 Stopped listening")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
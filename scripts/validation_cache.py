@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Persistent result cache for incremental SystemCraft validation.
+
+Findings are stored in a small SQLite file keyed by validator name and file
+path, together with the file's content hash and the rule-set version of the
+validator that produced them. A file whose content, rule set and recorded
+dependencies are unchanged is skipped and its cached findings are replayed.
+
+Dependencies capture facts outside the file itself that a result relied on,
+such as whether a link target exists. An entry is invalidated as soon as any
+recorded dependency no longer holds, e.g. when a link target is added or
+removed.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from doc_corpus import content_hash
+
+DEFAULT_CACHE_FILE = Path('.cache') / 'validation.sqlite'
+
+# Bump when the table layout changes; older cache files are rebuilt
+SCHEMA_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    validator    TEXT NOT NULL,
+    path         TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    ruleset      TEXT NOT NULL,
+    findings     TEXT NOT NULL,
+    PRIMARY KEY (validator, path)
+);
+CREATE TABLE IF NOT EXISTS dependencies (
+    validator TEXT NOT NULL,
+    path      TEXT NOT NULL,
+    target    TEXT NOT NULL,
+    existed   INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dependencies_by_path ON dependencies (validator, path);
+CREATE INDEX IF NOT EXISTS dependencies_by_target ON dependencies (validator, target);
+'''
+
+
+def ruleset_version(*sources: Path) -> str:
+    """Derive a rule-set version from the source files implementing it.
+
+    Any edit to a validator or to the shared parsing code changes the version
+    and so invalidates every cached result produced by the old rules.
+    """
+    digest = ''.join(content_hash(Path(source).read_bytes()) for source in sources)
+    return content_hash(digest.encode('utf-8'))
+
+
+class ResultCache:
+    """SQLite-backed store of per-file validation findings."""
+
+    def __init__(self, cache_file: Path, validator: str, ruleset: str,
+                 exists: Callable[[str], bool] = os.path.exists):
+        self.validator = validator
+        self.ruleset = ruleset
+        self.exists = exists
+        self.hits = 0
+        self.misses = 0
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(cache_file))
+        (version,) = self.connection.execute('PRAGMA user_version').fetchone()
+        if version != SCHEMA_VERSION:
+            self.connection.executescript(
+                'DROP TABLE IF EXISTS results; DROP TABLE IF EXISTS dependencies;')
+            self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.connection.executescript(SCHEMA)
+
+        self.entries = {
+            path: (digest, ruleset_, findings)
+            for path, digest, ruleset_, findings in self.connection.execute(
+                'SELECT path, content_hash, ruleset, findings '
+                'FROM results WHERE validator = ?', (validator,))
+        }
+        self.dependencies: Dict[str, Dict[str, bool]] = {}
+        for path, target, existed in self.connection.execute(
+                'SELECT path, target, existed FROM dependencies WHERE validator = ?',
+                (validator,)):
+            self.dependencies.setdefault(path, {})[target] = bool(existed)
+
+    def lookup(self, path: Path, digest: str) -> Optional[List[str]]:
+        """Return cached findings for path, or None if they are stale."""
+        entry = self.entries.get(str(path))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        cached_digest, cached_ruleset, findings = entry
+        if cached_digest != digest or cached_ruleset != self.ruleset:
+            self.misses += 1
+            return None
+
+        for target, existed in self.dependencies.get(str(path), {}).items():
+            if self.exists(target) != existed:
+                self.misses += 1
+                return None
+
+        self.hits += 1
+        return json.loads(findings)
+
+    def store(self, path: Path, digest: str, findings: List[str],
+              dependencies: Optional[Dict[str, bool]] = None) -> None:
+        """Record findings for path along with the dependencies they relied on."""
+        key = str(path)
+        dependencies = dependencies or {}
+        self.connection.execute(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+            (self.validator, key, digest, self.ruleset, json.dumps(findings)))
+        self.connection.execute(
+            'DELETE FROM dependencies WHERE validator = ? AND path = ?', (self.validator, key))
+        self.connection.executemany(
+            'INSERT INTO dependencies VALUES (?, ?, ?, ?)',
+            [(self.validator, key, target, int(existed))
+             for target, existed in sorted(dependencies.items())])
+        self.entries[key] = (digest, self.ruleset, json.dumps(findings))
+        self.dependencies[key] = dict(dependencies)
+
+    def latest(self, path: Path) -> Optional[Tuple[str, List[str]]]:
+        """Content hash and findings last stored for path by the current rule set.
+
+        The file itself is not checked; callers use this for files they know
+        to be unchanged (e.g. outside a changed-files run).
+        """
+        entry = self.entries.get(str(path))
+        if entry is None or entry[1] != self.ruleset:
+            return None
+        return entry[0], json.loads(entry[2])
+
+    def covers(self, paths: Iterable[Path]) -> bool:
+        """Whether every path has a cached entry (of any age)."""
+        return all(str(path) in self.entries for path in paths)
+
+    def dependents(self, targets: Iterable[str]) -> Set[str]:
+        """Paths whose cached results depended on any of the given targets."""
+        found = set()
+        for target in set(targets):
+            found.update(path for (path,) in self.connection.execute(
+                'SELECT path FROM dependencies WHERE validator = ? AND target = ?',
+                (self.validator, target)))
+        return found
+
+    def recorded_dependencies(self, path: Path) -> Dict[str, bool]:
+        """Dependencies recorded the last time path was validated."""
+        return dict(self.dependencies.get(str(path), {}))
+
+    def prune(self, live_paths: Iterable[Path]) -> None:
+        """Drop entries for files that no longer exist in the corpus."""
+        live = {str(path) for path in live_paths}
+        stale = [(self.validator, path) for path in self.entries if path not in live]
+        self.connection.executemany(
+            'DELETE FROM results WHERE validator = ? AND path = ?', stale)
+        self.connection.executemany(
+            'DELETE FROM dependencies WHERE validator = ? AND path = ?', stale)
+        for _, path in stale:
+            del self.entries[path]
+            self.dependencies.pop(path, None)
+
+    def discard(self, paths: Iterable[Path]) -> None:
+        """Drop entries for files known to be deleted (e.g. in a changed-files run)."""
+        stale = [(self.validator, str(path)) for path in paths]
+        self.connection.executemany(
+            'DELETE FROM results WHERE validator = ? AND path = ?', stale)
+        self.connection.executemany(
+            'DELETE FROM dependencies WHERE validator = ? AND path = ?', stale)
+        for _, path in stale:
+            self.entries.pop(path, None)
+            self.dependencies.pop(path, None)
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+
+class NullCache:
+    """Drop-in replacement used when caching is disabled."""
+
+    hits = 0
+    misses = 0
+
+    def lookup(self, path: Path, digest: str) -> Optional[List[str]]:
+        return None
+
+    def store(self, path: Path, digest: str, findings: List[str],
+              dependencies: Optional[Dict[str, bool]] = None) -> None:
+        pass
+
+    def latest(self, path: Path) -> Optional[Tuple[str, List[str]]]:
+        return None
+
+    def covers(self, paths: Iterable[Path]) -> bool:
+        return False
+
+    def dependents(self, targets: Iterable[str]) -> Set[str]:
+        return set()
+
+    def recorded_dependencies(self, path: Path) -> Dict[str, bool]:
+        return {}
+
+    def prune(self, live_paths: Iterable[Path]) -> None:
+        pass
+
+    def discard(self, paths: Iterable[Path]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the shared cache command-line options."""
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-validate every file instead of replaying cached results')
+    parser.add_argument('--cache-file', type=Path, default=DEFAULT_CACHE_FILE,
+                        help=f'Result cache location (default: {DEFAULT_CACHE_FILE})')
+
+
+def open_cache(args: argparse.Namespace, validator: str, ruleset: str,
+               exists: Callable[[str], bool] = os.path.exists):
+    """Open the result cache selected on the command line."""
+    if args.no_cache:
+        return NullCache()
+    try:
+        return ResultCache(args.cache_file, validator, ruleset, exists)
+    except sqlite3.Error as e:
+        print(f"⚠️  Result cache unavailable ({e}), validating without it")
+        return NullCache()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Import the hyphen-named SystemCraft validator scripts as modules.
+
+The validators are command-line scripts (validate-frontmatter.py, ...), so
+tools that drive them in-process load them by file name. Each script is
+executed once and registered in sys.modules under its underscore name.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def load_validator(name: str) -> ModuleType:
+    """Import scripts/<name>.py, e.g. load_validator('check-links')."""
+    module_name = name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the SystemCraft validation scripts.
+
+After a full run, a validator started with --watch keeps its parsed state in
+memory and polls docs/ and the MkDocs configs for changes. Each batch of changes is
+handed back to the validator as a ChangeSet, so it can re-check only the
+files (and cross-file rules) the change affects.
+
+Polling compares (mtime, size) for every markdown file, which costs well
+under a millisecond per hundred files and needs no platform-specific
+file-notification support.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from changed_files import NAV_CONFIGS, ChangeSet
+
+DEFAULT_INTERVAL = 0.05
+
+
+class DocsWatcher:
+    """Detects added, modified and removed pages by polling file stats."""
+
+    def __init__(self, docs_dir: Path, configs: Sequence[Path] = NAV_CONFIGS):
+        self.docs_dir = docs_dir
+        self.configs = tuple(configs)
+        self.snapshot = self.scan()
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime, size) of every markdown file under docs/ and of each config."""
+        stats = {}
+        pending = [str(self.docs_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith('.md'):
+                            stat = entry.stat()
+                            stats[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                # A directory removed while scanning; its files count as removed
+                continue
+        for config in self.configs:
+            try:
+                stat = config.stat()
+                stats[config] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        return stats
+
+    def changes(self) -> Optional[ChangeSet]:
+        """Changes since the previous call, or None if nothing changed."""
+        current = self.scan()
+        if current == self.snapshot:
+            return None
+        previous, self.snapshot = self.snapshot, current
+        config_changed = any(current.get(config) != previous.get(config) for config in self.configs)
+        modified = sorted(path for path, stat in current.items()
+                          if path not in self.configs and previous.get(path) != stat)
+        removed = sorted(path for path in previous if path not in self.configs and path not in current)
+        added = any(path not in previous for path in modified)
+        return ChangeSet(modified, removed, config_changed or added or bool(removed))
+
+
+def add_watch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the shared watch-mode command-line options."""
+    parser.add_argument('--watch', action='store_true',
+                        help='After the first run, re-check files as they change under docs/ '
+                             'or in the MkDocs configs (text output, full-tree runs only)')
+    parser.add_argument('--watch-interval', type=float, default=DEFAULT_INTERVAL, metavar='SECONDS',
+                        help=f'How often to poll for changes in watch mode (default: {DEFAULT_INTERVAL})')
+
+
+def check_watch_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject option combinations that watch mode cannot honour."""
+    if not args.watch:
+        return
+    if args.files or args.diff:
+        parser.error('--watch re-checks the whole tree; it cannot be combined with files or --diff')
+    if args.format != 'text':
+        parser.error('--watch only supports --format text')
+
+
+def print_totals(results: Dict[Path, List]) -> None:
+    """One-line summary of the findings currently held for every file."""
+    failing = sum(1 for findings in results.values() if findings)
+    issues = sum(len(findings) for findings in results.values())
+    print(f"📊 {issues} issue(s) in {failing} of {len(results)} files")
+
+
+def revalidate_files(changes: ChangeSet, results: Dict[Path, List],
+                     validate: Callable[[Path], List], excluded: Callable[[Path], bool],
+                     reporter) -> None:
+    """Re-check changed files for validators whose rules only look at one file."""
+    for md_file in changes.removed:
+        if results.pop(md_file, None) is not None:
+            reporter.progress(f"🗑️  {md_file} removed")
+    for md_file in changes.modified:
+        if not excluded(md_file):
+            results[md_file] = validate(md_file)
+            reporter.file_checked(md_file, results[md_file])
+    print_totals(results)
+
+
+def watch(watcher: DocsWatcher, revalidate: Callable[[ChangeSet], None],
+          interval: float = DEFAULT_INTERVAL) -> None:
+    """Poll for changes and pass each batch to revalidate until interrupted.
+
+    The watcher should be created before the first run, so that edits made
+    while it was running are picked up by the first poll.
+    """
+    print()
+    configs = ', '.join(str(config) for config in watcher.configs if config.exists())
+    print(f"👀 Watching {watcher.docs_dir}/ and {configs} for changes (Ctrl+C to stop)...")
+    sys.stdout.flush()
+    try:
+        while True:
+            time.sleep(interval)
+            changes = watcher.changes()
+            if changes is None:
+                continue
+            start = time.perf_counter()
+            print()
+            revalidate(changes)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"⏱️  Re-checked in {elapsed:.0f} ms")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        print()
+        print("👋 Stopped watching")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Process-pool fan-out for the SystemCraft validation scripts.
+
+Per-file validation is independent, so it can be spread across CPU cores.
+Work is handed to the pool in chunks and results are yielded back in input
+order, with anything a worker printed replayed just before its result, so a
+parallel run produces exactly the same report as a serial one.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+from functools import partial
+from typing import Callable, Iterator, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Chunks handed to each worker over the whole run; more chunks balance
+# uneven file sizes better, fewer keep IPC overhead down
+CHUNKS_PER_WORKER = 4
+
+
+def add_jobs_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the shared parallelism command-line option."""
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='Validate files in N worker processes (0 = one per CPU, default: 1)')
+
+
+def worker_count(jobs: int) -> int:
+    """Number of processes to use for a --jobs value."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _run_captured(func: Callable[[T], R], item: T) -> Tuple[str, R]:
+    """Run func in a worker, capturing its console output for ordered replay."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(item)
+    return output.getvalue(), result
+
+
+def map_in_order(func: Callable[[T], R], items: Sequence[T], jobs: int,
+                 initializer: Optional[Callable] = None,
+                 initargs: Tuple = ()) -> Iterator[R]:
+    """Yield func(item) for each item, in order, using up to jobs processes.
+
+    With a single job (or a single item) everything runs lazily in this
+    process and initializer is not called. Otherwise func must be a
+    module-level function; initializer runs once in each worker to set up
+    any state func needs.
+    """
+    workers = min(worker_count(jobs), len(items))
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    # Imported here: serial runs, the common case, never need the pool machinery
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(items) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs) as pool:
+        for output, result in pool.map(partial(_run_captured, func), items,
+                                       chunksize=chunksize):
+            if output:
+                print(output, end='')
+            yield result
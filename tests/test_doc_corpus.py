@@ -0,0 +1,51 @@
+"""Tests for the heading slugs in scripts/doc_corpus.py."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from doc_corpus import Document, heading_plain_text, slugify  # noqa: E402
+
+try:
+    from pymdownx.slugs import slugify as configured_slugify
+except ImportError:  # only the fixed expectations are checked without it
+    configured_slugify = None
+
+HEADINGS = {
+    'Timeline Comparison Matrix': 'timeline-comparison-matrix',
+    '🎯 Timeline Comparison Matrix': '-timeline-comparison-matrix',
+    '  Customer Obsession Questions  ': 'customer-obsession-questions',
+    '📋 Customer Obsession Questions': '-customer-obsession-questions',
+    'Template Polish & Practice': 'template-polish--practice',
+    '🛠️ Template Polish & Practice': '-template-polish--practice',
+    'L6 vs L7: <code>Scope</code>': 'l6-vs-l7-scope',
+    'Café &amp; Tea': 'café--tea',
+}
+
+
+class SlugifyTest(unittest.TestCase):
+
+    def test_headings(self):
+        for heading, slug in HEADINGS.items():
+            with self.subTest(heading=heading):
+                self.assertEqual(slugify(heading), slug)
+
+    @unittest.skipIf(configured_slugify is None, 'pymdownx is not installed')
+    def test_matches_configured_slugify(self):
+        # mkdocs.yml configures the toc with pymdownx.slugs.slugify(case='lower')
+        uslugify = configured_slugify(case='lower')
+        for heading in HEADINGS:
+            with self.subTest(heading=heading):
+                text = heading_plain_text(heading.replace('&amp;', '&'))
+                self.assertEqual(slugify(text), uslugify(text, '-'))
+
+    def test_emoji_heading_anchor(self):
+        document = Document(Path('docs/example.md'), '# 🎯 Timeline Comparison Matrix\n')
+        self.assertIn('-timeline-comparison-matrix', document.anchors)
+        self.assertNotIn('timeline-comparison-matrix', document.anchors)
+
+
+if __name__ == '__main__':
+    unittest.main()
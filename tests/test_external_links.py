@@ -0,0 +1,110 @@
+"""Tests for check-links.py --external against a local stand-in HTTP server."""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from doc_corpus import Corpus, Document  # noqa: E402
+from external_links import check_external_links  # noqa: E402
+from validator_loader import load_validator  # noqa: E402
+
+links = load_validator('check-links')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """/ok answers everything, /no-head rejects HEAD, anything else is missing."""
+
+    def answer(self, status: int) -> None:
+        self.server.requests[(self.command, self.path)] += 1
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.answer({'/ok': 200, '/no-head': 405}.get(self.path, 404))
+
+    def do_GET(self):
+        self.answer(200 if self.path in ('/ok', '/no-head') else 404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ExternalLinksTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        self.server.requests = Counter()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.work = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self.work.name) / 'validation.sqlite'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.work.cleanup()
+
+    def args(self) -> argparse.Namespace:
+        return argparse.Namespace(no_cache=False, cache_file=self.cache_file, external_ttl=1.0,
+                                  external_timeout=5.0, external_concurrency=4,
+                                  external_per_host=2)
+
+    def corpus(self) -> Corpus:
+        pages = {
+            Path('docs/a.md'): f'[ok]({self.base}/ok) [get]({self.base}/no-head)\n',
+            Path('docs/b.md'): f'[ok again]({self.base}/ok#part) [gone]({self.base}/missing)\n',
+        }
+        return Corpus(Path('docs'), {path: Document(path, text) for path, text in pages.items()})
+
+    def test_probes_each_url_once_and_reuses_cached_answers(self):
+        occurrences = links.external_link_occurrences(self.corpus())
+        # Both pages link to /ok; the #fragment is not part of the probed URL
+        self.assertEqual(len(occurrences[f'{self.base}/ok']), 2)
+
+        results, hits = check_external_links(occurrences, self.args())
+        self.assertEqual(hits, 0)
+        self.assertTrue(results[f'{self.base}/ok'].ok)
+        self.assertEqual(self.server.requests[('HEAD', '/ok')], 1)
+        # HEAD rejected, GET accepted
+        self.assertTrue(results[f'{self.base}/no-head'].ok)
+        self.assertEqual(self.server.requests[('GET', '/no-head')], 1)
+        self.assertFalse(results[f'{self.base}/missing'].ok)
+        self.assertEqual(results[f'{self.base}/missing'].status, 404)
+
+        # Within the TTL only the failure is probed again
+        self.server.requests.clear()
+        results, hits = check_external_links(occurrences, self.args())
+        self.assertEqual(hits, 2)
+        self.assertEqual(set(path for _, path in self.server.requests), {'/missing'})
+        self.assertFalse(results[f'{self.base}/missing'].ok)
+
+    def test_external_only_exit_status(self):
+        root = Path(self.work.name)
+        (root / 'docs').mkdir()
+        (root / 'docs' / 'index.md').write_text(
+            f'# Home\n\n[broken internal](nowhere.md) [ok]({self.base}/ok)\n', encoding='utf-8')
+        command = [sys.executable, str(SCRIPTS_DIR / 'check-links.py'), '--external-only',
+                   '--cache-file', str(self.cache_file)]
+        # The broken internal link does not count
+        passed = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        self.assertEqual(passed.returncode, 0, passed.stdout + passed.stderr)
+
+        (root / 'docs' / 'index.md').write_text(
+            f'# Home\n\n[gone]({self.base}/missing)\n', encoding='utf-8')
+        failed = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        self.assertEqual(failed.returncode, 1, failed.stdout + failed.stderr)
+        self.assertIn(f'{self.base}/missing', failed.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for position handling in scripts/validation-server.py."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from validator_loader import load_validator  # noqa: E402
+
+server_module = load_validator('validation-server')
+
+
+class RecordingStream:
+    """Stands in for the editor connection."""
+
+    def __init__(self):
+        self.messages = []
+
+    def write(self, message):
+        self.messages.append(message)
+
+
+class CompletionPositionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.root = tempfile.TemporaryDirectory()
+        docs = Path(self.root.name) / 'docs'
+        docs.mkdir()
+        (docs / 'guide.md').write_text('# Guide\n\n## First Steps\n', encoding='utf-8')
+        (docs / 'index.md').write_text('# Home\n', encoding='utf-8')
+        self.page = docs / 'index.md'
+        self.uri = self.page.resolve().as_uri()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.root.cleanup()
+
+    def start(self, encodings=None):
+        server = server_module.ValidationServer(Path('docs'))
+        server.stream = RecordingStream()
+        capabilities = {'general': {'positionEncodings': encodings}} if encodings else {}
+        result = server.initialize({'rootUri': Path(self.root.name).resolve().as_uri(),
+                                    'capabilities': capabilities})
+        return server, result
+
+    def complete(self, server, text, character):
+        server.did_open({'textDocument': {'uri': self.uri, 'text': text, 'version': 1}})
+        return server.completion({'textDocument': {'uri': self.uri},
+                                  'position': {'line': 0, 'character': character}})
+
+    def test_utf16_offsets_after_astral_character(self):
+        server, result = self.start()
+        self.assertEqual(result['capabilities']['positionEncoding'], 'utf-16')
+        text = '🎯 See [guide](gu'
+        # The emoji is two UTF-16 code units but one Python character
+        items = self.complete(server, text, len(text) + 1)
+        self.assertEqual([item['label'] for item in items], ['guide.md'])
+        edit_range = items[0]['textEdit']['range']
+        self.assertEqual(edit_range['start']['character'], len(text) + 1 - len('gu'))
+        self.assertEqual(edit_range['end']['character'], len(text) + 1)
+
+    def test_heading_completion_after_astral_character(self):
+        server, _ = self.start()
+        text = '🎯 [steps](guide.md#'
+        items = self.complete(server, text, len(text) + 1)
+        self.assertIn('guide.md#first-steps', [item['textEdit']['newText'] for item in items])
+
+    def test_utf32_when_offered(self):
+        server, result = self.start(['utf-32', 'utf-16'])
+        self.assertEqual(result['capabilities']['positionEncoding'], 'utf-32')
+        text = '🎯 See [guide](gu'
+        items = self.complete(server, text, len(text))
+        self.assertEqual([item['label'] for item in items], ['guide.md'])
+        self.assertEqual(items[0]['textEdit']['range']['end']['character'], len(text))
+
+    def test_offset_conversions(self):
+        text = 'a🎯b'
+        self.assertEqual(server_module.utf16_to_index(text, 3), 2)
+        self.assertEqual(server_module.index_to_utf16(text, 2), 3)
+        self.assertEqual(server_module.utf16_to_index(text, 10), len(text))
+
+
+if __name__ == '__main__':
+    unittest.main()